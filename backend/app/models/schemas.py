@@ -4,7 +4,7 @@ Based on the Decision Journal schema from PROJECT_STANDARDS_v2.md.
 """
 
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import date
 from typing import Optional
 
@@ -118,6 +118,9 @@ class JuryVote(BaseModel):
 
 
 class JuryResult(BaseModel):
+    # Immutable so the constant no-jury results can be shared between pipeline runs
+    model_config = ConfigDict(frozen=True)
+
     spawned: bool
     reason: Optional[str] = None
     votes: list[JuryVote] = Field(default_factory=list)
@@ -32,7 +32,7 @@ async def run_pipeline(request: PipelineRunRequest):
 
     pipeline = DecisionPipeline(use_mock=False)
     price = request.price or 0.0
-    return pipeline.run(request.ticker, price, request.fundamentals)
+    return await pipeline.run_async(request.ticker, price, request.fundamentals)
 
 
 @router.post("/run-stream")
@@ -65,7 +65,7 @@ async def run_pipeline_batch(request: PipelineBatchRequest):
         {"ticker": t.ticker, "price": t.price or 0.0, "fundamentals": t.fundamentals}
         for t in request.tickers
     ]
-    return pipeline.run_batch(tickers_data)
+    return await pipeline.run_batch_async(tickers_data)
 
 
 @router.get("/runs")
@@ -0,0 +1,207 @@
+"""Unit tests for the bias monitor.
+
+All tests use synthetic decision journal entries. No database, no API calls.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from src.monitoring.bias.bias_monitor import BiasMonitor
+
+
+def _entry(
+    ticker: str = "AAPL",
+    action: str = "BUY",
+    verdict: str = "APPROVE",
+    sector: str = "Tech",
+    composite: float = 0.7,
+    std_dev: float = 0.1,
+    size: float = 0.02,
+    jury_spawned: bool = False,
+    jury_escalated: bool = False,
+    outcome: str = "agreement",
+) -> dict:
+    return {
+        "ticker": ticker,
+        "timestamp": "2026-02-21T14:30:00Z",
+        "sector": sector,
+        "final_decision": {"action": action, "recommended_position_size": size},
+        "quant_scores": {"composite": composite, "std_dev": std_dev},
+        "wasden_verdict": {"verdict": verdict, "confidence": 0.8},
+        "jury": {"spawned": jury_spawned, "escalated_to_human": jury_escalated},
+        "debate_result": {"outcome": outcome},
+    }
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+def test_empty_monitor_report():
+    """An empty monitor reports zeroed metrics and no alerts."""
+    report = BiasMonitor().generate_bias_report()
+
+    assert report["total_decisions"] == 0
+    assert report["veto_rate"]["total"] == 0
+    assert report["position_size_distribution"]["count"] == 0
+    assert report["alerts"] == []
+
+
+def test_veto_rate_and_action_distribution():
+    monitor = BiasMonitor()
+    for verdict, action in [("VETO", "BLOCKED"), ("APPROVE", "BUY"), ("APPROVE", "BUY"), ("NEUTRAL", "HOLD")]:
+        monitor.add_decision(_entry(verdict=verdict, action=action))
+
+    veto = monitor.veto_rate()
+    assert veto["veto"] == 0.25
+    assert veto["approve"] == 0.5
+    assert veto["counts"] == {"VETO": 1, "APPROVE": 2, "NEUTRAL": 1}
+
+    actions = monitor.action_distribution()
+    assert actions["counts"] == {"BLOCKED": 1, "BUY": 2, "HOLD": 1}
+    assert actions["distribution"]["BUY"] == 0.5
+
+
+def test_position_size_distribution():
+    monitor = BiasMonitor()
+    for size in [0.01, 0.04, 0.02, 0.03]:
+        monitor.add_decision(_entry(size=size))
+    monitor.add_decision(_entry(action="HOLD", size=0.5))  # ignored: not BUY/SELL
+
+    dist = monitor.position_size_distribution()
+    assert dist["count"] == 4
+    assert dist["median"] == 0.025
+    assert dist["min"] == 0.01
+    assert dist["max"] == 0.04
+    assert dist["mean"] == 0.025
+
+
+def test_model_agreement_trend_increasing():
+    monitor = BiasMonitor()
+    for std_dev in [0.1, 0.1, 0.6, 0.6]:
+        monitor.add_decision(_entry(std_dev=std_dev))
+
+    trend = monitor.model_agreement_trend()
+    assert trend["trend"] == "increasing"
+    assert trend["high_disagreement_count"] == 2
+    assert trend["mean_std_dev"] == 0.35
+
+
+def test_metrics_refresh_after_new_decision():
+    """Memoized metrics are recomputed once more decisions arrive."""
+    monitor = BiasMonitor()
+    monitor.add_decision(_entry(verdict="APPROVE"))
+    assert monitor.veto_rate()["veto"] == 0.0
+
+    monitor.add_decision(_entry(verdict="VETO"))
+    assert monitor.veto_rate()["veto"] == 0.5
+    assert monitor.veto_rate()["total"] == 2
+
+
+# ---------------------------------------------------------------------------
+# Alerts and trade results
+# ---------------------------------------------------------------------------
+
+def test_sector_concentration_alert():
+    monitor = BiasMonitor()
+    for i in range(5):
+        monitor.add_decision(_entry(sector="Energy", verdict="VETO" if i == 0 else "APPROVE"))
+
+    alerts = monitor.check_alerts()
+    assert any("Sector 'Energy'" in a for a in alerts)
+
+
+def test_mark_trade_result_updates_most_recent_unresolved():
+    monitor = BiasMonitor()
+    monitor.add_decision(_entry(ticker="MSFT", action="BUY"))
+    monitor.add_decision(_entry(ticker="MSFT", action="SELL"))
+    monitor.add_decision(_entry(ticker="MSFT", action="HOLD"))
+
+    monitor.mark_trade_result("MSFT", "run-1", is_win=True)
+    monitor.mark_trade_result("MSFT", "run-2", is_win=False)
+
+    assert [d.is_win for d in monitor.decisions] == [False, True, None]
+
+
+def test_win_rate_alert():
+    monitor = BiasMonitor()
+    for i in range(10):
+        monitor.add_decision(_entry(ticker=f"T{i}", verdict="VETO" if i % 4 == 0 else "APPROVE"))
+        monitor.mark_trade_result(f"T{i}", "", is_win=i < 3)
+
+    alerts = monitor.check_alerts()
+    assert any("win rate 30.0%" in a for a in alerts)
+
+
+def test_add_decisions_matches_add_decision():
+    """Batch ingestion produces the same report as one-at-a-time ingestion."""
+    entries = [
+        _entry(
+            ticker=f"T{i % 7}",
+            action=["BUY", "SELL", "HOLD", "BLOCKED"][i % 4],
+            verdict=["APPROVE", "VETO", "NEUTRAL"][i % 3],
+            sector=["Tech", "Energy", ""][i % 3],
+            composite=(i % 10) / 10,
+            std_dev=(i % 8) / 10,
+            size=(i % 5) / 100,
+            jury_spawned=i % 3 == 0,
+            jury_escalated=i % 2 == 0,
+        )
+        for i in range(300)
+    ]
+    single, batch = BiasMonitor(), BiasMonitor()
+    for e in entries:
+        single.add_decision(e)
+    batch.add_decisions(entries[:100])
+    batch.add_decisions(entries[100:])
+
+    expected = single.generate_bias_report()
+    actual = batch.generate_bias_report()
+    expected.pop("generated_at")
+    actual.pop("generated_at")
+    assert actual == expected
+    assert batch.decisions == single.decisions
+
+    single.mark_trade_result("T1", "", is_win=True)
+    batch.mark_trade_result("T1", "", is_win=True)
+    assert batch.decisions == single.decisions
+
+
+def test_retention_evicts_old_decisions():
+    """With a retention window, metrics cover only the retained decisions."""
+    monitor = BiasMonitor(retention=timedelta(days=7))
+    for day in range(1, 31):
+        entry = _entry(ticker=f"T{day}", verdict="VETO" if day <= 20 else "APPROVE", size=day / 1000)
+        entry["timestamp"] = f"2026-01-{day:02d}T12:00:00Z"
+        monitor.add_decision(entry)
+
+    # Days 23..30 are within 7 days of the newest decision
+    assert [d.ticker for d in monitor.decisions] == [f"T{day}" for day in range(23, 31)]
+    report = monitor.generate_bias_report()
+    assert report["total_decisions"] == 8
+    assert report["veto_rate"]["veto"] == 0.0
+    assert report["position_size_distribution"]["min"] == 0.023
+    assert report["position_size_distribution"]["mean"] == pytest.approx(0.0265)
+
+    # Evicted trades can no longer be marked
+    monitor.mark_trade_result("T1", "", is_win=True)
+    assert all(d.is_win is None for d in monitor.decisions)
+
+
+def test_retention_evicts_trade_results_from_win_rate():
+    """Results of evicted decisions no longer count toward the win-rate alert."""
+    monitor = BiasMonitor(retention=timedelta(hours=1))
+    for i in range(12):
+        entry = _entry(ticker=f"L{i}", action="BUY")
+        entry["timestamp"] = "2026-01-01T12:00:00Z"
+        monitor.add_decision(entry)
+        monitor.mark_trade_result(f"L{i}", "", is_win=False)
+    assert any("win rate" in alert for alert in monitor.check_alerts())
+
+    later = _entry(ticker="H", action="HOLD")
+    later["timestamp"] = "2026-03-01T12:00:00Z"
+    monitor.add_decision(later)
+
+    assert monitor.generate_bias_report()["total_decisions"] == 1
+    assert not any("win rate" in alert for alert in monitor.check_alerts())
@@ -0,0 +1,316 @@
+"""Tests for the bull/bear debate engine using a fake LLM client. No API calls."""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from backend.app.models.schemas import DebateOutcome
+from src.intelligence.wasden_watch.config import WasdenWatchSettings
+from src.intelligence.wasden_watch.exceptions import LLMError
+from src.pipeline.debate.debate_engine import DebateContext, DebateEngine
+from src.pipeline.debate import debate_llm_client
+from src.pipeline.debate.debate_llm_client import DebateLLMClient
+from src.pipeline.decision_pipeline import DecisionPipeline
+from src.pipeline.state import TradingState
+from src.pipeline.debate.prompts import AGREEMENT_SYSTEM_PROMPT, JUDGE_MAX_TOKENS, REBUTTAL_MAX_TOKENS
+
+_CALL_SECONDS = 0.05
+
+
+@pytest.fixture(autouse=True)
+def _clear_judge_cache():
+    # The judge cache is process-wide; keep each test's call counts independent
+    debate_llm_client._judge_cache.clear()
+    yield
+    debate_llm_client._judge_cache.clear()
+
+
+def _settings() -> WasdenWatchSettings:
+    return WasdenWatchSettings(_env_file=None, claude_api_key_1="claude", gemini_api_key_1="gemini")
+
+
+def _context(ticker: str = "NVDA") -> DebateContext:
+    return DebateContext(
+        ticker=ticker,
+        price=189.82,
+        quant_scores={"composite": 0.72, "xgboost": 0.8},
+        wasden_verdict="APPROVE",
+        wasden_confidence=0.8,
+        wasden_reasoning="Strong moat.",
+    )
+
+
+class _FakeClient(DebateLLMClient):
+    """Answers every provider call after a short sleep, recording overlap."""
+
+    def __init__(self, settings: WasdenWatchSettings):
+        super().__init__(settings)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    def _sleep(self) -> None:
+        with self._lock:
+            self._in_flight += 1
+            self.calls += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        time.sleep(_CALL_SECONDS)
+        with self._lock:
+            self._in_flight -= 1
+
+    def _call_claude(self, system_prompt: str, user_prompt: str, max_tokens: int = 0) -> str:
+        self._sleep()
+        if system_prompt.startswith(AGREEMENT_SYSTEM_PROMPT):
+            verdict = '{"outcome": "agreement", "agreed_action": "buy"}'
+            if system_prompt == AGREEMENT_SYSTEM_PROMPT:
+                return verdict
+            # Batched judge request: one verdict per case, echoing its number (reversed order)
+            n = user_prompt.count("### Case")
+            return json.dumps(
+                [{"case": case, "outcome": "agreement", "agreed_action": "buy"} for case in range(n, 0, -1)]
+            )
+        return "bull case"
+
+    def _call_gemini(self, system_prompt: str, user_prompt: str, max_tokens: int = 0) -> str:
+        self._sleep()
+        return "bear case"
+
+    def _stream_claude(self, system_prompt: str, user_prompt: str, max_tokens: int):
+        yield self._call_claude(system_prompt, user_prompt)
+
+    def _stream_gemini(self, system_prompt: str, user_prompt: str, max_tokens: int):
+        yield self._call_gemini(system_prompt, user_prompt)
+
+
+def _engine() -> tuple[DebateEngine, _FakeClient]:
+    engine = DebateEngine(_settings())
+    client = _FakeClient(_settings())
+    engine._client = engine._bull._client = engine._bear._client = engine._agreement._client = client
+    return engine, client
+
+
+def test_run_debate_overlaps_bull_and_bear_calls():
+    engine, client = _engine()
+
+    transcript = engine.run_debate(_context(), "run-1")
+
+    assert [r.round_number for r in transcript.rounds] == [1, 2, 3]
+    assert transcript.outcome == DebateOutcome.AGREEMENT
+    assert transcript.rounds[-1].bull_argument == "bull case"
+    assert transcript.rounds[-1].bear_argument == "bear case"
+    assert client.max_in_flight == 2
+
+
+def test_run_debate_async_matches_sync_transcript():
+    engine, client = _engine()
+
+    transcript = asyncio.run(engine.run_debate_async(_context(), "run-1"))
+    expected = engine.run_debate(_context(), "run-1")
+
+    assert transcript.rounds == expected.rounds
+    assert transcript.outcome == expected.outcome
+    assert client.max_in_flight == 2
+
+
+def test_parse_judge_json_in_prose_with_stray_braces():
+    client = DebateLLMClient(_settings())
+    raw = 'Thinking {aloud}... {"outcome": "disagreement", "reasoning": "} not closed"} End.'
+
+    assert client._parse_response(raw) == {"outcome": "disagreement", "reasoning": "} not closed"}
+
+
+def test_parse_judge_fenced_json():
+    client = DebateLLMClient(_settings())
+    raw = '```json\n{"vote": "BUY"}\n```'
+
+    assert client._parse_response(raw) == {"vote": "BUY"}
+
+
+def test_run_debates_bounds_concurrency_and_keeps_order():
+    engine, client = _engine()
+    engine._settings = WasdenWatchSettings(
+        _env_file=None, claude_api_key_1="claude", gemini_api_key_1="gemini", max_concurrent_debates=2
+    )
+    contexts = [_context(t) for t in ("NVDA", "AAPL", "MSFT")]
+
+    transcripts = asyncio.run(engine.run_debates(contexts, "run-1"))
+
+    assert [t.ticker for t in transcripts] == ["NVDA", "AAPL", "MSFT"]
+    # Two debates at a time, each overlapping its bull and bear call
+    assert client.max_in_flight == 4
+
+
+def test_judge_responses_are_cached_by_prompt():
+    client = _FakeClient(_settings())
+    calls = []
+    client._call_claude = lambda system_prompt, user_prompt: calls.append(user_prompt) or '{"vote": "BUY"}'
+
+    first = client.call_judge("system", "transcript")
+    first["vote"] = "SELL"
+
+    assert client.call_judge("system", "transcript") == {"vote": "BUY"}
+    assert client.call_judge("system", "other transcript") == {"vote": "BUY"}
+    assert calls == ["transcript", "other transcript"]
+
+
+def test_run_debate_async_surfaces_one_sided_failure_unwrapped():
+    engine, client = _engine()
+
+    def _fail(system_prompt: str, user_prompt: str, max_tokens: int) -> str:
+        raise RuntimeError("gemini down")
+
+    client._call_gemini = _fail
+
+    with pytest.raises(LLMError, match="gemini down"):
+        asyncio.run(engine.run_debate_async(_context(), "run-1"))
+
+
+def test_parse_stream_stops_at_closing_brace():
+    client = DebateLLMClient(_settings())
+    consumed = []
+
+    def _chunks():
+        for chunk in ['{"outcome": "agree', 'ment", "agreed_action": "BUY"}', " trailing", " prose"]:
+            consumed.append(chunk)
+            yield chunk
+
+    assert client._parse_stream(_chunks()) == {"outcome": "agreement", "agreed_action": "BUY"}
+    assert len(consumed) == 2
+
+
+def test_run_debates_judges_cohort_in_one_call():
+    engine, client = _engine()
+    contexts = [_context(t) for t in ("NVDA", "AAPL", "MSFT")]
+
+    transcripts = asyncio.run(engine.run_debates(contexts, "run-1"))
+
+    assert [t.outcome for t in transcripts] == [DebateOutcome.AGREEMENT] * 3
+    # 3 debates x (3 bull + 3 bear) calls + 1 batched judge call
+    assert client.calls == 19
+
+
+def test_run_debates_splits_large_cohort_under_token_cap():
+    engine, client = _engine()
+    contexts = [_context(t) for t in ("NVDA", "AAPL", "MSFT", "AMZN", "GOOG", "META")]
+
+    transcripts = asyncio.run(engine.run_debates(contexts, "run-1"))
+
+    assert [t.ticker for t in transcripts] == [c.ticker for c in contexts]
+    assert [t.outcome for t in transcripts] == [DebateOutcome.AGREEMENT] * 6
+    # 6 debates x 6 calls, then slices of 4 and 2 verdicts (2048 // JUDGE_MAX_TOKENS = 4)
+    assert client.calls == 38
+
+
+def test_parse_batch_orders_verdicts_by_case():
+    client = DebateLLMClient(_settings())
+    raw = 'Verdicts:\n```json\n[{"case": 2, "outcome": "disagreement"}, {"case": 1, "outcome": "agreement"}]\n```'
+
+    assert client._parse_batch(raw, 2) == [{"outcome": "agreement"}, {"outcome": "disagreement"}]
+    with pytest.raises(LLMError):
+        client._parse_batch(raw, 3)
+
+
+def test_judge_batch_falls_back_when_cases_do_not_match():
+    client = _FakeClient(_settings())
+    single = []
+
+    def _judge(system_prompt: str, user_prompt: str, max_tokens: int):
+        if "### Case" in user_prompt:
+            # Case 2 answered twice, case 1 missing
+            yield '[{"case": 2, "outcome": "agreement"}, {"case": 2, "outcome": "disagreement"}]'
+        else:
+            single.append(user_prompt)
+            yield '{"outcome": "%s"}' % user_prompt
+
+    client._stream_claude = _judge
+
+    verdicts = client.call_judge_batch("system", ["agreement", "disagreement"])
+
+    assert verdicts == [{"outcome": "agreement"}, {"outcome": "disagreement"}]
+    assert single == ["agreement", "disagreement"]
+
+
+def test_rebuttal_and_judge_calls_use_smaller_output_caps():
+    engine, client = _engine()
+    caps = []
+    call_claude = client._call_claude
+
+    def _record(system_prompt: str, user_prompt: str, max_tokens: int = 0) -> str:
+        caps.append(max_tokens)
+        return call_claude(system_prompt, user_prompt)
+
+    def _record_stream(system_prompt: str, user_prompt: str, max_tokens: int):
+        yield _record(system_prompt, user_prompt, max_tokens)
+
+    client._call_claude = _record
+    client._stream_claude = _record_stream
+
+    engine.run_debate(_context(), "run-1")
+
+    # Initial argument at the configured cap, two rebuttals, then the judge
+    assert caps == [2048, REBUTTAL_MAX_TOKENS, REBUTTAL_MAX_TOKENS, JUDGE_MAX_TOKENS]
+
+
+def test_no_jury_result_is_shared_per_action():
+    buy = DebateEngine.make_no_jury_result("BUY")
+
+    assert buy is DebateEngine.make_no_jury_result("BUY")
+    assert buy.decision.value == "BUY" and buy.spawned is False
+    assert DebateEngine.make_no_jury_result(None).decision.value == "HOLD"
+
+
+def test_bedrock_provider_uses_bedrock_model_id():
+    settings = WasdenWatchSettings(
+        _env_file=None, claude_provider="bedrock", bedrock_model="anthropic.claude-test-v1:0"
+    )
+    client = DebateLLMClient(settings)
+
+    assert client._claude_request("system", "user", 128)["model"] == "anthropic.claude-test-v1:0"
+    assert DebateLLMClient(_settings())._claude_request("system", "user", 128)["model"] == settings.claude_model
+
+
+def test_judge_cache_hits_across_pipeline_runs(monkeypatch):
+    """Each live pipeline run builds a new DebateEngine; the judge cache still hits."""
+    monkeypatch.setenv("CLAUDE_API_KEY_1", "claude")
+    monkeypatch.setenv("GEMINI_API_KEY_1", "gemini")
+    monkeypatch.setenv("CLAUDE_PROVIDER", "anthropic")
+    judge_calls = []
+    fake = _FakeClient(_settings())
+
+    def _stream_claude(self, system_prompt, user_prompt, max_tokens):
+        if system_prompt == AGREEMENT_SYSTEM_PROMPT:
+            judge_calls.append(user_prompt)
+        yield fake._call_claude(system_prompt, user_prompt)
+
+    monkeypatch.setattr(DebateLLMClient, "_stream_claude", _stream_claude)
+    monkeypatch.setattr(DebateLLMClient, "_call_claude", lambda self, s, u, m: "bull case")
+    monkeypatch.setattr(DebateLLMClient, "_call_gemini", lambda self, s, u, m: "bear case")
+    pipeline = DecisionPipeline(use_mock=False)
+
+    outcomes = []
+    for run_id in ("run-1", "run-2"):
+        state = TradingState(pipeline_run_id=run_id, ticker="NVDA", price=189.82, quant_scores={"composite": 0.72})
+        outcomes.append(pipeline._node_debate(state).debate_outcome)
+
+    assert outcomes == ["agreement", "agreement"]
+    assert len(judge_calls) == 1
+
+
+def test_pipeline_research_overlaps_live_bull_and_bear(monkeypatch):
+    monkeypatch.setenv("CLAUDE_API_KEY_1", "claude")
+    monkeypatch.setenv("GEMINI_API_KEY_1", "gemini")
+    monkeypatch.setenv("CLAUDE_PROVIDER", "anthropic")
+    fake = _FakeClient(_settings())
+    monkeypatch.setattr(DebateLLMClient, "_call_claude", lambda self, s, u, m: fake._call_claude(s, u))
+    monkeypatch.setattr(DebateLLMClient, "_call_gemini", lambda self, s, u, m: fake._call_gemini(s, u))
+    state = TradingState(pipeline_run_id="run-1", ticker="NVDA", price=189.82, quant_scores={"composite": 0.72})
+
+    state = DecisionPipeline(use_mock=False)._node_research(state)
+
+    assert (state.bull_case, state.bear_case) == ("bull case", "bear case")
+    assert fake.max_in_flight == 2
+    assert [e["node"] for e in state.node_journal][-2:] == ["bull_researcher", "bear_researcher"]
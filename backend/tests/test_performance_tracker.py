@@ -0,0 +1,162 @@
+"""Unit tests for the paper-trading performance tracker.
+
+All tests use synthetic trades with hand-checkable returns. No database, no API calls.
+"""
+
+import math
+from datetime import datetime
+
+import pytest
+
+from src.monitoring.performance.performance_tracker import PerformanceTracker, as_display_dict
+
+
+def _tracker(pnls: list[float], risk_free_rate: float = 0.0) -> PerformanceTracker:
+    """Tracker with one BUY per pnl, entered at 100 and exited at 100 * (1 + pnl)."""
+    tracker = PerformanceTracker(risk_free_rate=risk_free_rate)
+    for pnl in pnls:
+        tracker.record_trade("AAPL", "BUY", 100.0, 100.0 * (1 + pnl), 0.05, "2026-02-21T14:30:00Z")
+    return tracker
+
+
+# ---------------------------------------------------------------------------
+# Returns
+# ---------------------------------------------------------------------------
+
+def test_empty_tracker_returns_zeroed_metrics():
+    returns = PerformanceTracker().calculate_returns()
+
+    assert returns["trade_count"] == 0
+    assert returns["total_return"] == 0.0
+    assert returns["max_drawdown_duration"] == 0
+
+
+def test_short_trade_pnl_is_inverted():
+    tracker = PerformanceTracker()
+    trade = tracker.record_trade("TSLA", "SELL", 200.0, 180.0, 0.1)
+
+    assert trade.pnl_pct == pytest.approx(0.1)
+    assert trade.pnl == pytest.approx(0.01)
+
+
+def test_default_timestamp_is_utc_iso():
+    trade = PerformanceTracker().record_trade("AAPL", "BUY", 100.0, 101.0, 0.05)
+
+    assert trade.timestamp.endswith("Z")
+    assert datetime.fromisoformat(trade.timestamp[:-1]) <= datetime.utcnow()
+
+
+def test_calculate_returns_win_loss_statistics():
+    returns = _tracker([0.10, -0.05, 0.02, -0.01]).calculate_returns()
+
+    assert returns["trade_count"] == 4
+    assert returns["total_return"] == pytest.approx(1.10 * 0.95 * 1.02 * 0.99 - 1, abs=1e-6)
+    assert returns["win_rate"] == 0.5
+    assert returns["average_win"] == pytest.approx(0.06)
+    assert returns["average_loss"] == pytest.approx(-0.03)
+    assert returns["profit_factor"] == pytest.approx(2.0)
+    assert returns["best_trade"] == pytest.approx(0.10)
+    assert returns["worst_trade"] == pytest.approx(-0.05)
+
+
+def test_max_drawdown_and_duration():
+    # Equity: 1.0 -> 1.2 (peak) -> 0.96 -> 0.864 (trough, 2 trades after peak) -> 1.3 (new peak)
+    returns = _tracker([0.20, -0.20, -0.10, 0.5046296]).calculate_returns()
+
+    assert returns["max_drawdown"] == pytest.approx(0.28)
+    assert returns["max_drawdown_duration"] == 2
+
+
+def test_sharpe_and_sortino_ratios():
+    pnls = [0.01, -0.02, 0.03, 0.01]
+    returns = _tracker(pnls).calculate_returns()
+
+    mean = sum(pnls) / 4
+    std = math.sqrt(sum((p - mean) ** 2 for p in pnls) / 3)
+    assert returns["sharpe_ratio"] == pytest.approx(mean / std * math.sqrt(252), abs=1e-4)
+    # Single losing trade: downside deviation is |-0.02|
+    assert returns["sortino_ratio"] == pytest.approx(mean / 0.02 * math.sqrt(252), abs=1e-4)
+
+
+def test_sortino_without_losses_is_infinite():
+    assert _tracker([0.01, 0.02]).calculate_returns()["sortino_ratio"] == float("inf")
+
+
+def test_calculate_returns_refreshes_after_new_trade():
+    """Cached returns are reused until another trade is recorded."""
+    tracker = _tracker([0.01])
+    first = tracker.calculate_returns()
+    assert tracker.calculate_returns() is first
+
+    tracker.record_trade("AAPL", "BUY", 100.0, 90.0, 0.05)
+    assert tracker.calculate_returns()["trade_count"] == 2
+
+
+# ---------------------------------------------------------------------------
+# Rolling, benchmark and summary
+# ---------------------------------------------------------------------------
+
+def test_rolling_metrics_use_trailing_window():
+    rolling = _tracker([-0.05] * 10 + [0.01, 0.02, 0.03]).rolling_metrics(window_days=3)
+
+    assert rolling["window_size"] == 3
+    assert rolling["rolling_win_rate"] == 1.0
+    assert rolling["rolling_drawdown"] == 0.0
+
+
+def test_vs_benchmark_beta_of_scaled_returns():
+    tracker = _tracker([0.02, -0.01, 0.03, 0.00])
+    result = tracker.vs_benchmark([0.01, -0.005, 0.015, 0.0])
+
+    assert result["beta"] == pytest.approx(2.0)
+    assert result["alpha"] == pytest.approx(0.0, abs=1e-9)
+
+
+def test_vs_benchmark_without_benchmark_data():
+    result = _tracker([0.01]).vs_benchmark([])
+
+    assert result == {"alpha": 0.0, "beta": 0.0, "tracking_error": 0.0, "information_ratio": 0.0}
+
+
+def test_summary_report_counts_decisions():
+    tracker = _tracker([0.01] * 12)
+    for action in ["BUY", "HOLD", "BUY"]:
+        tracker.record_decision({"ticker": "AAPL", "final_decision": {"action": action}})
+
+    report = tracker.summary_report()
+    assert report["decision_distribution"] == {"BUY": 2, "HOLD": 1}
+    assert report["total_decisions"] == 3
+    assert len(report["recent_trades"]) == 10
+    assert report["returns"]["trade_count"] == 12
+
+
+def test_as_display_dict_rounds_only_for_display():
+    returns = _tracker([0.0123456789, 0.02]).calculate_returns()
+    display = as_display_dict(returns)
+
+    assert returns["best_trade"] == pytest.approx(0.02)
+    assert returns["worst_trade"] == pytest.approx(0.0123456789)
+    assert display["worst_trade"] == 0.012346
+    assert display["win_rate"] == 1.0
+    assert display["profit_factor"] == "inf"
+    assert display["trade_count"] == 2
+
+
+def test_many_trades_grow_storage():
+    tracker = _tracker([0.001] * 1000)
+
+    returns = tracker.calculate_returns()
+    assert returns["trade_count"] == 1000
+    assert returns["total_return"] == pytest.approx(1.001 ** 1000 - 1, rel=1e-6)
+    assert len(tracker.trades) == 1000
+
+
+
+def test_snapshot_is_independent_of_later_trades():
+    tracker = _tracker([0.01, 0.02])
+    trades, decisions = tracker.snapshot()
+
+    tracker.record_trade("AAPL", "BUY", 100.0, 101.0, 0.05)
+    assert len(trades) == 2
+    assert decisions == []
+    assert len(tracker.trades) == 3
@@ -1,5 +1,6 @@
 """Tests for decision pipeline — mock mode, all paths."""
 
+import asyncio
 import inspect
 import os
 
@@ -132,3 +133,19 @@ def test_pipeline_veto_bypasses_debate():
     assert result["bear_case"] == ""
     assert result["debate_result"]["rounds"] == 0
     assert result["jury"]["spawned"] is False
+
+
+def test_pipeline_batch_keeps_input_order():
+    """run_batch and run_batch_async return results in input order."""
+    tickers_data = [{"ticker": t, "price": 100.0} for t in ("NVDA", "AAPL", "TSLA", "MSFT", "AMD")]
+    pipeline = DecisionPipeline(use_mock=True, max_parallel=2)
+
+    sync_results = pipeline.run_batch(tickers_data)
+    async_results = asyncio.run(pipeline.run_batch_async(tickers_data))
+
+    expected = [f"{d['ticker']} US Equity" for d in tickers_data]
+    assert [r["ticker"] for r in sync_results] == expected
+    assert [r["ticker"] for r in async_results] == expected
+    assert [r["final_decision"]["action"] for r in sync_results] == [
+        r["final_decision"]["action"] for r in async_results
+    ]
@@ -0,0 +1,44 @@
+"""Tests for Wasden Watch LLM response parsing."""
+
+import pytest
+
+from src.intelligence.wasden_watch.config import WasdenWatchSettings
+from src.intelligence.wasden_watch.exceptions import VerdictParsingError
+from src.intelligence.wasden_watch.llm_client import LLMClient, _find_json_span
+
+
+def _client() -> LLMClient:
+    return LLMClient(WasdenWatchSettings(_env_file=None))
+
+
+def test_parse_direct_json():
+    result = _client()._parse_response('{"verdict": "APPROVE", "confidence": 0.8}')
+    assert result == {"verdict": "APPROVE", "confidence": 0.8}
+
+
+def test_parse_fenced_json():
+    raw = 'Here you go:\n```json\n{"verdict": "VETO", "confidence": 0.9}\n```\nThanks.'
+    assert _client()._parse_response(raw)["verdict"] == "VETO"
+
+
+def test_parse_json_embedded_in_prose():
+    raw = 'Analysis follows. {"verdict": "NEUTRAL", "reasoning": "braces } in {text}"} Done.'
+    result = _client()._parse_response(raw)
+    assert result["verdict"] == "NEUTRAL"
+    assert result["reasoning"] == "braces } in {text}"
+
+
+def test_parse_skips_unbalanced_leading_brace():
+    raw = 'Note {not json} then {"verdict": "APPROVE"}'
+    assert _client()._parse_response(raw) == {"verdict": "APPROVE"}
+
+
+def test_parse_invalid_raises():
+    with pytest.raises(VerdictParsingError):
+        _client()._parse_response("no json here")
+
+
+def test_find_json_span_respects_escaped_quotes():
+    s = 'x {"a": "quote \\" and }"} y'
+    begin, end = _find_json_span(s)
+    assert s[begin:end] == '{"a": "quote \\" and }"}'
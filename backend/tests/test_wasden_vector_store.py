@@ -0,0 +1,164 @@
+"""Tests for the Wasden Watch vector store and background ingest worker.
+
+Uses a real ChromaDB client on a temp directory with a deterministic fake
+embedding function. No model downloads or API calls.
+"""
+
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import numpy as np
+import pytest
+from chromadb import EmbeddingFunction
+from pydantic import ValidationError
+
+from src.intelligence.wasden_watch import vector_store
+from src.intelligence.wasden_watch.config import WasdenWatchSettings
+from src.intelligence.wasden_watch.exceptions import PDFProcessingError, VectorStoreError
+from src.intelligence.wasden_watch.models import TextChunk
+from src.intelligence.wasden_watch.vector_store import VectorStore
+from src.intelligence.wasden_watch.verdict_generator import VerdictGenerator
+
+
+def _vector(text: str) -> np.ndarray:
+    v = np.random.default_rng(zlib.crc32(text.encode())).random(8).astype(np.float32)
+    return v / np.linalg.norm(v)
+
+
+class _FakeEmbedding(EmbeddingFunction):
+    """Hash-seeded unit vectors in place of MiniLM."""
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def name() -> str:
+        return "fake"
+
+    def __call__(self, input):
+        return [_vector(text) for text in input]
+
+    def encode_documents(self, texts: list[str]) -> np.ndarray:
+        return np.stack([_vector(text) for text in texts])
+
+
+@pytest.fixture
+def settings(tmp_path, monkeypatch) -> WasdenWatchSettings:
+    monkeypatch.setattr(vector_store, "get_embedding_function", lambda **kwargs: _FakeEmbedding())
+    return WasdenWatchSettings(_env_file=None, chroma_persist_dir=str(tmp_path))
+
+
+def _chunks(name: str, n: int = 3) -> list[TextChunk]:
+    return [
+        TextChunk(
+            chunk_id=f"{name}::chunk_{i}",
+            text=f"{name} passage {i} on rates and margins",
+            source_filename=name,
+            source_date=date(2025, 1, 1 + i),
+            source_title=name,
+            token_count=8,
+        )
+        for i in range(n)
+    ]
+
+
+def _stubbed_store(add_chunks) -> VectorStore:
+    # Bypass __init__ (ChromaDB/embedding setup); ingest_worker only needs these hooks
+    store = VectorStore.__new__(VectorStore)
+    store._add_chunks = add_chunks
+    store._write_embedding_matrix = lambda ids, matrix: None
+    store.clear = lambda: None
+    return store
+
+
+def _failing_add(chunks):
+    raise RuntimeError("chroma down")
+
+
+def test_ingest_worker_failure_surfaces_as_vector_store_error():
+    store = _stubbed_store(_failing_add)
+
+    with pytest.raises(VectorStoreError, match="chroma down"):
+        with store.ingest_worker() as worker:
+            worker.submit(["chunk"])
+
+
+def test_ingest_worker_keeps_body_exception_over_worker_failure():
+    store = _stubbed_store(_failing_add)
+
+    with pytest.raises(PDFProcessingError, match="bad pdf"):
+        with store.ingest_worker() as worker:
+            worker.submit(["chunk"])
+            raise PDFProcessingError("bad pdf")
+
+
+def test_clear_on_one_instance_invalidates_the_others(settings):
+    reader = VectorStore(settings)
+    writer = VectorStore(settings)
+    writer.ingest(_chunks("a.pdf"))
+
+    assert reader.stats()["total_chunks"] == 3
+    assert reader.search("rates", top_k=2)
+
+    writer.clear()
+
+    assert reader.stats() == {"total_chunks": 0, "collection_name": VectorStore.COLLECTION_NAME, "date_range": None}
+    assert reader.search("rates", top_k=2) == []
+
+
+def test_cached_search_results_cannot_be_mutated(settings):
+    store = VectorStore(settings)
+    store.ingest(_chunks("a.pdf"))
+    first = store.search("rates", top_k=2)
+
+    with pytest.raises(ValidationError):
+        first[0].final_score = 99.0
+    first.pop()
+
+    second = store.search("rates", top_k=2)
+    assert len(second) == 2
+    assert second[0].final_score != 99.0
+
+
+def test_failed_streaming_ingest_leaves_store_empty(settings):
+    store = VectorStore(settings)
+
+    with pytest.raises(PDFProcessingError):
+        with store.ingest_worker() as worker:
+            worker.submit(_chunks("a.pdf"))
+            deadline = time.monotonic() + 5
+            while worker.total < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)  # first batch is written before parsing fails
+            assert worker.total == 3
+            raise PDFProcessingError("bad pdf")
+
+    assert not store.is_ingested()
+    assert VectorStore(settings).stats()["total_chunks"] == 0
+
+
+def test_concurrent_verdict_runs_ingest_corpus_once(settings):
+    """Parallel pipeline runs each build a VerdictGenerator; only one ingests."""
+    calls = []
+
+    class _SlowCorpus:
+        def process_corpus(self, on_chunk):
+            calls.append(1)
+            on_chunk(_chunks("a.pdf"))
+            time.sleep(0.1)  # later PDFs still parsing after the first batch lands
+            on_chunk(_chunks("b.pdf"))
+            return ["a.pdf", "b.pdf"], []
+
+    def _run() -> int:
+        generator = VerdictGenerator.__new__(VerdictGenerator)
+        generator._vector_store = VectorStore(settings)
+        generator._pdf_processor = _SlowCorpus()
+        generator._ingest_if_needed()
+        return generator._vector_store.stats()["total_chunks"]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        totals = list(pool.map(lambda _: _run(), range(4)))
+
+    assert calls == [1]
+    assert totals == [6, 6, 6, 6]
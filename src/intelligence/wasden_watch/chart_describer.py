@@ -3,21 +3,51 @@
 import base64
 import itertools
 import logging
+import threading
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import fitz  # pymupdf
 
+if TYPE_CHECKING:
+    import anthropic
+
 logger = logging.getLogger("wasden_watch")
 
 
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens/sec refill, up to ``capacity`` burst."""
+
+    def __init__(self, rate: float = 1.0, capacity: float = 2.0):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping only if the bucket is empty."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._rate)
+            self._last_refill = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
 class ChartDescriber:
     """Extracts images from PDFs and describes them using Claude Vision."""
 
     def __init__(self, api_keys: list[str], model: str = "claude-sonnet-4-20250514"):
         self._model = model
-        self._key_cycle = itertools.cycle(api_keys) if api_keys else None
-        self._last_request_time: float = 0.0
+        self._keys = tuple(api_keys)
+        self._key_counter = itertools.count()
+        self._clients: dict[str, "anthropic.Anthropic"] = {}
+        # Rate limiting: 1 request/sec per key (burst of 2), so N keys give N req/sec
+        self._buckets = {k: TokenBucket(rate=1.0, capacity=2.0) for k in self._keys}
 
     def describe_charts(self, pdf_path: Path) -> list[str]:
         """Extract images from a PDF and describe each using Claude Vision.
@@ -28,7 +58,7 @@ class ChartDescriber:
         Returns:
             List of text descriptions of charts/images found.
         """
-        if self._key_cycle is None:
+        if not self._keys:
             logger.warning("No Claude API keys configured, skipping chart description")
             return []
 
@@ -73,6 +103,15 @@ class ChartDescriber:
         logger.info(f"Described {len(descriptions)} charts from {pdf_path.name}")
         return descriptions
 
+    def _get_client(self, key: str) -> "anthropic.Anthropic":
+        """Return the cached Anthropic client for an API key, creating it on first use."""
+        client = self._clients.get(key)
+        if client is None:
+            import anthropic
+
+            client = self._clients.setdefault(key, anthropic.Anthropic(api_key=key))
+        return client
+
     def _describe_image(self, image_bytes: bytes) -> str:
         """Send an image to Claude Vision for description.
 
@@ -82,20 +121,13 @@ class ChartDescriber:
         Returns:
             Text description of the image, or empty string on failure.
         """
-        if self._key_cycle is None:
+        if not self._keys:
             return ""
 
-        # Rate limiting: 1 request per second
-        now = time.time()
-        elapsed = now - self._last_request_time
-        if elapsed < 1.0:
-            time.sleep(1.0 - elapsed)
-
         try:
-            import anthropic
-
-            key = next(self._key_cycle)
-            client = anthropic.Anthropic(api_key=key)
+            key = self._keys[next(self._key_counter) % len(self._keys)]
+            self._buckets[key].acquire()
+            client = self._get_client(key)
 
             image_b64 = base64.b64encode(image_bytes).decode("utf-8")
 
@@ -128,10 +160,8 @@ class ChartDescriber:
                 ],
             )
 
-            self._last_request_time = time.time()
             return message.content[0].text
 
         except Exception as e:
             logger.warning(f"Chart description failed: {e}")
-            self._last_request_time = time.time()
             return ""
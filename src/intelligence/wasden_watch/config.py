@@ -1,5 +1,6 @@
 """Configuration for the Wasden Watch RAG pipeline using pydantic-settings."""
 
+from functools import cached_property
 from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -15,34 +16,53 @@ class WasdenWatchSettings(BaseSettings):
     gemini_api_key_1: str = ""
     gemini_api_key_2: str = ""
 
-    @property
+    @cached_property
     def claude_api_keys(self) -> list[str]:
-        """Return list of non-empty Claude API keys."""
+        """Return list of non-empty Claude API keys (computed once per settings instance)."""
         return [k for k in [self.claude_api_key_1, self.claude_api_key_2] if k]
 
-    @property
+    @cached_property
     def gemini_api_keys(self) -> list[str]:
-        """Return list of non-empty Gemini API keys."""
+        """Return list of non-empty Gemini API keys (computed once per settings instance)."""
         return [k for k in [self.gemini_api_key_1, self.gemini_api_key_2] if k]
 
     # Paths (resolved from project root)
     pdf_corpus_path: str = str(_PROJECT_ROOT / "data" / "wasden_corpus")
     metadata_path: str = str(_PROJECT_ROOT / "data" / "wasden_corpus" / "newsletter_metadata.json")
     chroma_persist_dir: str = str(_PROJECT_ROOT / "local" / "chroma_wasden_watch")
+    token_cache_dir: str = str(_PROJECT_ROOT / "local" / "token_cache")  # "" disables
 
     # Chunking
     chunk_size_tokens: int = 600        # target: 500-800 range
     chunk_overlap_tokens: int = 100
 
+    # Embeddings ("cuda" loads MiniLM in bfloat16; "cpu" stays float32)
+    embedding_device: str = "cpu"
+
+    # HNSW index (applied when the collection is created)
+    hnsw_m: int = 32
+    hnsw_construction_ef: int = 200
+    hnsw_search_ef: int = 64
+
     # Retrieval
     default_top_k: int = 10
+    query_cache_size: int = 1024        # cached query embeddings; 0 disables
+    passage_cache_size: int = 2048      # cached search results; 0 disables
+    passage_cache_ttl_seconds: int = 24 * 3600
     time_decay_half_life_days: int = 365
 
     # LLM
     claude_model: str = "claude-sonnet-4-20250514"
+    claude_provider: str = "anthropic"  # "anthropic" or "bedrock" (debate engine only)
+    bedrock_model: str = "anthropic.claude-sonnet-4-20250514-v1:0"  # Bedrock model ID, used instead of claude_model when provider is "bedrock"
+    bedrock_aws_region: str = ""        # empty uses the AWS SDK default region
+    bedrock_latency_optimized: bool = False  # only for models Bedrock serves latency-optimized
     gemini_model: str = "gemini-2.5-flash"
     max_tokens: int = 2048
     temperature: float = 0.3
+    max_concurrent_debates: int = 4     # tickers debated at once by run_debates
+    judge_cache_size: int = 1024        # cached judge/jury responses; 0 disables
+    debate_llm_timeout_seconds: float = 30.0  # per-request cap for debate/judge calls
 
     # Confidence bounds
     direct_coverage_confidence_min: float = 0.75
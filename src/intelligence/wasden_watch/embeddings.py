@@ -0,0 +1,59 @@
+"""Sentence-transformer embedding function for the Wasden Watch vector store."""
+
+import functools
+
+import numpy as np
+from chromadb.utils import embedding_functions
+
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+
+
+class MiniLMEmbeddingFunction(embedding_functions.SentenceTransformerEmbeddingFunction):
+    """Chroma's SentenceTransformer embedding function plus batched document encoding.
+
+    Query-time calls go through Chroma's standard ``__call__``; ingestion calls
+    ``encode_documents`` directly so a whole corpus is tokenized and encoded in
+    one model call, and the vectors are handed to ``collection.add``.
+
+    On CUDA devices the model weights are loaded natively in bfloat16; CPU
+    inference stays in float32.
+    """
+
+    def __init__(self, model_name: str = EMBEDDING_MODEL_NAME, device: str = "cpu", **kwargs):
+        if device.startswith("cuda"):
+            kwargs.setdefault("model_kwargs", {"torch_dtype": "bfloat16"})
+        super().__init__(model_name=model_name, device=device, **kwargs)
+
+    def encode_documents(self, texts: list[str], batch_size: int = 64) -> np.ndarray:
+        """Encode documents into L2-normalized float32 vectors.
+
+        Pooled embeddings are upcast to float32 before normalization so
+        reduced-precision weights do not add rounding error to the norm.
+
+        Args:
+            texts: Document texts to embed.
+            batch_size: Model forward-pass batch size.
+
+        Returns:
+            Array of shape (len(texts), dim).
+        """
+        embeddings = np.asarray(
+            self._model.encode(
+                texts,
+                batch_size=batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=False,
+                show_progress_bar=False,
+            ),
+            dtype=np.float32,
+        )
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.maximum(norms, 1e-12)
+
+
+@functools.lru_cache(maxsize=4)
+def get_embedding_function(
+    model_name: str = EMBEDDING_MODEL_NAME, device: str = "cpu"
+) -> MiniLMEmbeddingFunction:
+    """Return the process-wide embedding function for a model/device, loading it once."""
+    return MiniLMEmbeddingFunction(model_name=model_name, device=device)
@@ -33,6 +33,20 @@ class JournalLogger:
         else:
             logger.info("Supabase not configured, verdict logging disabled")
 
+    @staticmethod
+    def _to_row(response: VerdictResponse) -> dict:
+        """Flatten a VerdictResponse into a wasden_verdicts row."""
+        return {
+            "ticker": response.ticker,
+            "verdict": response.verdict.verdict,
+            "confidence": response.verdict.confidence,
+            "reasoning": response.verdict.reasoning,
+            "mode": response.verdict.mode,
+            "model_used": response.model_used,
+            "passages_retrieved": response.verdict.passages_retrieved,
+            "generated_at": response.generated_at.isoformat(),
+        }
+
     def log_verdict(self, response: VerdictResponse) -> bool:
         """Log a verdict response to Supabase.
 
@@ -46,21 +60,36 @@ class JournalLogger:
             return False
 
         try:
-            row = {
-                "ticker": response.ticker,
-                "verdict": response.verdict.verdict,
-                "confidence": response.verdict.confidence,
-                "reasoning": response.verdict.reasoning,
-                "mode": response.verdict.mode,
-                "model_used": response.model_used,
-                "passages_retrieved": response.verdict.passages_retrieved,
-                "generated_at": response.generated_at.isoformat(),
-            }
-
-            self._client.table("wasden_verdicts").insert(row).execute()
+            self._client.table("wasden_verdicts").insert(self._to_row(response)).execute()
             logger.info(f"Verdict logged for {response.ticker}")
             return True
 
         except Exception as e:
             logger.warning(f"Failed to log verdict for {response.ticker}: {e}")
             return False
+
+    def log_verdicts(self, responses: list[VerdictResponse], batch_size: int = 100) -> int:
+        """Log many verdict responses, one Supabase insert per batch.
+
+        Args:
+            responses: VerdictResponses to log.
+            batch_size: Maximum rows per insert request.
+
+        Returns:
+            Number of verdicts successfully logged.
+        """
+        if not self._enabled or self._client is None or not responses:
+            return 0
+
+        logged = 0
+        for i in range(0, len(responses), batch_size):
+            batch = responses[i : i + batch_size]
+            try:
+                rows = [self._to_row(r) for r in batch]
+                self._client.table("wasden_verdicts").insert(rows).execute()
+                logged += len(batch)
+            except Exception as e:
+                logger.warning(f"Failed to log verdict batch at offset {i}: {e}")
+
+        logger.info(f"Logged {logged}/{len(responses)} verdicts")
+        return logged
@@ -3,25 +3,71 @@
 import itertools
 import json
 import logging
-import re
+from typing import TYPE_CHECKING
 
 from .config import WasdenWatchSettings
 from .exceptions import LLMError, VerdictParsingError
 
+if TYPE_CHECKING:
+    import anthropic
+
 logger = logging.getLogger("wasden_watch")
 
 
+def _find_json_span(s: str, start: int = 0) -> tuple[int, int] | None:
+    """Locate the first balanced ``{...}`` object in ``s`` at or after ``start``.
+
+    Single left-to-right pass tracking brace depth; braces inside JSON
+    string literals (including escaped quotes) are ignored.
+
+    Args:
+        s: Text to scan.
+        start: Index to begin scanning from.
+
+    Returns:
+        ``(begin, end)`` slice bounds of the object, or None if no balanced
+        object is found.
+    """
+    begin = s.find("{", start)
+    if begin == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escape = False
+    for i in range(begin, len(s)):
+        ch = s[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return begin, i + 1
+    return None
+
+
 class LLMClient:
     """LLM client with Claude primary and Gemini fallback, using key rotation."""
 
     def __init__(self, settings: WasdenWatchSettings):
         self._settings = settings
-        self._claude_key_cycle = (
-            itertools.cycle(settings.claude_api_keys) if settings.claude_api_keys else None
-        )
-        self._gemini_key_cycle = (
-            itertools.cycle(settings.gemini_api_keys) if settings.gemini_api_keys else None
-        )
+        # Round-robin via a shared counter: next() on itertools.count is atomic
+        # under the GIL, so concurrent callers never draw the same slot.
+        self._claude_keys = tuple(settings.claude_api_keys)
+        self._gemini_keys = tuple(settings.gemini_api_keys)
+        self._claude_counter = itertools.count()
+        self._gemini_counter = itertools.count()
+        # Anthropic clients hold an httpx connection pool; build one per key and reuse it
+        self._claude_clients: dict[str, "anthropic.Anthropic"] = {}
 
     def generate_verdict(self, system_prompt: str, user_prompt: str) -> tuple[dict, str]:
         """Generate a verdict using Claude with Gemini fallback.
@@ -38,7 +84,7 @@ class LLMClient:
             VerdictParsingError: If response cannot be parsed as valid JSON.
         """
         # Try Claude first
-        if self._claude_key_cycle is not None:
+        if self._claude_keys:
             try:
                 raw_response = self._call_claude(system_prompt, user_prompt)
                 parsed = self._parse_response(raw_response)
@@ -50,7 +96,7 @@ class LLMClient:
                 logger.warning(f"Claude call failed: {e}, falling back to Gemini")
 
         # Fallback to Gemini
-        if self._gemini_key_cycle is not None:
+        if self._gemini_keys:
             try:
                 raw_response = self._call_gemini(system_prompt, user_prompt)
                 parsed = self._parse_response(raw_response)
@@ -74,10 +120,8 @@ class LLMClient:
         Returns:
             Raw response text from Claude.
         """
-        import anthropic
-
-        key = next(self._claude_key_cycle)
-        client = anthropic.Anthropic(api_key=key)
+        key = self._claude_keys[next(self._claude_counter) % len(self._claude_keys)]
+        client = self._get_claude_client(key)
 
         message = client.messages.create(
             model=self._settings.claude_model,
@@ -89,6 +133,15 @@ class LLMClient:
 
         return message.content[0].text
 
+    def _get_claude_client(self, key: str) -> "anthropic.Anthropic":
+        """Return the cached Anthropic client for an API key, creating it on first use."""
+        client = self._claude_clients.get(key)
+        if client is None:
+            import anthropic
+
+            client = self._claude_clients.setdefault(key, anthropic.Anthropic(api_key=key))
+        return client
+
     def _call_gemini(self, system_prompt: str, user_prompt: str) -> str:
         """Call Gemini API with round-robin key rotation.
 
@@ -101,7 +154,7 @@ class LLMClient:
         """
         import google.generativeai as genai
 
-        key = next(self._gemini_key_cycle)
+        key = self._gemini_keys[next(self._gemini_counter) % len(self._gemini_keys)]
         genai.configure(api_key=key)
 
         model = genai.GenerativeModel(
@@ -138,21 +191,24 @@ class LLMClient:
         except json.JSONDecodeError:
             pass
 
-        # Try to extract JSON from markdown code blocks
-        json_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?```", text, re.DOTALL)
-        if json_match:
+        # Try to extract JSON from a markdown code block
+        _, fence, rest = text.partition("```")
+        if fence:
+            block = rest.partition("```")[0]
+            if block.startswith("json"):
+                block = block[4:]
             try:
-                return json.loads(json_match.group(1).strip())
+                return json.loads(block.strip())
             except json.JSONDecodeError:
                 pass
 
-        # Try to find a JSON object in the text
-        brace_match = re.search(r"\{.*\}", text, re.DOTALL)
-        if brace_match:
+        # Scan for the first balanced JSON object in the text
+        span = _find_json_span(text)
+        while span is not None:
             try:
-                return json.loads(brace_match.group(0))
+                return json.loads(text[span[0]:span[1]])
             except json.JSONDecodeError:
-                pass
+                span = _find_json_span(text, span[0] + 1)
 
         raise VerdictParsingError(
             f"Could not parse LLM response as JSON. Raw response: {text[:500]}"
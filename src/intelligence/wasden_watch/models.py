@@ -1,9 +1,10 @@
 """Pydantic models for the Wasden Watch RAG pipeline."""
 
 from datetime import date, datetime
+from functools import cached_property
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CorpusDocument(BaseModel):
@@ -29,7 +30,13 @@ class TextChunk(BaseModel):
 
 
 class RetrievedPassage(BaseModel):
-    """A passage retrieved from the vector store with relevance score."""
+    """A passage retrieved from the vector store with relevance score.
+
+    Frozen: search results are cached and the same instances are handed to
+    every caller.
+    """
+    model_config = ConfigDict(frozen=True)
+
     text: str
     source_filename: str
     source_date: date
@@ -38,6 +45,11 @@ class RetrievedPassage(BaseModel):
     time_decay_weight: float
     final_score: float     # relevance_score * time_decay_weight
 
+    @cached_property
+    def text_upper(self) -> str:
+        """Upper-cased passage text, computed once for ticker-mention checks."""
+        return self.text.upper()
+
 
 class VerdictRequest(BaseModel):
     """Input to the verdict generator."""
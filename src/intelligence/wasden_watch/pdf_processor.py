@@ -1,11 +1,16 @@
 """PDF text extraction and chunking for the Wasden Watch corpus."""
 
+import functools
+import hashlib
+import io
 import json
 import logging
 from datetime import date
 from pathlib import Path
+from typing import Callable
 
 import fitz  # pymupdf
+import numpy as np
 import tiktoken
 
 from .config import WasdenWatchSettings
@@ -15,16 +20,34 @@ from .models import CorpusDocument, TextChunk
 logger = logging.getLogger("wasden_watch")
 
 
+@functools.lru_cache(maxsize=1)
+def _cl100k() -> tiktoken.Encoding:
+    """Return the shared cl100k_base encoding, loaded once per process."""
+    return tiktoken.get_encoding("cl100k_base")
+
+
 class PDFProcessor:
     """Extracts text from Wasden Weekender PDFs and chunks for embedding."""
 
     def __init__(self, settings: WasdenWatchSettings):
         self._settings = settings
-        self._encoding = tiktoken.get_encoding("cl100k_base")
+        self._encoding = _cl100k()
 
-    def process_corpus(self) -> tuple[list[CorpusDocument], list[TextChunk]]:
+    def process_corpus(
+        self,
+        on_chunk: Callable[[list[TextChunk]], None] | None = None,
+        chunk_batch_size: int = 64,
+    ) -> tuple[list[CorpusDocument], list[TextChunk]]:
         """Process all PDFs in the corpus directory.
 
+        Args:
+            on_chunk: Optional callback receiving chunks in batches of
+                ``chunk_batch_size`` as soon as they are built, so downstream
+                embedding can overlap PDF parsing. When given, chunks are
+                handed off rather than retained and the returned chunk list
+                is empty.
+            chunk_batch_size: Number of chunks per ``on_chunk`` call.
+
         Returns:
             Tuple of (list of CorpusDocument, flat list of TextChunk).
         """
@@ -54,6 +77,8 @@ class PDFProcessor:
 
         documents: list[CorpusDocument] = []
         all_chunks: list[TextChunk] = []
+        pending: list[TextChunk] = []
+        total_chunks = 0
 
         for pdf_path in pdf_files:
             try:
@@ -71,10 +96,12 @@ class PDFProcessor:
                 sectors = meta_entry.get("sectors", [])
 
                 # Chunk the text
-                chunks = self._chunk_text(text, pdf_path.name, doc_date, title)
+                tokens = self._encode(text)
+                chunks = self._chunk_text(tokens, pdf_path.name, doc_date, title)
                 chunk_texts = [c.text for c in chunks]
 
-                doc = CorpusDocument(
+                # Inputs are internal and already typed; skip pydantic validation
+                doc = CorpusDocument.model_construct(
                     filename=pdf_path.name,
                     date=doc_date,
                     title=title,
@@ -85,9 +112,13 @@ class PDFProcessor:
                     chunks=chunk_texts,
                 )
                 documents.append(doc)
-                all_chunks.extend(chunks)
+                total_chunks += len(chunks)
+                if on_chunk is None:
+                    all_chunks.extend(chunks)
+                else:
+                    pending.extend(chunks)
 
-                logger.info(f"Processed {pdf_path.name}: {len(chunks)} chunks, {len(self._encoding.encode(text))} tokens")
+                logger.info(f"Processed {pdf_path.name}: {len(chunks)} chunks, {len(tokens)} tokens")
 
             except PDFProcessingError:
                 raise
@@ -95,7 +126,14 @@ class PDFProcessor:
                 logger.warning(f"Error processing {pdf_path.name}: {e}")
                 continue
 
-        logger.info(f"Corpus processing complete: {len(documents)} documents, {len(all_chunks)} chunks")
+            while len(pending) >= chunk_batch_size:
+                on_chunk(pending[:chunk_batch_size])
+                pending = pending[chunk_batch_size:]
+
+        if pending:
+            on_chunk(pending)
+
+        logger.info(f"Corpus processing complete: {len(documents)} documents, {total_chunks} chunks")
         return documents, all_chunks
 
     def _extract_text(self, pdf_path: Path) -> str:
@@ -112,27 +150,63 @@ class PDFProcessor:
         except Exception as e:
             raise PDFProcessingError(f"Failed to open PDF {pdf_path.name}: {e}")
 
-        pages_text: list[str] = []
+        buf = io.StringIO()
         for page_num in range(len(doc)):
             try:
                 page = doc[page_num]
-                text = page.get_text()
+                text = page.get_text("text")
                 if text.strip():
-                    pages_text.append(text)
+                    if buf.tell():
+                        buf.write("\n\n")
+                    buf.write(text)
             except Exception as e:
                 logger.warning(f"Error extracting page {page_num} from {pdf_path.name}: {e}")
                 continue
 
         doc.close()
-        return "\n\n".join(pages_text)
+        return buf.getvalue()
+
+    def _encode(self, text: str) -> list[int]:
+        """Encode text with tiktoken, memoized on disk by content hash.
+
+        Token ids are stored as uint32 ``.npy`` files under ``token_cache_dir``
+        keyed by sha256 of the text plus the tiktoken version, so re-ingesting
+        an unchanged corpus skips encoding entirely.
+
+        Args:
+            text: Full document text.
+
+        Returns:
+            List of token ids.
+        """
+        cache_dir = self._settings.token_cache_dir
+        if not cache_dir:
+            return self._encoding.encode(text)
+
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        cache_path = Path(cache_dir) / f"{self._encoding.name}-{tiktoken.__version__}-{digest}.npy"
+
+        try:
+            if cache_path.exists():
+                return np.load(cache_path).tolist()
+        except Exception as e:
+            logger.warning(f"Failed to read token cache {cache_path.name}: {e}")
+
+        tokens = self._encoding.encode(text)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            np.save(cache_path, np.asarray(tokens, dtype=np.uint32))
+        except Exception as e:
+            logger.warning(f"Failed to write token cache {cache_path.name}: {e}")
+        return tokens
 
     def _chunk_text(
-        self, text: str, filename: str, doc_date: date, title: str
+        self, tokens: list[int], filename: str, doc_date: date, title: str
     ) -> list[TextChunk]:
-        """Chunk text using tiktoken with configured size and overlap.
+        """Chunk tokenized text with configured size and overlap.
 
         Args:
-            text: Full document text.
+            tokens: Full document token ids.
             filename: Source filename.
             doc_date: Document date.
             title: Document title.
@@ -140,7 +214,6 @@ class PDFProcessor:
         Returns:
             List of TextChunk objects.
         """
-        tokens = self._encoding.encode(text)
         chunk_size = self._settings.chunk_size_tokens
         overlap = self._settings.chunk_overlap_tokens
 
@@ -153,7 +226,7 @@ class PDFProcessor:
             chunk_tokens = tokens[start:end]
             chunk_text = self._encoding.decode(chunk_tokens)
 
-            chunk = TextChunk(
+            chunk = TextChunk.model_construct(
                 chunk_id=f"{filename}::chunk_{chunk_index}",
                 text=chunk_text,
                 source_filename=filename,
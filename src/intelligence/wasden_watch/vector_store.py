@@ -1,17 +1,228 @@
 """ChromaDB vector store for the Wasden Watch newsletter corpus."""
 
+import json
 import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import date
+from pathlib import Path
+from typing import Iterator
 
 import chromadb
-from chromadb.utils import embedding_functions
+import numpy as np
 
 from .config import WasdenWatchSettings
+from .embeddings import get_embedding_function
 from .exceptions import VectorStoreError
 from .models import RetrievedPassage, TextChunk
+from .scoring import decay_weights
 
 logger = logging.getLogger("wasden_watch")
 
+# date.toordinal() of 1970-01-01, the datetime64 epoch
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Max spread in time-decay weight across the corpus for which over-fetching is skipped
+_NEAR_IDENTITY_DECAY_SPREAD = 0.05
+
+
+def _normalize_query(query: str) -> str:
+    """Cache key for a query: whitespace-collapsed and lowercased (MiniLM is uncased)."""
+    return " ".join(query.split()).lower()
+
+
+class _SharedCorpus:
+    """ChromaDB client and change counter shared by every VectorStore on one directory.
+
+    Writers (ingest, clear) bump ``generation``; each instance compares it on
+    use and drops its cached count, search results, date range and collection
+    handle once another instance has changed the corpus.
+    """
+
+    def __init__(self, path: str):
+        self.client = chromadb.PersistentClient(path=path)
+        self.generation = 0
+        self._lock = threading.Lock()
+        # Held across check-and-ingest so concurrent callers ingest the corpus once
+        self.ingest_lock = threading.Lock()
+
+    def bump(self) -> None:
+        """Record a corpus change."""
+        with self._lock:
+            self.generation += 1
+
+
+_shared_by_path: dict[str, _SharedCorpus] = {}
+_shared_by_path_lock = threading.Lock()
+
+
+def _get_shared(path: str) -> _SharedCorpus:
+    """Return the shared client state per persist directory.
+
+    Locked so concurrent first uses of a directory open one client (and so
+    share one ingest lock) rather than racing to create several.
+    """
+    with _shared_by_path_lock:
+        shared = _shared_by_path.get(path)
+        if shared is None:
+            shared = _shared_by_path[path] = _SharedCorpus(path)
+        return shared
+
+
+@dataclass
+class PassageBatch:
+    """Column-oriented candidate set from a single vector store query.
+
+    Scores are held as parallel NumPy arrays so re-ranking is vectorized;
+    string fields stay in Chroma's metadata dicts and are only read, along
+    with building RetrievedPassage models, for the passages actually returned.
+    Passage texts are not part of the batch: callers fetch them for the
+    selected ids only.
+    """
+    relevance: np.ndarray
+    decay: np.ndarray
+    final: np.ndarray
+    ids: list[str]
+    metadatas: list[dict]
+    dates: np.ndarray      # datetime64[D]
+
+    @classmethod
+    def from_query(
+        cls,
+        ids: list[str],
+        metadatas: list[dict],
+        distances: list[float],
+        today: date,
+        half_life: int,
+    ) -> "PassageBatch":
+        """Build a batch from Chroma query columns and compute time-decayed scores.
+
+        Args:
+            ids: Chunk ids.
+            metadatas: Per-passage metadata dicts.
+            distances: Cosine distances from the query.
+            today: Reference date for time decay.
+            half_life: Time-decay half-life in days.
+
+        Returns:
+            PassageBatch with relevance, decay, and final scores populated.
+        """
+        if all("source_ordinal" in m for m in metadatas):
+            # Ingest-time day ordinals: ages are a plain integer subtraction
+            ordinals = np.fromiter(
+                (m["source_ordinal"] for m in metadatas), dtype=np.int64, count=len(metadatas)
+            )
+            dates = (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+            days_old = today.toordinal() - ordinals
+        else:
+            # Collections ingested before source_ordinal existed
+            dates = np.array([m["source_date"] for m in metadatas], dtype="datetime64[D]")
+            days_old = (np.datetime64(today, "D") - dates).astype(np.int64)
+
+        # ChromaDB cosine distance is in [0, 2], convert to relevance score
+        relevance = np.maximum(0.0, 1.0 - np.asarray(distances, dtype=np.float64))
+        decay = decay_weights(days_old, half_life)
+
+        return cls(
+            relevance=relevance,
+            decay=decay,
+            final=relevance * decay,
+            ids=ids,
+            metadatas=metadatas,
+            dates=dates,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def top_indices(self, k: int) -> np.ndarray:
+        """Indices of the k highest-scoring passages, sorted by final_score descending."""
+        n = len(self)
+        if n == 0 or k <= 0:
+            return np.empty(0, dtype=np.intp)
+
+        neg_final = -self.final
+        if k < n:
+            idx = np.argpartition(neg_final, k - 1)[:k]
+            idx = idx[np.argsort(neg_final[idx], kind="stable")]
+        else:
+            idx = np.argsort(neg_final, kind="stable")
+        return idx
+
+    def materialize(self, idx: np.ndarray, texts: list[str]) -> list[RetrievedPassage]:
+        """Build RetrievedPassage models for the given rows.
+
+        Args:
+            idx: Row indices, e.g. from ``top_indices``.
+            texts: Passage texts aligned with ``idx``.
+
+        Returns:
+            List of RetrievedPassage in ``idx`` order.
+        """
+        # Values are already typed floats/dates; skip pydantic validation
+        return [
+            RetrievedPassage.model_construct(
+                text=text,
+                source_filename=self.metadatas[i]["source_filename"],
+                source_date=self.dates[i].astype(date),
+                source_title=self.metadatas[i]["source_title"],
+                relevance_score=float(self.relevance[i]),
+                time_decay_weight=float(self.decay[i]),
+                final_score=float(self.final[i]),
+            )
+            for i, text in zip(idx, texts)
+        ]
+
+
+class IngestWorker:
+    """Background consumer that writes chunk batches to the vector store."""
+
+    _DONE = object()
+
+    def __init__(self, add_batch, max_pending_batches: int = 8):
+        self._add_batch = add_batch
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending_batches)
+        self._error: Exception | None = None
+        self.total = 0
+        self._thread = threading.Thread(target=self._run, name="wasden-ingest", daemon=True)
+        self._thread.start()
+
+    def submit(self, chunks: list[TextChunk]) -> None:
+        """Queue a batch for ingestion, blocking while the queue is full."""
+        if self._error is not None:
+            raise VectorStoreError(f"Ingestion worker failed: {self._error}")
+        self._queue.put(chunks)
+
+    def close(self, raise_error: bool = True) -> None:
+        """Wait for queued batches to finish and surface any worker error.
+
+        Args:
+            raise_error: If False, only join the worker; used when the caller
+                is already propagating its own exception.
+        """
+        self._queue.put(self._DONE)
+        self._thread.join()
+        if raise_error and self._error is not None:
+            raise VectorStoreError(f"Ingestion worker failed: {self._error}")
+
+    def _run(self) -> None:
+        while True:
+            batch = self._queue.get()
+            if batch is self._DONE:
+                return
+            # After a failure keep draining so the producer never blocks
+            if self._error is not None:
+                continue
+            try:
+                self._add_batch(batch)
+                self.total += len(batch)
+            except Exception as e:
+                self._error = e
+
 
 class VectorStore:
     """ChromaDB-backed vector store with time-decay scoring."""
@@ -21,20 +232,34 @@ class VectorStore:
     def __init__(self, settings: WasdenWatchSettings):
         self._settings = settings
         try:
-            self._client = chromadb.PersistentClient(
-                path=settings.chroma_persist_dir
-            )
-            self._embedding_fn = embedding_functions.SentenceTransformerEmbeddingFunction(
-                model_name="all-MiniLM-L6-v2"
-            )
+            self._shared = _get_shared(settings.chroma_persist_dir)
+            self._generation = self._shared.generation
+            self._client = self._shared.client
+            self._embedding_fn = get_embedding_function(device=settings.embedding_device)
             self._collection = self._client.get_or_create_collection(
                 name=self.COLLECTION_NAME,
                 embedding_function=self._embedding_fn,
-                metadata={"hnsw:space": "cosine"},
+                metadata=self._collection_metadata(),
             )
         except Exception as e:
             raise VectorStoreError(f"Failed to initialize ChromaDB: {e}")
 
+        # Collection size, refreshed lazily after ingest/clear
+        self._count_cache: int | None = None
+
+        # LRU of query embeddings so repeated queries skip the MiniLM forward pass
+        self._query_cache: OrderedDict[str, list[float]] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+
+        # Search results keyed by (query, top_k, day); dropped whenever the corpus changes
+        self._passage_cache: OrderedDict[tuple, tuple[float, list[RetrievedPassage]]] = OrderedDict()
+        self._passage_cache_lock = threading.Lock()
+
+        # Corpus date range, maintained at ingest time so stats() never scans metadata
+        self._date_range_path = Path(settings.chroma_persist_dir) / "date_range.json"
+        self._date_range_lock = threading.Lock()
+        self._date_range: dict | None = self._load_date_range()
+
     def ingest(self, chunks: list[TextChunk]) -> int:
         """Ingest text chunks into the vector store.
 
@@ -49,52 +274,191 @@ class VectorStore:
             return 0
 
         # Skip re-ingestion if already populated with expected count
-        if self.is_ingested() and self._collection.count() >= len(chunks):
+        if self.is_ingested() and self._count() >= len(chunks):
             logger.info(
-                f"Collection already has {self._collection.count()} chunks, "
+                f"Collection already has {self._count()} chunks, "
                 f"skipping ingestion of {len(chunks)} chunks"
             )
             return 0
 
         # Clear existing data if re-ingesting
-        if self._collection.count() > 0:
+        if self._count() > 0:
             logger.info("Clearing existing collection for re-ingestion")
             self.clear()
 
         logger.info(f"Ingesting {len(chunks)} chunks into ChromaDB")
 
+        # Embed the whole corpus in one batched model call rather than per add()
+        try:
+            embeddings = self._embedding_fn.encode_documents([c.text for c in chunks])
+        except Exception as e:
+            raise VectorStoreError(f"Failed to embed chunks: {e}")
+
         # ChromaDB has batch limits, process in batches of 500
         batch_size = 500
         total_ingested = 0
 
         for i in range(0, len(chunks), batch_size):
             batch = chunks[i : i + batch_size]
+            try:
+                self._add_chunks(batch, embeddings[i : i + batch_size])
+                total_ingested += len(batch)
+                logger.info(f"Ingested batch {i // batch_size + 1}: {len(batch)} chunks")
+            except Exception as e:
+                raise VectorStoreError(f"Failed to ingest batch at offset {i}: {e}")
 
-            ids = [c.chunk_id for c in batch]
-            documents = [c.text for c in batch]
-            metadatas = [
+        self._write_embedding_matrix([c.chunk_id for c in chunks], embeddings)
+        logger.info(f"Ingestion complete: {total_ingested} chunks total")
+        return total_ingested
+
+    @contextmanager
+    def ingest_worker(self, max_pending_batches: int = 8) -> Iterator["IngestWorker"]:
+        """Run ingestion on a background thread fed by ``IngestWorker.submit``.
+
+        Lets the caller keep parsing PDFs while previously submitted chunks
+        are embedded and written to ChromaDB. On exit the queue is drained
+        and any worker failure is re-raised as VectorStoreError, unless the
+        body itself raised, in which case that exception propagates.
+
+        Meant for populating an empty store: if either side fails, the
+        collection is cleared so a partial corpus is never left looking
+        ingested.
+
+        Args:
+            max_pending_batches: Queue bound; ``submit`` blocks when full.
+
+        Yields:
+            IngestWorker whose ``total`` is the number of chunks ingested.
+        """
+        ids: list[str] = []
+        parts: list[np.ndarray] = []
+
+        def add_batch(chunks: list[TextChunk]) -> None:
+            embeddings = self._add_chunks(chunks)
+            ids.extend(c.chunk_id for c in chunks)
+            parts.append(embeddings.astype(np.float16))
+
+        worker = IngestWorker(add_batch, max_pending_batches)
+        try:
+            yield worker
+        except BaseException:
+            # Keep the caller's exception rather than masking it with a worker error
+            worker.close(raise_error=False)
+            self._discard_partial_ingest(worker.total)
+            raise
+        try:
+            worker.close()
+        except VectorStoreError:
+            self._discard_partial_ingest(worker.total)
+            raise
+        if parts:
+            self._write_embedding_matrix(ids, np.concatenate(parts))
+        logger.info(f"Ingestion complete: {worker.total} chunks total")
+
+    def _discard_partial_ingest(self, written: int) -> None:
+        """Clear the collection after a failed streaming ingest, without raising."""
+        logger.warning(f"Ingestion failed after {written} chunks, clearing partial corpus")
+        try:
+            self.clear()
+        except VectorStoreError as e:
+            logger.error(f"Failed to clear partial corpus: {e}")
+
+    def mmap_embeddings(self) -> tuple[np.ndarray, np.ndarray] | None:
+        """Memory-map the corpus embedding matrix written at ingest time.
+
+        Lets analytics scan every passage vector without a ChromaDB
+        ``get()`` round trip.
+
+        Returns:
+            Tuple of (chunk ids, read-only float16 matrix of shape (N, dim)),
+            or None if no matrix has been written.
+        """
+        ids_path, matrix_path = self._embedding_matrix_paths()
+        if not (ids_path.exists() and matrix_path.exists()):
+            return None
+        return np.load(ids_path), np.load(matrix_path, mmap_mode="r")
+
+    def _embedding_matrix_paths(self) -> tuple[Path, Path]:
+        persist_dir = Path(self._settings.chroma_persist_dir)
+        return persist_dir / "ids.npy", persist_dir / "embeddings.f16.npy"
+
+    def _write_embedding_matrix(self, ids: list[str], embeddings: np.ndarray) -> None:
+        """Persist chunk ids and their float16 vectors alongside the collection."""
+        ids_path, matrix_path = self._embedding_matrix_paths()
+        try:
+            ids_path.parent.mkdir(parents=True, exist_ok=True)
+            np.save(ids_path, np.array(ids))
+            np.save(matrix_path, np.asarray(embeddings, dtype=np.float16))
+        except Exception as e:
+            logger.warning(f"Failed to persist embedding matrix: {e}")
+
+    def _add_chunks(self, chunks: list[TextChunk], embeddings: np.ndarray | None = None) -> np.ndarray:
+        """Add a single batch of chunks to the collection.
+
+        Args:
+            chunks: Chunks to add.
+            embeddings: Precomputed vectors aligned with ``chunks``; encoded
+                here in one batched call when omitted.
+
+        Returns:
+            The vectors that were stored.
+        """
+        self._sync()
+        if embeddings is None:
+            embeddings = self._embedding_fn.encode_documents([c.text for c in chunks])
+        self._collection.add(
+            ids=[c.chunk_id for c in chunks],
+            embeddings=embeddings,
+            documents=[c.text for c in chunks],
+            metadatas=[
                 {
                     "source_filename": c.source_filename,
                     "source_date": c.source_date.isoformat(),
+                    "source_ordinal": c.source_date.toordinal(),
                     "source_title": c.source_title,
                     "token_count": c.token_count,
                 }
-                for c in batch
-            ]
-
+                for c in chunks
+            ],
+        )
+        self._count_cache = None
+        self._invalidate_passage_cache()
+        self._update_date_range(
+            min(c.source_date for c in chunks).isoformat(),
+            max(c.source_date for c in chunks).isoformat(),
+        )
+        self._shared.bump()
+        return embeddings
+
+    def _invalidate_passage_cache(self) -> None:
+        """Drop cached search results after the corpus changes."""
+        with self._passage_cache_lock:
+            self._passage_cache.clear()
+
+    def _load_date_range(self) -> dict | None:
+        """Read the persisted corpus date range, if any."""
+        try:
+            with open(self._date_range_path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read cached date range: {e}")
+            return None
+
+    def _update_date_range(self, earliest: str, latest: str) -> None:
+        """Widen the cached date range with newly ingested dates and persist it."""
+        with self._date_range_lock:
+            if self._date_range is not None:
+                earliest = min(earliest, self._date_range["earliest"])
+                latest = max(latest, self._date_range["latest"])
+            self._date_range = {"earliest": earliest, "latest": latest}
             try:
-                self._collection.add(
-                    ids=ids,
-                    documents=documents,
-                    metadatas=metadatas,
-                )
-                total_ingested += len(batch)
-                logger.info(f"Ingested batch {i // batch_size + 1}: {len(batch)} chunks")
+                self._date_range_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self._date_range_path, "w") as f:
+                    json.dump(self._date_range, f)
             except Exception as e:
-                raise VectorStoreError(f"Failed to ingest batch at offset {i}: {e}")
-
-        logger.info(f"Ingestion complete: {total_ingested} chunks total")
-        return total_ingested
+                logger.warning(f"Failed to persist date range: {e}")
 
     def search(self, query: str, top_k: int = 10) -> list[RetrievedPassage]:
         """Search the corpus with time-decay weighted scoring.
@@ -106,54 +470,138 @@ class VectorStore:
         Returns:
             List of RetrievedPassage sorted by final_score descending.
         """
-        if self._collection.count() == 0:
+        if self._count() == 0:
             logger.warning("Vector store is empty, cannot search")
             return []
 
+        today = date.today()
+        cache_key = (_normalize_query(query), top_k, today)
+        with self._passage_cache_lock:
+            entry = self._passage_cache.get(cache_key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._passage_cache.move_to_end(cache_key)
+                return list(entry[1])
+
         # Retrieve more than top_k to allow for re-ranking after time decay
-        fetch_k = min(top_k * 3, self._collection.count())
+        fetch_k = min(top_k * self._overfetch_factor(), self._count())
 
+        # Two-phase retrieve: rank on metadata and distances, then fetch text
+        # for the top_k survivors only (ids are always returned by Chroma)
         try:
             results = self._collection.query(
-                query_texts=[query],
+                query_embeddings=[self._embed_query(query)],
                 n_results=fetch_k,
-                include=["documents", "metadatas", "distances"],
+                include=["metadatas", "distances"],
             )
         except Exception as e:
             raise VectorStoreError(f"Search failed: {e}")
 
-        passages: list[RetrievedPassage] = []
-        today = date.today()
-        half_life = self._settings.time_decay_half_life_days
-
-        documents = results["documents"][0] if results["documents"] else []
+        ids = results["ids"][0] if results["ids"] else []
         metadatas = results["metadatas"][0] if results["metadatas"] else []
         distances = results["distances"][0] if results["distances"] else []
 
-        for doc_text, metadata, distance in zip(documents, metadatas, distances):
-            # ChromaDB cosine distance is in [0, 2], convert to relevance score
-            relevance_score = max(0.0, 1.0 - distance)
-
-            doc_date = date.fromisoformat(metadata["source_date"])
-            days_old = (today - doc_date).days
-            time_decay_weight = 0.5 ** (days_old / half_life)
+        batch = PassageBatch.from_query(
+            ids,
+            metadatas,
+            distances,
+            today=today,
+            half_life=self._settings.time_decay_half_life_days,
+        )
+        top_idx = batch.top_indices(top_k)
+        passages = batch.materialize(top_idx, self._fetch_documents([ids[i] for i in top_idx]))
+
+        max_size = self._settings.passage_cache_size
+        if max_size > 0:
+            expires_at = time.monotonic() + self._settings.passage_cache_ttl_seconds
+            with self._passage_cache_lock:
+                self._passage_cache[cache_key] = (expires_at, passages)
+                self._passage_cache.move_to_end(cache_key)
+                if len(self._passage_cache) > max_size:
+                    self._passage_cache.popitem(last=False)
+        return list(passages)
+
+    def _fetch_documents(self, ids: list[str]) -> list[str]:
+        """Fetch passage texts by id, in the order given."""
+        if not ids:
+            return []
+        try:
+            results = self._collection.get(ids=ids, include=["documents"])
+        except Exception as e:
+            raise VectorStoreError(f"Search failed: {e}")
+        # get() does not guarantee result order matches the requested ids
+        by_id = dict(zip(results["ids"], results["documents"]))
+        return [by_id[chunk_id] for chunk_id in ids]
+
+    def _collection_metadata(self) -> dict:
+        """HNSW index settings for the collection (cosine space, tuned graph params)."""
+        return {
+            "hnsw:space": "cosine",
+            "hnsw:M": self._settings.hnsw_m,
+            "hnsw:construction_ef": self._settings.hnsw_construction_ef,
+            "hnsw:search_ef": self._settings.hnsw_search_ef,
+        }
 
-            final_score = relevance_score * time_decay_weight
+    def _overfetch_factor(self) -> int:
+        """Candidates to fetch per returned passage.
 
-            passage = RetrievedPassage(
-                text=doc_text,
-                source_filename=metadata["source_filename"],
-                source_date=doc_date,
-                source_title=metadata["source_title"],
-                relevance_score=relevance_score,
-                time_decay_weight=time_decay_weight,
-                final_score=final_score,
-            )
-            passages.append(passage)
-
-        # Sort by final_score descending and return top_k
-        passages.sort(key=lambda p: p.final_score, reverse=True)
-        return passages[:top_k]
+        When the whole corpus spans so few days that time-decay weights differ
+        by less than ``_NEAR_IDENTITY_DECAY_SPREAD``, re-ranking cannot move
+        passages far, so only ``top_k`` candidates are fetched.
+        """
+        date_range = self._date_range
+        if date_range is None:
+            return 3
+        span_days = (
+            date.fromisoformat(date_range["latest"]) - date.fromisoformat(date_range["earliest"])
+        ).days
+        decay_spread = 1.0 - 0.5 ** (span_days / self._settings.time_decay_half_life_days)
+        return 1 if decay_spread < _NEAR_IDENTITY_DECAY_SPREAD else 3
+
+    def _sync(self) -> None:
+        """Drop per-instance corpus caches if the corpus changed through another instance."""
+        generation = self._shared.generation
+        if generation == self._generation:
+            return
+        self._collection = self._client.get_or_create_collection(
+            name=self.COLLECTION_NAME,
+            embedding_function=self._embedding_fn,
+            metadata=self._collection_metadata(),
+        )
+        self._count_cache = None
+        self._invalidate_passage_cache()
+        with self._date_range_lock:
+            self._date_range = self._load_date_range()
+        self._generation = generation
+
+    def _count(self) -> int:
+        """Return the collection size, querying ChromaDB only when the cache is stale."""
+        self._sync()
+        if self._count_cache is None:
+            self._count_cache = self._collection.count()
+        return self._count_cache
+
+    def _embed_query(self, query: str) -> list[float]:
+        """Embed a query string, reusing cached embeddings for repeated queries.
+
+        Keys are whitespace-collapsed and lowercased; MiniLM is an uncased
+        model so this does not change the embedding.
+        """
+        key = _normalize_query(query)
+        with self._query_cache_lock:
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                self._query_cache.move_to_end(key)
+                return cached
+
+        embedding = [float(x) for x in self._embedding_fn([key])[0]]
+
+        max_size = self._settings.query_cache_size
+        if max_size > 0:
+            with self._query_cache_lock:
+                self._query_cache[key] = embedding
+                if len(self._query_cache) > max_size:
+                    self._query_cache.popitem(last=False)
+        return embedding
 
     def stats(self) -> dict:
         """Return vector store statistics.
@@ -161,7 +609,7 @@ class VectorStore:
         Returns:
             Dict with total_chunks, date_range, collection_name.
         """
-        count = self._collection.count()
+        count = self._count()
         result = {
             "total_chunks": count,
             "collection_name": self.COLLECTION_NAME,
@@ -169,37 +617,49 @@ class VectorStore:
         }
 
         if count > 0:
-            # Get date range from metadata
-            try:
-                all_metadata = self._collection.get(include=["metadatas"])
-                dates = []
-                for meta in all_metadata["metadatas"]:
-                    if "source_date" in meta:
-                        dates.append(meta["source_date"])
-                if dates:
-                    dates.sort()
-                    result["date_range"] = {
-                        "earliest": dates[0],
-                        "latest": dates[-1],
-                    }
-            except Exception as e:
-                logger.warning(f"Failed to compute date range: {e}")
+            if self._date_range is None:
+                # Collection ingested before the date range was cached: scan once
+                try:
+                    all_metadata = self._collection.get(include=["metadatas"])
+                    dates = [m["source_date"] for m in all_metadata["metadatas"] if "source_date" in m]
+                    if dates:
+                        self._update_date_range(min(dates), max(dates))
+                except Exception as e:
+                    logger.warning(f"Failed to compute date range: {e}")
+            if self._date_range is not None:
+                result["date_range"] = dict(self._date_range)
 
         return result
 
+    @property
+    def ingest_lock(self) -> threading.Lock:
+        """Process-wide lock for this persist directory, held while checking and ingesting."""
+        return self._shared.ingest_lock
+
     def is_ingested(self) -> bool:
         """Check if the collection has any documents."""
-        return self._collection.count() > 0
+        return self._count() > 0
 
     def clear(self) -> None:
         """Delete and recreate the collection."""
         try:
+            self._sync()
             self._client.delete_collection(self.COLLECTION_NAME)
             self._collection = self._client.get_or_create_collection(
                 name=self.COLLECTION_NAME,
                 embedding_function=self._embedding_fn,
-                metadata={"hnsw:space": "cosine"},
+                metadata=self._collection_metadata(),
             )
+            self._count_cache = None
+            self._invalidate_passage_cache()
+            with self._query_cache_lock:
+                self._query_cache.clear()
+            with self._date_range_lock:
+                self._date_range = None
+                self._date_range_path.unlink(missing_ok=True)
+            for path in self._embedding_matrix_paths():
+                path.unlink(missing_ok=True)
+            self._shared.bump()
             logger.info("Vector store cleared")
         except Exception as e:
             raise VectorStoreError(f"Failed to clear collection: {e}")
@@ -35,16 +35,25 @@ class VerdictGenerator:
         Returns:
             Vector store stats dict.
         """
-        if not self._vector_store.is_ingested():
-            logger.info("Vector store is empty, starting ingestion")
-            documents, chunks = self._pdf_processor.process_corpus()
-            ingested = self._vector_store.ingest(chunks)
-            logger.info(f"Ingested {ingested} chunks from {len(documents)} documents")
-        else:
-            logger.info("Vector store already populated, skipping ingestion")
-
+        self._ingest_if_needed()
         return self._vector_store.stats()
 
+    def _ingest_if_needed(self) -> None:
+        """Ingest the PDF corpus when the vector store is empty.
+
+        Serialized per corpus directory: concurrent pipeline runs wait for a
+        single ingest instead of duplicating it or searching a partial corpus.
+        """
+        with self._vector_store.ingest_lock:
+            if self._vector_store.is_ingested():
+                logger.info("Vector store already populated, skipping ingestion")
+                return
+            logger.info("Vector store is empty, starting ingestion")
+            # Embed/write chunks on a worker thread while remaining PDFs are parsed
+            with self._vector_store.ingest_worker() as worker:
+                documents, _ = self._pdf_processor.process_corpus(on_chunk=worker.submit)
+            logger.info(f"Ingested {worker.total} chunks from {len(documents)} documents")
+
     def generate(self, request: VerdictRequest) -> VerdictResponse:
         """Generate a Wasden Watch verdict for a ticker.
 
@@ -54,8 +63,9 @@ class VerdictGenerator:
         Returns:
             VerdictResponse with verdict, reasoning, and metadata.
         """
-        # Step 1: Ensure corpus is ingested
-        corpus_stats = self.ensure_ingested()
+        # Step 1: Ensure corpus is ingested (stats are a cached read after ingest)
+        self._ingest_if_needed()
+        corpus_stats = self._vector_store.stats()
 
         # Step 2: Search vector store
         query = f"{request.ticker} {request.company_name or ''} {request.sector or ''}".strip()
@@ -64,7 +74,7 @@ class VerdictGenerator:
         # Step 3: Determine mode
         ticker_upper = request.ticker.upper()
         direct_count = sum(
-            1 for p in passages if ticker_upper in p.text.upper()
+            1 for p in passages if ticker_upper in p.text_upper
         )
         if direct_count >= self._settings.direct_coverage_min_passages:
             mode = "direct_coverage"
@@ -77,17 +87,19 @@ class VerdictGenerator:
         )
 
         # Step 4: Build prompt
-        company_info = ""
+        company_parts: list[str] = []
         if request.company_name:
-            company_info += f"\n**Company:** {request.company_name}"
+            company_parts.append(f"\n**Company:** {request.company_name}")
         if request.sector:
-            company_info += f"\n**Sector:** {request.sector}"
+            company_parts.append(f"\n**Sector:** {request.sector}")
+        company_info = "".join(company_parts)
 
         fundamentals_section = ""
         if request.fundamentals:
-            fundamentals_section = "## Key Fundamentals\n"
-            for key, value in request.fundamentals.items():
-                fundamentals_section += f"- **{key}:** {value}\n"
+            fundamentals_section = "".join([
+                "## Key Fundamentals\n",
+                *(f"- **{key}:** {value}\n" for key, value in request.fundamentals.items()),
+            ])
 
         passages_section = self._format_passages(passages)
 
@@ -96,13 +108,13 @@ class VerdictGenerator:
         else:
             mode_instruction = MODE_INSTRUCTIONS["framework_application"]
 
-        user_prompt = VERDICT_PROMPT.format(
-            ticker=request.ticker,
-            company_info=company_info,
-            fundamentals_section=fundamentals_section,
-            passages_section=passages_section,
-            mode_instruction=mode_instruction,
-        )
+        user_prompt = VERDICT_PROMPT.format_map({
+            "ticker": request.ticker,
+            "company_info": company_info,
+            "fundamentals_section": fundamentals_section,
+            "passages_section": passages_section,
+            "mode_instruction": mode_instruction,
+        })
 
         # Step 5: Call LLM
         result_dict, model_used = self._llm_client.generate_verdict(SYSTEM_PROMPT, user_prompt)
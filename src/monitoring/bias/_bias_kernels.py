@@ -0,0 +1,154 @@
+"""Fused reduction kernels for bias-monitor ingestion and reporting.
+
+Uses a Numba-compiled single pass for large batches when ``numba`` is
+installed; otherwise (and for small batches, where JIT dispatch overhead
+dominates) falls back to vectorized NumPy expressions.
+"""
+
+import numpy as np
+
+# ---------------------------------------------------------------------------
+# Optional Numba import — graceful degradation when not installed
+# ---------------------------------------------------------------------------
+try:
+    from numba import njit
+
+    _NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    njit = None  # type: ignore[assignment]
+    _NUMBA_AVAILABLE = False
+
+# Below this many rows the NumPy path is faster than a compiled kernel call
+_NUMBA_MIN_SIZE = 1024
+
+
+def _batch_stats_numpy(composite, std_dev, sizes, is_approve, is_veto, is_trade):
+    evaluated = is_approve | is_veto
+    agreements = evaluated & ((composite > 0.5) == is_approve)
+    batch_sizes = sizes[is_trade & (sizes > 0)]
+    size_n = batch_sizes.shape[0]
+    size_mean = float(batch_sizes.mean()) if size_n else 0.0
+    size_m2 = float(((batch_sizes - size_mean) ** 2).sum()) if size_n else 0.0
+    return (
+        int(evaluated.sum()),
+        int(agreements.sum()),
+        int((std_dev > 0.5).sum()),
+        size_n,
+        size_mean,
+        size_m2,
+    )
+
+
+def _column_scan_numpy(action_codes, verdict_codes, debate_codes, sizes, n_actions, n_verdicts, n_debates, max_trade_code):
+    return (
+        np.bincount(action_codes, minlength=n_actions),
+        np.bincount(verdict_codes, minlength=n_verdicts),
+        np.bincount(debate_codes, minlength=n_debates),
+        sizes[(action_codes <= max_trade_code) & (sizes > 0)],
+    )
+
+
+if _NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _column_scan_numba(
+        action_codes, verdict_codes, debate_codes, sizes, n_actions, n_verdicts, n_debates, max_trade_code
+    ):  # pragma: no cover - compiled
+        action_counts = np.zeros(n_actions, dtype=np.int64)
+        verdict_counts = np.zeros(n_verdicts, dtype=np.int64)
+        debate_counts = np.zeros(n_debates, dtype=np.int64)
+        trade_sizes = np.empty(sizes.shape[0], dtype=np.float64)
+        m = 0
+        for i in range(sizes.shape[0]):
+            action_counts[action_codes[i]] += 1
+            verdict_counts[verdict_codes[i]] += 1
+            debate_counts[debate_codes[i]] += 1
+            if action_codes[i] <= max_trade_code and sizes[i] > 0:
+                trade_sizes[m] = sizes[i]
+                m += 1
+        return action_counts, verdict_counts, debate_counts, trade_sizes[:m].copy()
+
+    @njit(cache=True, fastmath=True)
+    def _batch_stats_numba(composite, std_dev, sizes, is_approve, is_veto, is_trade):  # pragma: no cover - compiled
+        evaluated = 0
+        agreements = 0
+        high_count = 0
+        size_n = 0
+        size_mean = 0.0
+        size_m2 = 0.0
+        for i in range(composite.shape[0]):
+            if is_approve[i] or is_veto[i]:
+                evaluated += 1
+                if (composite[i] > 0.5) == is_approve[i]:
+                    agreements += 1
+            if std_dev[i] > 0.5:
+                high_count += 1
+            if is_trade[i] and sizes[i] > 0:
+                # Welford update
+                size_n += 1
+                delta = sizes[i] - size_mean
+                size_mean += delta / size_n
+                size_m2 += delta * (sizes[i] - size_mean)
+        return evaluated, agreements, high_count, size_n, size_mean, size_m2
+
+
+def batch_stats(
+    composite: np.ndarray,
+    std_dev: np.ndarray,
+    sizes: np.ndarray,
+    is_approve: np.ndarray,
+    is_veto: np.ndarray,
+    is_trade: np.ndarray,
+) -> tuple[int, int, int, int, float, float]:
+    """Reduce one ingestion batch to the bias monitor's running aggregates.
+
+    Args:
+        composite: Quant composite scores.
+        std_dev: Quant model std_dev per decision.
+        sizes: Recommended position sizes.
+        is_approve: Wasden verdict is APPROVE.
+        is_veto: Wasden verdict is VETO.
+        is_trade: Action is BUY or SELL.
+
+    Returns:
+        Tuple of (verdicts evaluated for agreement, quant/Wasden agreements,
+        high-disagreement count, sized trade count, mean size, size M2).
+    """
+    if _NUMBA_AVAILABLE and composite.shape[0] >= _NUMBA_MIN_SIZE:
+        evaluated, agreements, high_count, size_n, size_mean, size_m2 = _batch_stats_numba(
+            composite, std_dev, sizes, is_approve, is_veto, is_trade
+        )
+        return int(evaluated), int(agreements), int(high_count), int(size_n), float(size_mean), float(size_m2)
+    return _batch_stats_numpy(composite, std_dev, sizes, is_approve, is_veto, is_trade)
+
+
+def column_scan(
+    action_codes: np.ndarray,
+    verdict_codes: np.ndarray,
+    debate_codes: np.ndarray,
+    sizes: np.ndarray,
+    n_actions: int,
+    n_verdicts: int,
+    n_debates: int,
+    max_trade_code: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Scan the report columns once: per-code counts plus BUY/SELL sizes.
+
+    Args:
+        action_codes: Integer-coded actions.
+        verdict_codes: Integer-coded Wasden verdicts.
+        debate_codes: Integer-coded debate outcomes.
+        sizes: Recommended position sizes.
+        n_actions: Number of action codes (length of the action counts).
+        n_verdicts: Number of verdict codes.
+        n_debates: Number of debate outcome codes.
+        max_trade_code: Actions with a code at or below this are BUY/SELL.
+
+    Returns:
+        Tuple of (action counts, verdict counts, debate counts, a fresh
+        array of position sizes > 0 on BUY/SELL rows).
+    """
+    args = (action_codes, verdict_codes, debate_codes, sizes, n_actions, n_verdicts, n_debates, max_trade_code)
+    if _NUMBA_AVAILABLE and sizes.shape[0] >= _NUMBA_MIN_SIZE:
+        return _column_scan_numba(*args)
+    return _column_scan_numpy(*args)
@@ -6,12 +6,25 @@ and action distribution. Generates alerts when any metric is anomalous.
 Feeds the weekly bias_monitoring_report.md per PROJECT_STANDARDS_v2.md Section 10.
 """
 
+import bisect
+import functools
 import logging
 import math
-from collections import Counter
+import sys
+import time
+from collections import Counter, deque
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from itertools import compress
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Mapping, Optional, Sequence
+
+import numpy as np
+
+from ._bias_kernels import batch_stats, column_scan
+
+if TYPE_CHECKING:
+    import polars as pl
 
 logger = logging.getLogger("wasden_watch.monitoring.bias")
 
@@ -24,10 +37,71 @@ SECTOR_CONCENTRATION_LIMIT = 0.40  # single sector > 40% of BUY decisions
 ESCALATION_RATE_LIMIT = 0.20       # > 20% jury escalation rate
 WIN_RATE_FLOOR = 0.50              # rolling 30-day win rate below 50%
 
+_INITIAL_CAPACITY = 256
+
+# Number of most recent trade results in the rolling win-rate window
+_WIN_RATE_WINDOW = 30
+
+# is_win column encoding (int8): unresolved / loss / win
+_UNRESOLVED = -1
+
+# Seed vocabularies for the integer-coded string columns. Codes are fixed
+# for these values; anything else is appended per monitor on first sight.
+_ACTION_NAMES = ("BUY", "SELL", "HOLD", "BLOCKED", "ESCALATED")
+_VERDICT_NAMES = ("APPROVE", "VETO", "NEUTRAL", "")
+_DEBATE_NAMES = ("agreement", "disagreement", "")
+_BUY, _SELL = 0, 1            # BUY/SELL rows are exactly action code <= _SELL
+_APPROVE, _VETO = 0, 1
+
+# Shared read-only default for missing journal sections (no per-call dict allocation)
+_EMPTY: Mapping = MappingProxyType({})
+
+
+# (wall time, formatted) of the last _now_iso() result
+_LAST_TS: tuple[float, str] = (0.0, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time as ISO-8601 with a ``Z`` suffix, reformatted at most once a second."""
+    global _LAST_TS
+    t = time.time()
+    if t - _LAST_TS[0] < 1.0:
+        return _LAST_TS[1]
+    ts = datetime.fromtimestamp(t, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+    _LAST_TS = (t, ts)
+    return ts
+
+
+def _cached_metric(method: Callable[["BiasMonitor"], dict]) -> Callable[["BiasMonitor"], dict]:
+    """Memoize a metric until the monitor's data changes.
+
+    Results are keyed by the monitor's data version, which is bumped on every
+    ingestion and trade-result update, so repeated calls within one report
+    (e.g. ``generate_bias_report`` followed by ``check_alerts``) reuse the
+    first computation. Cached dicts are shared between callers and must be
+    treated as read-only.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: "BiasMonitor") -> dict:
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        result = method(self)
+        self._cache[name] = (self._version, result)
+        return result
+
+    return wrapper
+
 
-@dataclass
+@dataclass(slots=True)
 class DecisionSnapshot:
-    """Minimal record of a pipeline decision for bias tracking."""
+    """Minimal record of a pipeline decision for bias tracking.
+
+    Slotted: no per-instance ``__dict__``, which roughly halves the size of
+    each snapshot handed out by ``add_decision`` and ``decisions``.
+    """
 
     ticker: str
     action: str  # BUY, SELL, HOLD, BLOCKED, ESCALATED
@@ -44,15 +118,130 @@ class DecisionSnapshot:
     is_win: Optional[bool] = None  # set after trade closes
 
 
+def _snapshot_fields(journal_entry: dict) -> tuple:
+    """Extract DecisionSnapshot fields, in declaration order up to ``debate_outcome``.
+
+    Tickers and sectors repeat across thousands of decisions, so they are
+    interned to share one string object per distinct value.
+    """
+    final = journal_entry.get("final_decision", _EMPTY)
+    quant = journal_entry.get("quant_scores", _EMPTY)
+    wasden = journal_entry.get("wasden_verdict", _EMPTY)
+    jury = journal_entry.get("jury", _EMPTY)
+    debate = journal_entry.get("debate_result", _EMPTY)
+    return (
+        sys.intern(journal_entry.get("ticker", "")),
+        final.get("action", "HOLD"),
+        journal_entry["timestamp"] if "timestamp" in journal_entry else _now_iso(),
+        wasden.get("verdict", ""),
+        wasden.get("confidence", 0.0),
+        quant.get("composite", 0.0),
+        quant.get("std_dev", 0.0),
+        sys.intern(journal_entry.get("sector", "")),
+        final.get("recommended_position_size", 0.0),
+        jury.get("spawned", False),
+        jury.get("escalated_to_human", False),
+        debate.get("outcome", ""),
+    )
+
+
+class _Codebook:
+    """Maps low-cardinality strings to small integer codes and back."""
+
+    def __init__(self, known: tuple[str, ...]) -> None:
+        self.names: list[str] = list(known)
+        self._codes: dict[str, int] = {name: i for i, name in enumerate(known)}
+
+    def code(self, name: str) -> int:
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+    def encode(self, names: Sequence[str]) -> np.ndarray:
+        return np.fromiter(map(self.code, names), dtype=np.int16, count=len(names))
+
+
+def _epoch_seconds(timestamp: str) -> Optional[float]:
+    """Parse an ISO-8601 journal timestamp to POSIX seconds (naive = UTC)."""
+    try:
+        dt = datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
 class BiasMonitor:
     """Tracks and reports systematic biases in pipeline decisions.
 
     Ingests pipeline decisions and provides aggregated bias metrics,
     trend analysis, and anomaly alerts for the weekly monitoring report.
+
+    Args:
+        retention: If set, decisions whose timestamp is more than this far
+            behind the newest ingested decision are evicted, and every metric
+            covers only the retained window. Bounds memory for long-running
+            monitors. Defaults to keeping all history.
     """
 
-    def __init__(self) -> None:
-        self._decisions: list[DecisionSnapshot] = []
+    def __init__(self, retention: Optional[timedelta] = None) -> None:
+        # Column-oriented decision storage: numeric fields live in contiguous
+        # NumPy buffers (grown by doubling), action/verdict/debate outcome as
+        # integer codes, free-form strings in parallel lists.
+        # Rows [self._head, self._n) are valid; rows before _head have been
+        # evicted and are reclaimed when the buffers next fill up.
+        self._head = 0
+        self._n = 0
+        self._tickers: list[str] = []
+        self._timestamps: list[str] = []
+        self._sectors: list[str] = []
+        self._actions = _Codebook(_ACTION_NAMES)
+        self._verdicts = _Codebook(_VERDICT_NAMES)
+        self._debate_outcomes = _Codebook(_DEBATE_NAMES)
+        self._action_codes = np.empty(_INITIAL_CAPACITY, dtype=np.int16)
+        self._verdict_codes = np.empty(_INITIAL_CAPACITY, dtype=np.int16)
+        self._debate_codes = np.empty(_INITIAL_CAPACITY, dtype=np.int16)
+        self._wasden_confidence = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._quant_composite = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._quant_std_dev = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._position_size = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._jury_spawned_col = np.empty(_INITIAL_CAPACITY, dtype=np.bool_)
+        self._jury_escalated_col = np.empty(_INITIAL_CAPACITY, dtype=np.bool_)
+        self._is_win = np.empty(_INITIAL_CAPACITY, dtype=np.int8)
+        # Running total of quant_std_dev through each row, so the mean of any
+        # contiguous range (e.g. each half for the trend) is one subtraction
+        self._std_dev_cumsum = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        # Retention: decision times as POSIX seconds, only tracked when enabled
+        self._retention = retention
+        self._epoch = np.empty(_INITIAL_CAPACITY, dtype=np.float64) if retention is not None else None
+        self._latest_epoch = -math.inf
+
+        # Metric memoization: bumped on every mutation to invalidate _cache
+        self._version = 0
+        self._cache: dict[str, tuple[int, dict]] = {}
+
+        # Running aggregates, updated per decision so metrics avoid full rescans
+        self._buy_sector_counts: Counter[str] = Counter()
+        self._buy_sector_total = 0
+        self._veto_count = 0
+        self._jury_spawned_count = 0
+        self._jury_escalated_count = 0
+        self._agreements = 0
+        self._agreement_evaluated = 0
+        self._high_disagreement_count = 0
+        # Row indices of unresolved BUY/SELL decisions per ticker, oldest first
+        self._unresolved_by_ticker: dict[str, list[int]] = {}
+        # Rolling win-rate window over the most recently marked trade results,
+        # as (row index, is_win) so results of evicted decisions can be dropped
+        self._recent_wins: deque[tuple[int, bool]] = deque(maxlen=_WIN_RATE_WINDOW)
+        self._recent_win_count = 0
+        # Welford accumulators over BUY/SELL position sizes > 0
+        self._size_n = 0
+        self._size_mean = 0.0
+        self._size_m2 = 0.0
         logger.info("BiasMonitor initialized")
 
     # ------------------------------------------------------------------
@@ -69,27 +258,13 @@ class BiasMonitor:
         Returns:
             The created DecisionSnapshot.
         """
-        final = journal_entry.get("final_decision", {})
-        quant = journal_entry.get("quant_scores", {})
-        wasden = journal_entry.get("wasden_verdict", {})
-        jury = journal_entry.get("jury", {})
-        debate = journal_entry.get("debate_result", {})
-
-        snapshot = DecisionSnapshot(
-            ticker=journal_entry.get("ticker", ""),
-            action=final.get("action", "HOLD"),
-            timestamp=journal_entry.get("timestamp", datetime.utcnow().isoformat() + "Z"),
-            wasden_verdict=wasden.get("verdict", ""),
-            wasden_confidence=wasden.get("confidence", 0.0),
-            quant_composite=quant.get("composite", 0.0),
-            quant_std_dev=quant.get("std_dev", 0.0),
-            sector=journal_entry.get("sector", ""),
-            recommended_position_size=final.get("recommended_position_size", 0.0),
-            jury_spawned=jury.get("spawned", False),
-            jury_escalated=jury.get("escalated_to_human", False),
-            debate_outcome=debate.get("outcome", ""),
-        )
-        self._decisions.append(snapshot)
+        snapshot = DecisionSnapshot(*_snapshot_fields(journal_entry))
+        self._append(snapshot)
+        if snapshot.action in ("BUY", "SELL"):
+            self._unresolved_by_ticker.setdefault(snapshot.ticker, []).append(self._n - 1)
+        self._update_aggregates(snapshot)
+        self._prune()
+        self._version += 1
         logger.info(
             "Decision ingested: %s %s (wasden=%s)",
             snapshot.action,
@@ -98,6 +273,376 @@ class BiasMonitor:
         )
         return snapshot
 
+    def add_decisions(self, journal_entries: list[dict]) -> None:
+        """Ingest many pipeline decisions at once, e.g. when replaying a journal.
+
+        Equivalent to calling ``add_decision`` for each entry in order, but
+        fills the columns and running aggregates with one vectorized pass per
+        field and logs a single summary line instead of one per decision.
+
+        Args:
+            journal_entries: Dicts matching the DecisionJournalEntry schema.
+        """
+        if not journal_entries:
+            return
+
+        (
+            tickers,
+            actions,
+            timestamps,
+            verdicts,
+            confidence,
+            composite,
+            std_dev,
+            sectors,
+            sizes,
+            jury_spawned,
+            jury_escalated,
+            outcomes,
+        ) = zip(*map(_snapshot_fields, journal_entries))
+        self._ingest_columns(
+            tickers,
+            actions,
+            timestamps,
+            verdicts,
+            confidence,
+            composite,
+            std_dev,
+            sectors,
+            sizes,
+            jury_spawned,
+            jury_escalated,
+            outcomes,
+        )
+
+    def from_polars(self, df: "pl.DataFrame") -> dict:
+        """Backfill from a flattened journal DataFrame and return the bias report.
+
+        Fast path for re-running the monitor over months of history: each
+        column is copied straight into the monitor's column storage, with no
+        per-record dicts or snapshots. Columns are named after the
+        DecisionSnapshot fields (``ticker``, ``action``, ``wasden_verdict``,
+        ``quant_std_dev``, ...); missing columns and nulls take the same
+        defaults as ``add_decision``. Decisions remain incrementally
+        updatable afterwards.
+
+        Args:
+            df: Polars DataFrame with one row per decision, in journal order.
+
+        Returns:
+            Dict from ``generate_bias_report`` covering all ingested decisions.
+        """
+        n = df.height
+        if n:
+
+            def strings(name: str, default: str) -> list[str]:
+                if name not in df.columns:
+                    return [default] * n
+                return df.get_column(name).cast(str).fill_null(default).to_list()
+
+            def values(name: str, default, dtype) -> np.ndarray:
+                if name not in df.columns:
+                    return np.full(n, default, dtype=dtype)
+                return df.get_column(name).fill_null(default).to_numpy().astype(dtype, copy=False)
+
+            self._ingest_columns(
+                list(map(sys.intern, strings("ticker", ""))),
+                strings("action", "HOLD"),
+                strings("timestamp", "") if "timestamp" in df.columns else [_now_iso()] * n,
+                strings("wasden_verdict", ""),
+                values("wasden_confidence", 0.0, np.float64),
+                values("quant_composite", 0.0, np.float64),
+                values("quant_std_dev", 0.0, np.float64),
+                list(map(sys.intern, strings("sector", ""))),
+                values("recommended_position_size", 0.0, np.float64),
+                values("jury_spawned", False, np.bool_),
+                values("jury_escalated", False, np.bool_),
+                strings("debate_outcome", ""),
+            )
+        return self.generate_bias_report()
+
+    def _ingest_columns(
+        self,
+        tickers,
+        actions,
+        timestamps,
+        verdicts,
+        confidence,
+        composite,
+        std_dev,
+        sectors,
+        sizes,
+        jury_spawned,
+        jury_escalated,
+        outcomes,
+    ) -> None:
+        """Append column-wise decision data (DecisionSnapshot field order) and fold it in."""
+        count = len(tickers)
+        self._reserve(count)
+        start = self._n
+        end = start + count
+
+        self._tickers.extend(tickers)
+        self._timestamps.extend(timestamps)
+        self._sectors.extend(sectors)
+        action_codes = self._actions.encode(actions)
+        verdict_codes = self._verdicts.encode(verdicts)
+        self._action_codes[start:end] = action_codes
+        self._verdict_codes[start:end] = verdict_codes
+        self._debate_codes[start:end] = self._debate_outcomes.encode(outcomes)
+        self._wasden_confidence[start:end] = confidence
+        self._quant_composite[start:end] = composite
+        self._quant_std_dev[start:end] = std_dev
+        self._position_size[start:end] = sizes
+        self._jury_spawned_col[start:end] = jury_spawned
+        self._jury_escalated_col[start:end] = jury_escalated
+        self._is_win[start:end] = _UNRESOLVED
+        is_trade = action_codes <= _SELL
+        # Seed with the previous running total so accumulation order matches add_decision
+        prev = self._std_dev_cumsum[start - 1] if start else 0.0
+        self._std_dev_cumsum[start:end] = np.cumsum(np.concatenate(([prev], std_dev)))[1:]
+        self._n = end
+        self._stamp_epochs(start, end)
+
+        for offset in np.flatnonzero(is_trade):
+            self._unresolved_by_ticker.setdefault(tickers[offset], []).append(start + int(offset))
+
+        self._fold_rows(start, end, 1)
+        self._prune()
+        self._version += 1
+        logger.info("Decisions ingested: %d (total %d)", end - start, self._total)
+
+    def _fold_rows(self, start: int, end: int, sign: int) -> None:
+        """Add (``sign=1``) or remove (``sign=-1``) rows [start, end) from the running aggregates."""
+        action_codes = self._action_codes[start:end]
+        verdict_codes = self._verdict_codes[start:end]
+        is_buy = action_codes == _BUY
+        # C-level projection: select BUY rows, then drop empty sectors
+        buy_sectors = list(filter(None, compress(self._sectors[start:end], is_buy.tolist())))
+        if sign > 0:
+            self._buy_sector_counts.update(buy_sectors)
+        else:
+            self._buy_sector_counts.subtract(buy_sectors)
+            for sector in set(buy_sectors):
+                if self._buy_sector_counts[sector] <= 0:
+                    del self._buy_sector_counts[sector]
+        self._buy_sector_total += sign * len(buy_sectors)
+
+        spawned = self._jury_spawned_col[start:end]
+        self._jury_spawned_count += sign * int(spawned.sum())
+        self._jury_escalated_count += sign * int((spawned & self._jury_escalated_col[start:end]).sum())
+        is_approve = verdict_codes == _APPROVE
+        is_veto = verdict_codes == _VETO
+        self._veto_count += sign * int(is_veto.sum())
+        evaluated, agreements, high_count, size_n, size_mean, size_m2 = batch_stats(
+            self._quant_composite[start:end],
+            self._quant_std_dev[start:end],
+            self._position_size[start:end],
+            is_approve,
+            is_veto,
+            action_codes <= _SELL,
+        )
+        self._agreement_evaluated += sign * evaluated
+        self._agreements += sign * agreements
+        self._high_disagreement_count += sign * high_count
+        if sign > 0:
+            self._merge_size_moments(size_n, size_mean, size_m2)
+        else:
+            self._remove_size_moments(size_n, size_mean, size_m2)
+
+    def _merge_size_moments(self, n_b: int, mean_b: float, m2_b: float) -> None:
+        """Combine a batch's position-size moments into the Welford accumulators (Chan et al.)."""
+        if not n_b:
+            return
+        n_a = self._size_n
+        n = n_a + n_b
+        delta = mean_b - self._size_mean
+        self._size_mean += delta * n_b / n
+        self._size_m2 += m2_b + delta * delta * n_a * n_b / n
+        self._size_n = n
+
+    def _remove_size_moments(self, n_b: int, mean_b: float, m2_b: float) -> None:
+        """Inverse of ``_merge_size_moments``: take a subset's moments back out."""
+        if not n_b:
+            return
+        n = self._size_n
+        n_a = n - n_b
+        if n_a <= 0:
+            self._size_n, self._size_mean, self._size_m2 = 0, 0.0, 0.0
+            return
+        mean_a = (n * self._size_mean - n_b * mean_b) / n_a
+        delta = mean_b - mean_a
+        self._size_m2 = max(self._size_m2 - m2_b - delta * delta * n_a * n_b / n, 0.0)
+        self._size_mean = mean_a
+        self._size_n = n_a
+
+    def _prune(self) -> None:
+        """Evict decisions that have aged out of the retention window."""
+        if self._retention is None:
+            return
+        cutoff = self._latest_epoch - self._retention.total_seconds()
+        head, n = self._head, self._n
+        new_head = head
+        # Decisions arrive in roughly time order, so stale rows are a prefix
+        while new_head < n and self._epoch[new_head] < cutoff:
+            new_head += 1
+        if new_head == head:
+            return
+
+        self._fold_rows(head, new_head, -1)
+        # Each per-ticker stack is ascending, so evicted rows are a prefix of it
+        evicted_trades = np.flatnonzero(
+            (self._action_codes[head:new_head] <= _SELL) & (self._is_win[head:new_head] == _UNRESOLVED)
+        )
+        for ticker in {self._tickers[head + int(offset)] for offset in evicted_trades}:
+            pending = self._unresolved_by_ticker[ticker]
+            del pending[: bisect.bisect_left(pending, new_head)]
+            if not pending:
+                del self._unresolved_by_ticker[ticker]
+        # Results are marked out of row order, so filter rather than pop a prefix
+        if any(row < new_head for row, _ in self._recent_wins):
+            self._recent_wins = deque(
+                ((row, win) for row, win in self._recent_wins if row >= new_head), maxlen=_WIN_RATE_WINDOW
+            )
+            self._recent_win_count = sum(win for _, win in self._recent_wins)
+        self._head = new_head
+        logger.info("Evicted %d decisions older than %s", new_head - head, self._retention)
+
+    def _stamp_epochs(self, start: int, end: int) -> None:
+        """Record decision times for rows [start, end) when retention is enabled."""
+        if self._epoch is None:
+            return
+        for i in range(start, end):
+            t = _epoch_seconds(self._timestamps[i])
+            if t is None:
+                # Unparseable timestamp: treat it as arriving with the newest decision
+                t = self._latest_epoch if self._latest_epoch > -math.inf else time.time()
+            self._epoch[i] = t
+            if t > self._latest_epoch:
+                self._latest_epoch = t
+
+    def _reserve(self, extra: int) -> None:
+        """Ensure the columns can take ``extra`` more rows, reclaiming evicted rows first."""
+        capacity = self._quant_composite.shape[0]
+        if self._n + extra <= capacity:
+            return
+        if self._head:
+            self._compact()
+        if self._n + extra > capacity:
+            while capacity < self._n + extra:
+                capacity *= 2
+            self._grow(capacity)
+
+    def _compact(self) -> None:
+        """Shift retained rows to the front of every column, dropping evicted rows."""
+        head, n = self._head, self._n
+        base = self._std_dev_cumsum[head - 1]
+        for name in self._column_names():
+            col = getattr(self, name)
+            col[: n - head] = col[head:n]
+        self._std_dev_cumsum[: n - head] -= base
+        del self._tickers[:head]
+        del self._timestamps[:head]
+        del self._sectors[:head]
+        for pending in self._unresolved_by_ticker.values():
+            pending[:] = [i - head for i in pending]
+        self._recent_wins = deque(((row - head, win) for row, win in self._recent_wins), maxlen=_WIN_RATE_WINDOW)
+        self._head = 0
+        self._n = n - head
+
+    def _column_names(self) -> tuple[str, ...]:
+        names = (
+            "_wasden_confidence",
+            "_quant_composite",
+            "_quant_std_dev",
+            "_position_size",
+            "_jury_spawned_col",
+            "_jury_escalated_col",
+            "_is_win",
+            "_action_codes",
+            "_verdict_codes",
+            "_debate_codes",
+            "_std_dev_cumsum",
+        )
+        return names if self._epoch is None else names + ("_epoch",)
+
+    @property
+    def _total(self) -> int:
+        """Number of retained decisions."""
+        return self._n - self._head
+
+    def _append(self, d: DecisionSnapshot) -> None:
+        """Write one decision into the next row of every column."""
+        self._reserve(1)
+        i = self._n
+        self._tickers.append(d.ticker)
+        self._timestamps.append(d.timestamp)
+        self._sectors.append(d.sector)
+        self._action_codes[i] = self._actions.code(d.action)
+        self._verdict_codes[i] = self._verdicts.code(d.wasden_verdict)
+        self._debate_codes[i] = self._debate_outcomes.code(d.debate_outcome)
+        self._wasden_confidence[i] = d.wasden_confidence
+        self._quant_composite[i] = d.quant_composite
+        self._quant_std_dev[i] = d.quant_std_dev
+        self._position_size[i] = d.recommended_position_size
+        self._jury_spawned_col[i] = d.jury_spawned
+        self._jury_escalated_col[i] = d.jury_escalated
+        self._is_win[i] = _UNRESOLVED if d.is_win is None else d.is_win
+        self._std_dev_cumsum[i] = (self._std_dev_cumsum[i - 1] if i else 0.0) + d.quant_std_dev
+        self._n = i + 1
+        self._stamp_epochs(i, i + 1)
+
+    def _grow(self, capacity: int) -> None:
+        """Reallocate the numeric columns to hold ``capacity`` rows."""
+        for name in self._column_names():
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self._n] = old[: self._n]
+            setattr(self, name, new)
+
+    def _snapshot(self, i: int) -> DecisionSnapshot:
+        """Rebuild the DecisionSnapshot stored at row ``i``."""
+        is_win = int(self._is_win[i])
+        return DecisionSnapshot(
+            ticker=self._tickers[i],
+            action=self._actions.names[self._action_codes[i]],
+            timestamp=self._timestamps[i],
+            wasden_verdict=self._verdicts.names[self._verdict_codes[i]],
+            wasden_confidence=float(self._wasden_confidence[i]),
+            quant_composite=float(self._quant_composite[i]),
+            quant_std_dev=float(self._quant_std_dev[i]),
+            sector=self._sectors[i],
+            recommended_position_size=float(self._position_size[i]),
+            jury_spawned=bool(self._jury_spawned_col[i]),
+            jury_escalated=bool(self._jury_escalated_col[i]),
+            debate_outcome=self._debate_outcomes.names[self._debate_codes[i]],
+            is_win=None if is_win == _UNRESOLVED else bool(is_win),
+        )
+
+    def _update_aggregates(self, d: DecisionSnapshot) -> None:
+        """Fold one decision into the running metric aggregates."""
+        if d.action == "BUY" and d.sector:
+            self._buy_sector_counts[d.sector] += 1
+            self._buy_sector_total += 1
+        if d.wasden_verdict == "VETO":
+            self._veto_count += 1
+        if d.jury_spawned:
+            self._jury_spawned_count += 1
+            if d.jury_escalated:
+                self._jury_escalated_count += 1
+        if d.wasden_verdict in ("APPROVE", "VETO"):
+            self._agreement_evaluated += 1
+            if (d.quant_composite > 0.5) == (d.wasden_verdict == "APPROVE"):
+                self._agreements += 1
+        if d.quant_std_dev > 0.5:
+            self._high_disagreement_count += 1
+        size = d.recommended_position_size
+        if d.action in ("BUY", "SELL") and size > 0:
+            self._size_n += 1
+            delta = size - self._size_mean
+            self._size_mean += delta / self._size_n
+            self._size_m2 += delta * (size - self._size_mean)
+
     def mark_trade_result(self, ticker: str, pipeline_run_id: str, is_win: bool) -> None:
         """Mark a previously ingested decision with its trade outcome.
 
@@ -107,51 +652,90 @@ class BiasMonitor:
             is_win: Whether the trade was profitable.
         """
         # Mark the most recent unresolved decision for this ticker
-        for d in reversed(self._decisions):
-            if d.ticker == ticker and d.is_win is None and d.action in ("BUY", "SELL"):
-                d.is_win = is_win
-                logger.info("Trade result marked: %s %s win=%s", d.action, ticker, is_win)
-                return
-        logger.warning("No unresolved decision found for %s to mark result", ticker)
+        pending = self._unresolved_by_ticker.get(ticker)
+        if not pending:
+            logger.warning("No unresolved decision found for %s to mark result", ticker)
+            return
+
+        i = pending.pop()
+        if not pending:
+            del self._unresolved_by_ticker[ticker]
+        self._is_win[i] = is_win
+        self._record_result(i, is_win)
+        self._version += 1
+        logger.info(
+            "Trade result marked: %s %s win=%s", self._actions.names[self._action_codes[i]], ticker, is_win
+        )
+
+    def _record_result(self, row: int, is_win: bool) -> None:
+        """Push the trade result for decision ``row`` into the rolling win-rate window."""
+        if len(self._recent_wins) == self._recent_wins.maxlen and self._recent_wins[0][1]:
+            self._recent_win_count -= 1  # about to be evicted by append
+        self._recent_wins.append((row, is_win))
+        if is_win:
+            self._recent_win_count += 1
+
+    @_cached_metric
+    def _column_scan(self) -> dict:
+        """Single fused pass over the report columns, shared by the metrics that need one.
+
+        Returns per-name action, verdict and debate outcome counts plus the
+        BUY/SELL position sizes; memoized, so a full report reads each
+        column once.
+        """
+        head, n = self._head, self._n
+        action_counts, verdict_counts, debate_counts, trade_sizes = column_scan(
+            self._action_codes[head:n],
+            self._verdict_codes[head:n],
+            self._debate_codes[head:n],
+            self._position_size[head:n],
+            len(self._actions.names),
+            len(self._verdicts.names),
+            len(self._debate_outcomes.names),
+            _SELL,
+        )
+
+        def named(counts: np.ndarray, codebook: _Codebook) -> dict[str, int]:
+            return {codebook.names[code]: int(count) for code, count in enumerate(counts) if count}
+
+        return {
+            "actions": named(action_counts, self._actions),
+            "verdicts": named(verdict_counts, self._verdicts),
+            "debate_outcomes": named(debate_counts, self._debate_outcomes),
+            "trade_sizes": trade_sizes,
+        }
 
     # ------------------------------------------------------------------
     # Metrics
     # ------------------------------------------------------------------
 
+    @_cached_metric
     def veto_rate(self) -> dict:
         """Wasden verdict distribution: % VETO vs APPROVE vs NEUTRAL."""
-        if not self._decisions:
+        if not self._total:
             return {"veto": 0.0, "approve": 0.0, "neutral": 0.0, "total": 0}
 
-        verdicts = Counter(d.wasden_verdict for d in self._decisions)
-        total = len(self._decisions)
+        verdicts = self._column_scan()["verdicts"]
+        total = self._total
         return {
             "veto": round(verdicts.get("VETO", 0) / total, 4),
             "approve": round(verdicts.get("APPROVE", 0) / total, 4),
             "neutral": round(verdicts.get("NEUTRAL", 0) / total, 4),
             "total": total,
-            "counts": dict(verdicts),
+            "counts": verdicts,
         }
 
+    @_cached_metric
     def quant_wasden_agreement(self) -> dict:
         """How often the quant composite direction agrees with Wasden verdict.
 
         Agreement: quant > 0.5 + APPROVE, or quant < 0.5 + VETO.
         """
-        if not self._decisions:
+        if not self._total:
             return {"agreement_rate": 0.0, "total": 0}
 
-        agreements = 0
-        evaluated = 0
-        for d in self._decisions:
-            if d.wasden_verdict not in ("APPROVE", "VETO"):
-                continue
-            evaluated += 1
-            quant_bullish = d.quant_composite > 0.5
-            wasden_bullish = d.wasden_verdict == "APPROVE"
-            if quant_bullish == wasden_bullish:
-                agreements += 1
-
+        agreements = self._agreements
+        evaluated = self._agreement_evaluated
         rate = agreements / evaluated if evaluated > 0 else 0.0
         return {
             "agreement_rate": round(rate, 4),
@@ -160,14 +744,14 @@ class BiasMonitor:
             "total": evaluated,
         }
 
+    @_cached_metric
     def sector_concentration(self) -> dict:
         """Distribution of BUY decisions across sectors."""
-        buy_decisions = [d for d in self._decisions if d.action == "BUY" and d.sector]
-        if not buy_decisions:
+        sector_counts = self._buy_sector_counts
+        total = self._buy_sector_total
+        if not total:
             return {"sectors": {}, "total_buys": 0, "max_sector_pct": 0.0}
 
-        sector_counts = Counter(d.sector for d in buy_decisions)
-        total = len(buy_decisions)
         sector_pcts = {s: round(c / total, 4) for s, c in sector_counts.items()}
         max_pct = max(sector_pcts.values()) if sector_pcts else 0.0
 
@@ -179,22 +763,29 @@ class BiasMonitor:
             "max_sector": max(sector_counts, key=sector_counts.get) if sector_counts else "",
         }
 
+    @_cached_metric
     def model_agreement_trend(self) -> dict:
         """Trend of quant model std_dev across decisions over time.
 
         High std_dev = high disagreement among models.
         """
-        if not self._decisions:
+        n = self._total
+        if not n:
             return {"mean_std_dev": 0.0, "trend": "stable", "values": []}
 
-        std_devs = [d.quant_std_dev for d in self._decisions]
-        mean_std = sum(std_devs) / len(std_devs)
+        # Range sums over the retained rows [head, head + n)
+        head = self._head
+        cumsum = self._std_dev_cumsum
+        base = float(cumsum[head - 1]) if head else 0.0
+        total_std = float(cumsum[head + n - 1]) - base
+        mean_std = total_std / n
 
         # Simple trend: compare first half to second half
-        if len(std_devs) >= 4:
-            mid = len(std_devs) // 2
-            first_half_mean = sum(std_devs[:mid]) / mid
-            second_half_mean = sum(std_devs[mid:]) / (len(std_devs) - mid)
+        if n >= 4:
+            mid = n // 2
+            first_half_sum = float(cumsum[head + mid - 1]) - base
+            first_half_mean = first_half_sum / mid
+            second_half_mean = (total_std - first_half_sum) / (n - mid)
             if second_half_mean > first_half_mean * 1.1:
                 trend = "increasing"
             elif second_half_mean < first_half_mean * 0.9:
@@ -204,92 +795,99 @@ class BiasMonitor:
         else:
             trend = "insufficient_data"
 
-        # Count high-disagreement flags
-        high_disagreement_count = sum(1 for s in std_devs if s > 0.5)
+        high_disagreement_count = self._high_disagreement_count
 
         return {
             "mean_std_dev": round(mean_std, 4),
             "trend": trend,
             "high_disagreement_count": high_disagreement_count,
-            "high_disagreement_rate": round(
-                high_disagreement_count / len(std_devs), 4
-            ) if std_devs else 0.0,
-            "total": len(std_devs),
+            "high_disagreement_rate": round(high_disagreement_count / n, 4),
+            "total": n,
         }
 
+    @_cached_metric
     def debate_outcome_distribution(self) -> dict:
         """Percentage of debates ending in agreement vs disagreement."""
-        debates = [d for d in self._decisions if d.debate_outcome]
-        if not debates:
+        outcomes = dict(self._column_scan()["debate_outcomes"])
+        outcomes.pop("", None)  # no debate recorded
+        total = sum(outcomes.values())
+        if not total:
             return {"agreement": 0.0, "disagreement": 0.0, "total": 0}
 
-        outcomes = Counter(d.debate_outcome for d in debates)
-        total = len(debates)
         return {
             "agreement": round(outcomes.get("agreement", 0) / total, 4),
             "disagreement": round(outcomes.get("disagreement", 0) / total, 4),
             "total": total,
-            "counts": dict(outcomes),
+            "counts": outcomes,
         }
 
+    @_cached_metric
     def jury_escalation_rate(self) -> dict:
         """Percentage of jury sessions that escalate (5-5 ties)."""
-        jury_sessions = [d for d in self._decisions if d.jury_spawned]
-        if not jury_sessions:
+        total = self._jury_spawned_count
+        if not total:
             return {"escalation_rate": 0.0, "escalated": 0, "total_jury_sessions": 0}
 
-        escalated = sum(1 for d in jury_sessions if d.jury_escalated)
-        total = len(jury_sessions)
+        escalated = self._jury_escalated_count
         return {
             "escalation_rate": round(escalated / total, 4),
             "escalated": escalated,
             "total_jury_sessions": total,
         }
 
+    @_cached_metric
     def action_distribution(self) -> dict:
         """Percentage breakdown: BUY / SELL / HOLD / BLOCKED / ESCALATED."""
-        if not self._decisions:
+        if not self._total:
             return {"distribution": {}, "total": 0}
 
-        counts = Counter(d.action for d in self._decisions)
-        total = len(self._decisions)
+        counts = self._column_scan()["actions"]
+        total = self._total
         pcts = {action: round(count / total, 4) for action, count in counts.items()}
         return {
             "distribution": pcts,
-            "counts": dict(counts),
+            "counts": counts,
             "total": total,
         }
 
+    @_cached_metric
     def position_size_distribution(self) -> dict:
         """Statistics on recommended position sizes for BUY/SELL decisions."""
-        sizes = [
-            d.recommended_position_size
-            for d in self._decisions
-            if d.action in ("BUY", "SELL") and d.recommended_position_size > 0
-        ]
-        if not sizes:
+        sizes = self._column_scan()["trade_sizes"]
+        n = sizes.size
+        if not n:
             return {"mean": 0.0, "median": 0.0, "min": 0.0, "max": 0.0, "std_dev": 0.0, "count": 0}
 
-        sizes_sorted = sorted(sizes)
-        n = len(sizes_sorted)
-        mean = sum(sizes_sorted) / n
-        median = (
-            sizes_sorted[n // 2]
-            if n % 2 == 1
-            else (sizes_sorted[n // 2 - 1] + sizes_sorted[n // 2]) / 2
-        )
-        variance = sum((s - mean) ** 2 for s in sizes_sorted) / n if n > 1 else 0.0
-        std_dev = math.sqrt(variance)
+        # One O(N) selection pass (in place; the scan output is a fresh array
+        # used only here) places
+        # min, the middle element(s), and max at their sorted positions
+        lo, hi = (n - 1) // 2, n // 2
+        sizes.partition((0, lo, hi, n - 1))
+        median = float(sizes[hi]) if lo == hi else (float(sizes[lo]) + float(sizes[hi])) / 2
 
         return {
-            "mean": round(mean, 6),
+            "mean": round(self._size_mean, 6),
             "median": round(median, 6),
-            "min": round(sizes_sorted[0], 6),
-            "max": round(sizes_sorted[-1], 6),
-            "std_dev": round(std_dev, 6),
-            "count": n,
+            "min": round(float(sizes[0]), 6),
+            "max": round(float(sizes[-1]), 6),
+            "std_dev": round(math.sqrt(self._size_m2 / self._size_n), 6),
+            "count": self._size_n,
         }
 
+    # Alert fast paths: O(1) reads of the running counters, rounded like the
+    # corresponding metric fields so alerts fire on identical values
+
+    def _veto_fraction(self) -> float:
+        return round(self._veto_count / self._total, 4)
+
+    def _max_sector_fraction(self) -> tuple[str, float]:
+        counts = self._buy_sector_counts
+        max_sector = max(counts, key=counts.get)
+        return max_sector, round(counts[max_sector] / self._buy_sector_total, 4)
+
+    def _jury_escalation_fraction(self) -> float:
+        return round(self._jury_escalated_count / self._jury_spawned_count, 4)
+
     # ------------------------------------------------------------------
     # Reports and Alerts
     # ------------------------------------------------------------------
@@ -301,8 +899,8 @@ class BiasMonitor:
             Dict with all bias metrics suitable for weekly report.
         """
         return {
-            "generated_at": datetime.utcnow().isoformat() + "Z",
-            "total_decisions": len(self._decisions),
+            "generated_at": _now_iso(),
+            "total_decisions": self._total,
             "veto_rate": self.veto_rate(),
             "quant_wasden_agreement": self.quant_wasden_agreement(),
             "sector_concentration": self.sector_concentration(),
@@ -322,10 +920,13 @@ class BiasMonitor:
         """
         alerts: list[str] = []
 
+        # Each check tests its data-sufficiency gate against the running
+        # counters first and reads only the fraction it needs, without
+        # building the full metric dicts
+
         # Veto rate alerts
-        veto = self.veto_rate()
-        veto_pct = veto.get("veto", 0.0)
-        if veto["total"] >= 5:  # Only alert with enough data
+        if self._total >= 5:  # Only alert with enough data
+            veto_pct = self._veto_fraction()
             if veto_pct > VETO_RATE_TOO_RESTRICTIVE:
                 alerts.append(
                     f"ALERT: Wasden veto rate {veto_pct:.1%} exceeds {VETO_RATE_TOO_RESTRICTIVE:.0%} "
@@ -338,28 +939,27 @@ class BiasMonitor:
                 )
 
         # Sector concentration alert
-        sector = self.sector_concentration()
-        if sector["total_buys"] >= 5 and sector["max_sector_pct"] > SECTOR_CONCENTRATION_LIMIT:
-            alerts.append(
-                f"ALERT: Sector '{sector['max_sector']}' accounts for "
-                f"{sector['max_sector_pct']:.1%} of BUY decisions "
-                f"(limit: {SECTOR_CONCENTRATION_LIMIT:.0%})"
-            )
+        if self._buy_sector_total >= 5:
+            max_sector, max_sector_pct = self._max_sector_fraction()
+            if max_sector_pct > SECTOR_CONCENTRATION_LIMIT:
+                alerts.append(
+                    f"ALERT: Sector '{max_sector}' accounts for "
+                    f"{max_sector_pct:.1%} of BUY decisions "
+                    f"(limit: {SECTOR_CONCENTRATION_LIMIT:.0%})"
+                )
 
         # Jury escalation alert
-        jury = self.jury_escalation_rate()
-        if jury["total_jury_sessions"] >= 3 and jury["escalation_rate"] > ESCALATION_RATE_LIMIT:
-            alerts.append(
-                f"ALERT: Jury escalation rate {jury['escalation_rate']:.1%} exceeds "
-                f"{ESCALATION_RATE_LIMIT:.0%} — system reaching too many 5-5 ties"
-            )
+        if self._jury_spawned_count >= 3:
+            escalation_rate = self._jury_escalation_fraction()
+            if escalation_rate > ESCALATION_RATE_LIMIT:
+                alerts.append(
+                    f"ALERT: Jury escalation rate {escalation_rate:.1%} exceeds "
+                    f"{ESCALATION_RATE_LIMIT:.0%} — system reaching too many 5-5 ties"
+                )
 
-        # Win rate alert (rolling 30-day window)
-        resolved = [d for d in self._decisions if d.is_win is not None]
-        if len(resolved) >= 10:
-            recent = resolved[-30:]
-            wins = sum(1 for d in recent if d.is_win)
-            win_rate = wins / len(recent)
+        # Win rate alert (rolling window of the last 30 trade results on retained decisions)
+        if len(self._recent_wins) >= 10:
+            win_rate = self._recent_win_count / len(self._recent_wins)
             if win_rate < WIN_RATE_FLOOR:
                 alerts.append(
                     f"ALERT: Rolling 30-decision win rate {win_rate:.1%} "
@@ -381,4 +981,4 @@ class BiasMonitor:
     @property
     def decisions(self) -> list[DecisionSnapshot]:
         """All ingested decisions."""
-        return list(self._decisions)
+        return list(map(self._snapshot, range(self._head, self._n)))
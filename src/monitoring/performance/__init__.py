@@ -1,5 +1,5 @@
 """Performance tracking for paper trading."""
 
-from .performance_tracker import PerformanceTracker
+from .performance_tracker import PerformanceTracker, as_display_dict
 
-__all__ = ["PerformanceTracker"]
+__all__ = ["PerformanceTracker", "as_display_dict"]
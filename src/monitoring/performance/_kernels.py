@@ -0,0 +1,123 @@
+"""Single-pass metric kernels for paper-trading performance tracking.
+
+Uses Numba-compiled loops for long trade histories when ``numba`` is
+installed; otherwise (and for short histories, where JIT dispatch overhead
+dominates) falls back to vectorized NumPy expressions.
+"""
+
+import numpy as np
+
+# ---------------------------------------------------------------------------
+# Optional Numba import — graceful degradation when not installed
+# ---------------------------------------------------------------------------
+try:
+    from numba import njit
+
+    _NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    njit = None  # type: ignore[assignment]
+    _NUMBA_AVAILABLE = False
+
+# Below this many trades the NumPy path is faster than a compiled kernel call
+_NUMBA_MIN_SIZE = 1024
+
+
+def _return_moments_numpy(returns, daily_rf):
+    mean = float(returns.mean())
+    dev = returns - mean
+    excess = returns - daily_rf
+    downside = excess[excess < 0]
+    return mean, float(np.dot(dev, dev)), downside.shape[0], float(np.dot(downside, downside))
+
+
+def _max_drawdown_numpy(returns):
+    # Equity after each trade and its running peak, both built in place; the
+    # curve implicitly starts at 1.0, so peaks are floored at 1
+    equity = 1.0 + returns
+    np.cumprod(equity, out=equity)
+    peaks = np.maximum.accumulate(equity)
+    np.maximum(peaks, 1.0, out=peaks)
+    drawdowns = peaks - equity
+    drawdowns /= peaks
+
+    worst = int(drawdowns.argmax())
+    max_dd = float(drawdowns[worst])
+    if max_dd <= 0.0:
+        return 0.0, 0
+
+    # Duration runs from the most recent peak at or before the trough, counted
+    # in trades; the starting capital (before trade 0) is peak position 0
+    hits = np.flatnonzero(equity[: worst + 1] == peaks[: worst + 1])
+    peak_pos = int(hits[-1]) + 1 if hits.size else 0
+    return max_dd, worst + 1 - peak_pos
+
+
+if _NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _return_moments_numba(returns, daily_rf):  # pragma: no cover - compiled
+        mean = 0.0
+        m2 = 0.0
+        downside_n = 0
+        downside_sq = 0.0
+        for i in range(returns.shape[0]):
+            # Welford update
+            delta = returns[i] - mean
+            mean += delta / (i + 1)
+            m2 += delta * (returns[i] - mean)
+            excess = returns[i] - daily_rf
+            if excess < 0:
+                downside_n += 1
+                downside_sq += excess * excess
+        return mean, m2, downside_n, downside_sq
+
+    @njit(cache=True)
+    def _max_drawdown_numba(returns):  # pragma: no cover - compiled
+        equity = 1.0
+        peak = 1.0
+        peak_idx = 0
+        max_dd = 0.0
+        max_dd_duration = 0
+        for i in range(returns.shape[0]):
+            equity *= 1.0 + returns[i]
+            if equity >= peak:
+                peak = equity
+                peak_idx = i + 1
+            dd = (peak - equity) / peak
+            if dd > max_dd:
+                max_dd = dd
+                max_dd_duration = i + 1 - peak_idx
+        return max_dd, max_dd_duration
+
+
+def return_moments(returns: np.ndarray, daily_rf: float) -> tuple[float, float, int, float]:
+    """Mean, M2 and downside statistics of a non-empty return series.
+
+    Args:
+        returns: Per-trade returns.
+        daily_rf: Per-period risk-free rate defining the downside threshold.
+
+    Returns:
+        Tuple of (mean, sum of squared deviations from the mean, count of
+        returns below ``daily_rf``, sum of their squared shortfalls).
+    """
+    if _NUMBA_AVAILABLE and returns.shape[0] >= _NUMBA_MIN_SIZE:
+        mean, m2, downside_n, downside_sq = _return_moments_numba(returns, float(daily_rf))
+        return float(mean), float(m2), int(downside_n), float(downside_sq)
+    return _return_moments_numpy(returns, daily_rf)
+
+
+def max_drawdown(returns: np.ndarray) -> tuple[float, int]:
+    """Maximum drawdown of the compounded equity curve and its duration.
+
+    Args:
+        returns: Per-trade returns (non-empty).
+
+    Returns:
+        Tuple of (max drawdown as a fraction of the peak, number of trades
+        from that peak to the trough).
+    """
+    if _NUMBA_AVAILABLE and returns.shape[0] >= _NUMBA_MIN_SIZE:
+        max_dd, duration = _max_drawdown_numba(returns)
+        return float(max_dd), int(duration)
+    return _max_drawdown_numpy(returns)
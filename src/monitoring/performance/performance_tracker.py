@@ -6,16 +6,141 @@ Metric formulas follow PROJECT_STANDARDS_v2.md Sections 7-8 and ensemble_method_
 
 import logging
 import math
+import time
+from collections import Counter
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional, Sequence
+
+import numpy as np
+
+from ._kernels import max_drawdown, return_moments
 
 logger = logging.getLogger("wasden_watch.monitoring.performance")
 
+_INITIAL_CAPACITY = 256
+
+# Shared read-only default for missing journal sections (no per-call dict allocation)
+_EMPTY: Mapping = MappingProxyType({})
+
+# Display precision for ratio-style metrics; every other float shows 6 digits
+_DISPLAY_DIGITS = {
+    "sharpe_ratio": 4,
+    "sortino_ratio": 4,
+    "win_rate": 4,
+    "loss_rate": 4,
+    "profit_factor": 4,
+    "beta": 4,
+    "information_ratio": 4,
+    "rolling_sharpe": 4,
+    "rolling_win_rate": 4,
+}
+
+
+def as_display_dict(metrics: dict, ndigits: int = 6) -> dict:
+    """Round a metrics dict for display (dashboards, HTTP responses).
+
+    The tracker's metric methods return full-precision floats; rounding is
+    applied only here. Ratio-style metrics keep 4 digits, other floats
+    ``ndigits``; infinite values become ``"inf"``/``"-inf"`` (valid JSON).
+
+    Args:
+        metrics: Dict from ``calculate_returns``, ``vs_benchmark`` or
+            ``rolling_metrics``.
+        ndigits: Digits for metrics without a ratio-style precision.
+
+    Returns:
+        New dict with the same keys and display-ready values.
+    """
+    display = {}
+    for key, value in metrics.items():
+        if isinstance(value, float):
+            if math.isinf(value):
+                value = "inf" if value > 0 else "-inf"
+            else:
+                value = round(value, _DISPLAY_DIGITS.get(key, ndigits))
+        display[key] = value
+    return display
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as ``YYYY-MM-DDTHH:MM:SS.ffffffZ``.
+
+    Formatted from ``time.gmtime`` directly, without allocating a datetime.
+    """
+    ns = time.time_ns()
+    seconds, remainder = divmod(ns, 1_000_000_000)
+    t = time.gmtime(seconds)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}T"
+        f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{remainder // 1000:06d}Z"
+    )
+
+
+@dataclass(frozen=True)
+class _Moments:
+    """First and second moments of a return series (and optionally a benchmark).
 
-@dataclass
+    ``*_m2`` and ``cov_m`` are sums of squared / cross deviations from the
+    mean, so e.g. the sample variance is ``m2 / (n - 1)``.
+    """
+
+    n: int
+    mean: float
+    m2: float
+    downside_n: int = 0  # excess returns (vs daily_rf) below zero
+    downside_sq: float = 0.0  # sum of their squares
+    bench_mean: float = 0.0
+    bench_m2: float = 0.0
+    cov_m: float = 0.0
+    excess_mean: float = 0.0  # mean of returns - bench
+    excess_m2: float = 0.0
+
+
+def _streaming_moments(
+    returns: np.ndarray, bench: Optional[np.ndarray] = None, daily_rf: float = 0.0
+) -> _Moments:
+    """Compute every moment the risk metrics need from one traversal of the data.
+
+    Args:
+        returns: Per-trade returns.
+        bench: Benchmark returns aligned with ``returns`` (same length), if any.
+        daily_rf: Per-period risk-free rate defining the downside threshold.
+
+    Returns:
+        _Moments for the series (benchmark fields zero when ``bench`` is None).
+    """
+    n = returns.shape[0]
+    if n == 0:
+        return _Moments(0, 0.0, 0.0)
+    if bench is None:
+        return _Moments(n, *return_moments(returns, daily_rf))
+
+    mean = float(returns.mean())
+    dev = returns - mean
+    excess_rf = returns - daily_rf
+    downside = excess_rf[excess_rf < 0]
+    bench_mean = float(bench.mean())
+    bench_dev = bench - bench_mean
+    # (returns - bench) deviates from its mean by dev - bench_dev
+    excess_dev = dev - bench_dev
+    return _Moments(
+        n,
+        mean,
+        float(np.dot(dev, dev)),
+        downside.shape[0],
+        float(np.dot(downside, downside)),
+        bench_mean,
+        float(np.dot(bench_dev, bench_dev)),
+        float(np.dot(dev, bench_dev)),
+        mean - bench_mean,
+        float(np.dot(excess_dev, excess_dev)),
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class TradeRecord:
-    """A single completed trade."""
+    """A single completed trade. ``pnl``/``pnl_pct`` are computed by ``record_trade``."""
 
     ticker: str
     action: str  # BUY or SELL
@@ -26,16 +151,8 @@ class TradeRecord:
     pnl: float = 0.0
     pnl_pct: float = 0.0
 
-    def __post_init__(self) -> None:
-        if self.entry_price > 0:
-            if self.action == "BUY":
-                self.pnl_pct = (self.exit_price - self.entry_price) / self.entry_price
-            else:  # SELL (short)
-                self.pnl_pct = (self.entry_price - self.exit_price) / self.entry_price
-            self.pnl = self.pnl_pct * self.position_size
-
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DecisionRecord:
     """A pipeline decision (any action, not just completed trades)."""
 
@@ -68,9 +185,36 @@ class PerformanceTracker:
             initial_capital: Starting portfolio value in USD.
         """
         self._trades: list[TradeRecord] = []
+        # Column (SoA) copy of each trade's pnl_pct in record order, grown by
+        # doubling; rows [0, _n) are valid. Metrics scan this contiguous
+        # float64 column; _trades is kept for auditing and recent-trade display.
+        self._pnl = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._n = 0
+        # Bumped on every record_trade; calculate_returns reuses its result while unchanged
+        self._trade_version: int = 0
+        self._cached_returns: Optional[tuple[int, dict]] = None
         self._decisions: list[DecisionRecord] = []
+        self._action_counts: Counter[str] = Counter()
         self._risk_free_rate = risk_free_rate
         self._initial_capital = initial_capital
+
+        # Running aggregates over all trades, updated in O(1) per record_trade
+        # so calculate_returns never rescans the history.
+        self._equity = 1.0
+        self._peak_equity = 1.0
+        self._peak_idx = 0  # equity-curve index of the current peak
+        self._max_dd = 0.0
+        self._max_dd_duration = 0
+        self._pnl_mean = 0.0  # Welford mean / M2 of pnl_pct
+        self._pnl_m2 = 0.0
+        self._downside_n = 0  # trades with pnl_pct below the daily risk-free rate
+        self._downside_sq = 0.0
+        self._win_count = 0
+        self._loss_count = 0
+        self._gross_profit = 0.0
+        self._gross_loss = 0.0  # sum of losing pnl_pct (<= 0)
+        self._best = -math.inf
+        self._worst = math.inf
         logger.info(
             "PerformanceTracker initialized: initial_capital=%.2f, risk_free_rate=%.4f",
             initial_capital,
@@ -103,7 +247,12 @@ class PerformanceTracker:
         Returns:
             The created TradeRecord.
         """
-        ts = timestamp or (datetime.utcnow().isoformat() + "Z")
+        ts = timestamp or _utc_now_iso()
+        if entry_price > 0:
+            sign = 1.0 if action == "BUY" else -1.0  # SELL is a short
+            pnl_pct = sign * (exit_price - entry_price) / entry_price
+        else:
+            pnl_pct = 0.0
         trade = TradeRecord(
             ticker=ticker,
             action=action,
@@ -111,8 +260,16 @@ class PerformanceTracker:
             exit_price=exit_price,
             position_size=position_size,
             timestamp=ts,
+            pnl=pnl_pct * position_size,
+            pnl_pct=pnl_pct,
         )
+        if self._n == self._pnl.shape[0]:
+            self._grow()
+        self._pnl[self._n] = pnl_pct
+        self._n += 1
         self._trades.append(trade)
+        self._update_running(trade.pnl_pct)
+        self._trade_version += 1
         logger.info(
             "Trade recorded: %s %s entry=%.2f exit=%.2f pnl_pct=%.4f",
             action,
@@ -133,16 +290,16 @@ class PerformanceTracker:
         Returns:
             The created DecisionRecord.
         """
-        final = journal_entry.get("final_decision", {})
-        quant = journal_entry.get("quant_scores", {})
-        wasden = journal_entry.get("wasden_verdict", {})
-        jury = journal_entry.get("jury", {})
-        debate = journal_entry.get("debate_result", {})
+        final = journal_entry.get("final_decision", _EMPTY)
+        quant = journal_entry.get("quant_scores", _EMPTY)
+        wasden = journal_entry.get("wasden_verdict", _EMPTY)
+        jury = journal_entry.get("jury", _EMPTY)
+        debate = journal_entry.get("debate_result", _EMPTY)
 
         record = DecisionRecord(
             ticker=journal_entry.get("ticker", ""),
             action=final.get("action", "HOLD"),
-            timestamp=journal_entry.get("timestamp", datetime.utcnow().isoformat() + "Z"),
+            timestamp=journal_entry["timestamp"] if "timestamp" in journal_entry else _utc_now_iso(),
             pipeline_run_id=journal_entry.get("pipeline_run_id", ""),
             quant_composite=quant.get("composite", 0.0),
             quant_std_dev=quant.get("std_dev", 0.0),
@@ -154,6 +311,7 @@ class PerformanceTracker:
             debate_outcome=debate.get("outcome", ""),
         )
         self._decisions.append(record)
+        self._action_counts[record.action] += 1
         logger.info(
             "Decision recorded: %s %s (pipeline_run_id=%s)",
             record.action,
@@ -172,65 +330,72 @@ class PerformanceTracker:
         Returns:
             Dict with total_return, annualized_return, sharpe_ratio, sortino_ratio,
             max_drawdown, max_drawdown_duration, win_rate, loss_rate, profit_factor,
-            average_win, average_loss, best_trade, worst_trade, trade_count.
+            average_win, average_loss, best_trade, worst_trade, trade_count, at
+            full precision (see ``as_display_dict``). The dict is cached until
+            the next trade and must not be mutated.
         """
+        if self._cached_returns and self._cached_returns[0] == self._trade_version:
+            return self._cached_returns[1]
+        returns = self._compute_returns()
+        self._cached_returns = (self._trade_version, returns)
+        return returns
+
+    def _compute_returns(self) -> dict:
+        """Derive calculate_returns' metrics from the running aggregates in O(1)."""
         if not self._trades:
             return self._empty_returns()
 
-        pnls = [t.pnl_pct for t in self._trades]
-        wins = [p for p in pnls if p > 0]
-        losses = [p for p in pnls if p < 0]
+        n = self._n
 
         # Cumulative return (compounded)
-        cumulative = 1.0
-        for p in pnls:
-            cumulative *= (1.0 + p)
-        total_return = cumulative - 1.0
+        total_return = self._equity - 1.0
 
         # Annualized return
-        annualized_return = self._annualize_return(total_return, len(pnls))
+        annualized_return = self._annualize_return(total_return, n)
+
+        moments = _Moments(n, self._pnl_mean, self._pnl_m2, self._downside_n, self._downside_sq)
 
         # Sharpe ratio (annualized)
-        sharpe = self._sharpe_ratio(pnls)
+        sharpe = self._sharpe_from_moments(moments)
 
         # Sortino ratio (annualized, downside deviation only)
-        sortino = self._sortino_ratio(pnls)
+        sortino = self._sortino_from_moments(moments)
 
         # Drawdown
-        max_dd, max_dd_duration = self._max_drawdown(pnls)
+        max_dd, max_dd_duration = self._max_dd, self._max_dd_duration
 
         # Win/loss rates
-        win_rate = len(wins) / len(pnls) if pnls else 0.0
-        loss_rate = len(losses) / len(pnls) if pnls else 0.0
+        win_rate = self._win_count / n
+        loss_rate = self._loss_count / n
 
         # Profit factor
-        gross_profit = sum(wins) if wins else 0.0
-        gross_loss = abs(sum(losses)) if losses else 0.0
+        gross_profit = self._gross_profit
+        gross_loss = abs(self._gross_loss)
         profit_factor = (gross_profit / gross_loss) if gross_loss > 0 else float("inf") if gross_profit > 0 else 0.0
 
         # Averages
-        average_win = (sum(wins) / len(wins)) if wins else 0.0
-        average_loss = (sum(losses) / len(losses)) if losses else 0.0
+        average_win = (self._gross_profit / self._win_count) if self._win_count else 0.0
+        average_loss = (self._gross_loss / self._loss_count) if self._loss_count else 0.0
 
         # Best and worst
-        best_trade = max(pnls)
-        worst_trade = min(pnls)
+        best_trade = self._best
+        worst_trade = self._worst
 
         return {
-            "total_return": round(total_return, 6),
-            "annualized_return": round(annualized_return, 6),
-            "sharpe_ratio": round(sharpe, 4),
-            "sortino_ratio": round(sortino, 4),
-            "max_drawdown": round(max_dd, 6),
+            "total_return": total_return,
+            "annualized_return": annualized_return,
+            "sharpe_ratio": sharpe,
+            "sortino_ratio": sortino,
+            "max_drawdown": max_dd,
             "max_drawdown_duration": max_dd_duration,
-            "win_rate": round(win_rate, 4),
-            "loss_rate": round(loss_rate, 4),
-            "profit_factor": round(profit_factor, 4) if profit_factor != float("inf") else "inf",
-            "average_win": round(average_win, 6),
-            "average_loss": round(average_loss, 6),
-            "best_trade": round(best_trade, 6),
-            "worst_trade": round(worst_trade, 6),
-            "trade_count": len(pnls),
+            "win_rate": win_rate,
+            "loss_rate": loss_rate,
+            "profit_factor": profit_factor,
+            "average_win": average_win,
+            "average_loss": average_loss,
+            "best_trade": best_trade,
+            "worst_trade": worst_trade,
+            "trade_count": n,
         }
 
     def vs_benchmark(self, benchmark_returns: list[float]) -> dict:
@@ -240,44 +405,41 @@ class PerformanceTracker:
             benchmark_returns: List of benchmark period returns aligned with trade returns.
 
         Returns:
-            Dict with alpha, beta, tracking_error, information_ratio.
+            Dict with alpha, beta, tracking_error, information_ratio at full
+            precision (see ``as_display_dict``).
         """
-        portfolio_returns = [t.pnl_pct for t in self._trades]
-
-        if not portfolio_returns or not benchmark_returns:
+        if not self._n or not benchmark_returns:
             return {"alpha": 0.0, "beta": 0.0, "tracking_error": 0.0, "information_ratio": 0.0}
 
+        portfolio_returns = self._pnls()
+
         # Align lengths (use shorter of the two)
         n = min(len(portfolio_returns), len(benchmark_returns))
-        port = portfolio_returns[:n]
-        bench = benchmark_returns[:n]
+        m = _streaming_moments(
+            portfolio_returns[:n], np.asarray(benchmark_returns[:n], dtype=np.float64)
+        )
 
         # Beta = Cov(port, bench) / Var(bench)
-        port_mean = sum(port) / n
-        bench_mean = sum(bench) / n
-
-        cov = sum((p - port_mean) * (b - bench_mean) for p, b in zip(port, bench)) / n
-        bench_var = sum((b - bench_mean) ** 2 for b in bench) / n
+        cov = m.cov_m / n
+        bench_var = m.bench_m2 / n
 
         beta = (cov / bench_var) if bench_var > 0 else 0.0
 
         # Alpha = port_mean - beta * bench_mean (single-period)
-        alpha = port_mean - beta * bench_mean
+        alpha = m.mean - beta * m.bench_mean
 
         # Tracking error = std(port - bench)
-        excess = [p - b for p, b in zip(port, bench)]
-        excess_mean = sum(excess) / n
-        tracking_error_var = sum((e - excess_mean) ** 2 for e in excess) / n if n > 1 else 0.0
+        tracking_error_var = m.excess_m2 / n if n > 1 else 0.0
         tracking_error = math.sqrt(tracking_error_var)
 
         # Information ratio = excess_mean / tracking_error
-        information_ratio = (excess_mean / tracking_error) if tracking_error > 0 else 0.0
+        information_ratio = (m.excess_mean / tracking_error) if tracking_error > 0 else 0.0
 
         return {
-            "alpha": round(alpha, 6),
-            "beta": round(beta, 4),
-            "tracking_error": round(tracking_error, 6),
-            "information_ratio": round(information_ratio, 4),
+            "alpha": alpha,
+            "beta": beta,
+            "tracking_error": tracking_error,
+            "information_ratio": information_ratio,
         }
 
     def rolling_metrics(self, window_days: int = 30) -> dict:
@@ -287,27 +449,27 @@ class PerformanceTracker:
             window_days: Number of most recent trades to include in the window.
 
         Returns:
-            Dict with rolling_sharpe, rolling_win_rate, rolling_drawdown.
+            Dict with rolling_sharpe, rolling_win_rate, rolling_drawdown,
+            window_size, at full precision (see ``as_display_dict``).
         """
-        if not self._trades:
+        if not self._n:
             return {"rolling_sharpe": 0.0, "rolling_win_rate": 0.0, "rolling_drawdown": 0.0}
 
-        # Use last N trades as the window
-        window_trades = self._trades[-window_days:]
-        pnls = [t.pnl_pct for t in window_trades]
+        # Use last N trades as the window: a view onto the pnl column, no copy
+        # and no TradeRecord access
+        pnls = self._pnls()[-window_days:]
 
-        rolling_sharpe = self._sharpe_ratio(pnls)
+        rolling_sharpe = self._sharpe_from_moments(_streaming_moments(pnls))
 
-        wins = [p for p in pnls if p > 0]
-        rolling_win_rate = len(wins) / len(pnls) if pnls else 0.0
+        rolling_win_rate = np.count_nonzero(pnls > 0) / pnls.shape[0]
 
         rolling_dd, _ = self._max_drawdown(pnls)
 
         return {
-            "rolling_sharpe": round(rolling_sharpe, 4),
-            "rolling_win_rate": round(rolling_win_rate, 4),
-            "rolling_drawdown": round(rolling_dd, 6),
-            "window_size": len(window_trades),
+            "rolling_sharpe": rolling_sharpe,
+            "rolling_win_rate": rolling_win_rate,
+            "rolling_drawdown": rolling_dd,
+            "window_size": pnls.shape[0],
         }
 
     def summary_report(self) -> dict:
@@ -317,8 +479,8 @@ class PerformanceTracker:
             Dict with returns, benchmark (empty until benchmark data provided),
             rolling metrics, trade statistics, and recent trades.
         """
-        returns = self.calculate_returns()
-        rolling = self.rolling_metrics()
+        returns = as_display_dict(self.calculate_returns())
+        rolling = as_display_dict(self.rolling_metrics())
 
         # Recent trades (last 10)
         recent = []
@@ -334,12 +496,10 @@ class PerformanceTracker:
             })
 
         # Decision distribution
-        action_counts: dict[str, int] = {}
-        for d in self._decisions:
-            action_counts[d.action] = action_counts.get(d.action, 0) + 1
+        action_counts = dict(self._action_counts)
 
         return {
-            "generated_at": datetime.utcnow().isoformat() + "Z",
+            "generated_at": _utc_now_iso(),
             "initial_capital": self._initial_capital,
             "risk_free_rate": self._risk_free_rate,
             "returns": returns,
@@ -354,88 +514,113 @@ class PerformanceTracker:
     # ------------------------------------------------------------------
 
     @property
-    def trades(self) -> list[TradeRecord]:
-        """All recorded trades."""
-        return list(self._trades)
+    def trades(self) -> Sequence[TradeRecord]:
+        """All recorded trades, as a read-only view (not a copy); see ``snapshot``."""
+        return self._trades
 
     @property
-    def decisions(self) -> list[DecisionRecord]:
-        """All recorded decisions."""
-        return list(self._decisions)
+    def decisions(self) -> Sequence[DecisionRecord]:
+        """All recorded decisions, as a read-only view (not a copy); see ``snapshot``."""
+        return self._decisions
+
+    def snapshot(self) -> tuple[list[TradeRecord], list[DecisionRecord]]:
+        """Owned copies of the recorded trades and decisions.
+
+        Returns:
+            Tuple of (trades, decisions) lists that later recording does not affect.
+        """
+        return list(self._trades), list(self._decisions)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _sharpe_ratio(self, returns: list[float]) -> float:
-        """Annualized Sharpe ratio.
+    def _pnls(self) -> np.ndarray:
+        """pnl_pct of every recorded trade, as a view onto the backing buffer."""
+        return self._pnl[: self._n]
+
+    def _grow(self) -> None:
+        """Double the pnl column's capacity, keeping the recorded rows."""
+        grown = np.empty(2 * self._pnl.shape[0], dtype=np.float64)
+        grown[: self._n] = self._pnl[: self._n]
+        self._pnl = grown
+
+    def _update_running(self, p: float) -> None:
+        """Fold one trade's pnl_pct into the running aggregates."""
+        n = self._n
+
+        # Equity curve, running peak and the deepest drawdown from a peak so far
+        self._equity *= 1.0 + p
+        if self._equity >= self._peak_equity:
+            self._peak_equity = self._equity
+            self._peak_idx = n
+        dd = (self._peak_equity - self._equity) / self._peak_equity
+        if dd > self._max_dd:
+            self._max_dd = dd
+            self._max_dd_duration = n - self._peak_idx
+
+        # Welford update
+        delta = p - self._pnl_mean
+        self._pnl_mean += delta / n
+        self._pnl_m2 += delta * (p - self._pnl_mean)
+        excess = p - self._risk_free_rate / 252.0
+        if excess < 0:
+            self._downside_n += 1
+            self._downside_sq += excess * excess
+
+        if p > 0:
+            self._win_count += 1
+            self._gross_profit += p
+        elif p < 0:
+            self._loss_count += 1
+            self._gross_loss += p
+        self._best = max(self._best, p)
+        self._worst = min(self._worst, p)
+
+    def _sharpe_from_moments(self, m: _Moments) -> float:
+        """Annualized Sharpe ratio from a series' moments.
 
         Sharpe = (mean_excess_return / std_dev) * sqrt(252)
         """
-        if len(returns) < 2:
+        if m.n < 2:
             return 0.0
 
-        daily_rf = self._risk_free_rate / 252.0
-        excess = [r - daily_rf for r in returns]
-        mean_excess = sum(excess) / len(excess)
-        variance = sum((r - mean_excess) ** 2 for r in excess) / (len(excess) - 1)
-        std_dev = math.sqrt(variance)
+        mean_excess = m.mean - self._risk_free_rate / 252.0
+        # Subtracting a constant rate leaves the deviations unchanged
+        std_dev = math.sqrt(m.m2 / (m.n - 1))
 
         if std_dev == 0:
             return 0.0
 
         return (mean_excess / std_dev) * math.sqrt(252)
 
-    def _sortino_ratio(self, returns: list[float]) -> float:
-        """Annualized Sortino ratio (uses downside deviation only)."""
-        if len(returns) < 2:
+    def _sortino_from_moments(self, m: _Moments) -> float:
+        """Annualized Sortino ratio from a series' moments (downside taken vs the daily risk-free rate)."""
+        if m.n < 2:
             return 0.0
 
-        daily_rf = self._risk_free_rate / 252.0
-        excess = [r - daily_rf for r in returns]
-        mean_excess = sum(excess) / len(excess)
+        mean_excess = m.mean - self._risk_free_rate / 252.0
 
         # Downside deviation: only negative excess returns
-        downside_sq = [e ** 2 for e in excess if e < 0]
-        if not downside_sq:
+        if not m.downside_n:
             return float("inf") if mean_excess > 0 else 0.0
 
-        downside_dev = math.sqrt(sum(downside_sq) / len(downside_sq))
+        downside_dev = math.sqrt(m.downside_sq / m.downside_n)
 
         if downside_dev == 0:
             return 0.0
 
         return (mean_excess / downside_dev) * math.sqrt(252)
 
-    def _max_drawdown(self, returns: list[float]) -> tuple[float, int]:
+    def _max_drawdown(self, returns: np.ndarray) -> tuple[float, int]:
         """Calculate maximum drawdown and its duration in number of trades.
 
         Returns:
             Tuple of (max_drawdown_pct, max_drawdown_duration_trades).
         """
-        if not returns:
+        if not returns.size:
             return 0.0, 0
-
-        # Build equity curve
-        equity = [1.0]
-        for r in returns:
-            equity.append(equity[-1] * (1.0 + r))
-
-        peak = equity[0]
-        max_dd = 0.0
-        max_dd_duration = 0
-        current_dd_start = 0
-
-        for i, value in enumerate(equity):
-            if value >= peak:
-                peak = value
-                current_dd_start = i
-            dd = (peak - value) / peak if peak > 0 else 0.0
-            if dd > max_dd:
-                max_dd = dd
-                max_dd_duration = i - current_dd_start
-
-        return max_dd, max_dd_duration
+        return max_drawdown(returns)
 
     def _annualize_return(self, total_return: float, num_trades: int) -> float:
         """Annualize total return assuming ~252 trading days per year."""
@@ -13,6 +13,12 @@ from src.pipeline.state import TradingState
 
 logger = logging.getLogger("wasden_watch.pipeline.arbiter")
 
+# Debate-agreement action policy: composite < _SELL_BELOW → SELL,
+# composite > _BUY_ABOVE → BUY, otherwise HOLD. Indexed by the bucket count.
+_SELL_BELOW = 0.4
+_BUY_ABOVE = 0.6
+_ACTION_BY_BUCKET = ("SELL", "HOLD", "BUY")
+
 
 class DecisionArbiter:
     """Combines all pipeline signals into a final trading decision.
@@ -49,7 +55,7 @@ class DecisionArbiter:
             )
             state.recommended_position_size = 0.0
             state.human_approval_required = False
-            logger.info(f"[{state.ticker}] BLOCKED by Wasden VETO")
+            logger.info("[%s] BLOCKED by Wasden VETO", state.ticker)
             return state
 
         # Rule 2: Jury escalation (5-5 tie) → ESCALATED
@@ -58,7 +64,7 @@ class DecisionArbiter:
             state.final_reason = "5-5 jury tie — escalated to human decision"
             state.recommended_position_size = 0.0
             state.human_approval_required = True
-            logger.info(f"[{state.ticker}] ESCALATED — 5-5 jury tie")
+            logger.info("[%s] ESCALATED — 5-5 jury tie", state.ticker)
             return state
 
         # Rule 3: Risk check failed → BLOCKED
@@ -68,7 +74,7 @@ class DecisionArbiter:
             state.final_reason = f"Risk check failed: {', '.join(failed)}"
             state.recommended_position_size = 0.0
             state.human_approval_required = False
-            logger.info(f"[{state.ticker}] BLOCKED by risk check: {failed}")
+            logger.info("[%s] BLOCKED by risk check: %s", state.ticker, failed)
             return state
 
         # Rule 4: Pre-trade validation failed → BLOCKED
@@ -78,7 +84,7 @@ class DecisionArbiter:
             state.final_reason = f"Pre-trade validation failed: {', '.join(failed)}"
             state.recommended_position_size = 0.0
             state.human_approval_required = False
-            logger.info(f"[{state.ticker}] BLOCKED by pre-trade validation: {failed}")
+            logger.info("[%s] BLOCKED by pre-trade validation: %s", state.ticker, failed)
             return state
 
         # Determine action from jury/debate result
@@ -94,9 +100,7 @@ class DecisionArbiter:
         # Rule 5: High disagreement → reduce by 50%
         if state.high_disagreement_flag:
             position_size *= 0.5
-            logger.info(
-                f"[{state.ticker}] High model disagreement — position reduced 50%"
-            )
+            logger.info("[%s] High model disagreement — position reduced 50%%", state.ticker)
 
         # Cap at MAX_POSITION_PCT
         position_size = min(position_size, MAX_POSITION_PCT)
@@ -107,8 +111,10 @@ class DecisionArbiter:
         state.human_approval_required = False
 
         logger.info(
-            f"[{state.ticker}] Decision: {action}, "
-            f"position_size={state.recommended_position_size:.4f}"
+            "[%s] Decision: %s, position_size=%.4f",
+            state.ticker,
+            action,
+            state.recommended_position_size,
         )
         return state
 
@@ -122,13 +128,10 @@ def _resolve_action(state: TradingState) -> str:
 
     # If debate reached agreement, use debate outcome
     if state.debate_agreed:
-        # Map agreement to BUY (if composite > 0.6), SELL (< 0.4), else HOLD
-        if state.quant_composite > 0.6:
-            return "BUY"
-        elif state.quant_composite < 0.4:
-            return "SELL"
-        else:
-            return "HOLD"
+        # Map agreement to BUY (if composite > 0.6), SELL (< 0.4), else HOLD.
+        # Two comparisons summed into a bucket index; `not <` keeps NaN at HOLD.
+        composite = state.quant_composite
+        return _ACTION_BY_BUCKET[(not composite < _SELL_BELOW) + (composite > _BUY_ABOVE)]
 
     return "HOLD"
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from backend.app.models.schemas import DebateOutcome
@@ -30,22 +31,44 @@ class AgreementDetector:
             (DebateOutcome.AGREEMENT, "BUY"/"SELL"/"HOLD") if agreed,
             (DebateOutcome.DISAGREEMENT, None) if they disagree.
         """
-        final_round = rounds[-1]
+        result = self._client.call_judge(AGREEMENT_SYSTEM_PROMPT, _user_prompt(ticker, rounds))
+        return _interpret(ticker, result)
 
-        user_prompt = AGREEMENT_USER_PROMPT.format(
-            ticker=ticker,
-            final_bull_argument=final_round.bull_argument,
-            final_bear_argument=final_round.bear_argument,
-        )
+    def evaluate_many(
+        self, debates: Sequence[tuple[str, list[DebateRound]]]
+    ) -> list[tuple[DebateOutcome, str | None]]:
+        """Evaluate a cohort of finished debates with one batched judge request.
 
-        result = self._client.call_judge(AGREEMENT_SYSTEM_PROMPT, user_prompt)
+        Args:
+            debates: (ticker, rounds) for each debate.
 
-        outcome_str = result.get("outcome", "disagreement").lower()
-        agreed_action = result.get("agreed_action")
+        Returns:
+            One (outcome, agreed_action) per debate, in input order, with the
+            same meaning as evaluate().
+        """
+        prompts = [_user_prompt(ticker, rounds) for ticker, rounds in debates]
+        results = self._client.call_judge_batch(AGREEMENT_SYSTEM_PROMPT, prompts)
+        return [_interpret(ticker, result) for (ticker, _), result in zip(debates, results)]
+
+
+def _user_prompt(ticker: str, rounds: list[DebateRound]) -> str:
+    """Render the judge prompt from a debate's final round."""
+    final_round = rounds[-1]
+    return AGREEMENT_USER_PROMPT.format(
+        ticker=ticker,
+        final_bull_argument=final_round.bull_argument,
+        final_bear_argument=final_round.bear_argument,
+    )
+
+
+def _interpret(ticker: str, result: dict) -> tuple[DebateOutcome, str | None]:
+    """Map a parsed judge response to (outcome, agreed_action)."""
+    outcome_str = result.get("outcome", "disagreement").lower()
+    agreed_action = result.get("agreed_action")
 
-        if outcome_str == "agreement" and agreed_action:
-            logger.info(f"[{ticker}] Debate reached agreement: {agreed_action}")
-            return DebateOutcome.AGREEMENT, agreed_action.upper()
+    if outcome_str == "agreement" and agreed_action:
+        logger.info("[%s] Debate reached agreement: %s", ticker, agreed_action)
+        return DebateOutcome.AGREEMENT, agreed_action.upper()
 
-        logger.info(f"[{ticker}] Debate ended in disagreement — jury required")
-        return DebateOutcome.DISAGREEMENT, None
+    logger.info("[%s] Debate ended in disagreement — jury required", ticker)
+    return DebateOutcome.DISAGREEMENT, None
@@ -9,7 +9,7 @@ from .prompts import (
     BEAR_INITIAL_PROMPT,
     BEAR_REBUTTAL_SYSTEM_PROMPT,
     BEAR_SYSTEM_PROMPT,
-    REBUTTAL_PROMPT,
+    REBUTTAL_MAX_TOKENS,
 )
 
 if TYPE_CHECKING:
@@ -28,54 +28,23 @@ class BearResearcher:
 
     def generate_initial(self, context: DebateContext) -> str:
         """Generate the opening bear argument for a ticker."""
-        user_prompt = BEAR_INITIAL_PROMPT.format(
-            ticker=context.ticker,
-            price=context.price,
-            quant_composite=context.quant_scores.get("composite", 0.0),
-            wasden_verdict=context.wasden_verdict,
-            wasden_confidence=context.wasden_confidence,
-            wasden_reasoning=context.wasden_reasoning,
-            quant_scores_section=_format_quant_scores(context.quant_scores),
-            fundamentals_section=_format_fundamentals(context.fundamentals),
-        )
+        user_prompt = BEAR_INITIAL_PROMPT.format_map(context.prompt_vars)
         return self._client.call_bear(BEAR_SYSTEM_PROMPT, user_prompt)
 
     def generate_rebuttal(self, context: DebateContext, prev_round: DebateRound) -> str:
         """Generate a rebuttal to the bull's previous argument."""
-        user_prompt = REBUTTAL_PROMPT.format(
-            current_round=prev_round.round_number + 1,
-            prev_bull_argument=prev_round.bull_argument,
-            prev_bear_argument=prev_round.bear_argument,
+        user_prompt = context.rebuttal_prompt(prev_round)
+        return self._client.call_bear(BEAR_REBUTTAL_SYSTEM_PROMPT, user_prompt, REBUTTAL_MAX_TOKENS)
+
+    async def generate_initial_async(self, context: DebateContext) -> str:
+        """Async variant of generate_initial."""
+        user_prompt = BEAR_INITIAL_PROMPT.format_map(context.prompt_vars)
+        return await self._client.call_bear_async(BEAR_SYSTEM_PROMPT, user_prompt)
+
+    async def generate_rebuttal_async(self, context: DebateContext, prev_round: DebateRound) -> str:
+        """Async variant of generate_rebuttal."""
+        user_prompt = context.rebuttal_prompt(prev_round)
+        return await self._client.call_bear_async(
+            BEAR_REBUTTAL_SYSTEM_PROMPT, user_prompt, REBUTTAL_MAX_TOKENS
         )
-        return self._client.call_bear(BEAR_REBUTTAL_SYSTEM_PROMPT, user_prompt)
-
-
-def _format_quant_scores(scores: dict) -> str:
-    """Format quant scores dict into readable bullet points."""
-    if not scores:
-        return "- No quant scores available"
-    lines = []
-    for key, value in scores.items():
-        if key == "composite":
-            continue
-        if isinstance(value, bool):
-            lines.append(f"- {key}: {'Yes' if value else 'No'}")
-        elif isinstance(value, float):
-            lines.append(f"- {key}: {value:.3f}")
-        else:
-            lines.append(f"- {key}: {value}")
-    return "\n".join(lines) if lines else "- No additional scores"
-
 
-def _format_fundamentals(fundamentals: dict | None) -> str:
-    """Format optional fundamentals dict into a section."""
-    if not fundamentals:
-        return ""
-    lines = ["## Fundamentals"]
-    for key, value in fundamentals.items():
-        if isinstance(value, float):
-            lines.append(f"- {key}: {value:.2f}")
-        else:
-            lines.append(f"- {key}: {value}")
-    lines.append("")
-    return "\n".join(lines)
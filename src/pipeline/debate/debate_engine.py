@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Coroutine, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import Any
 
 from backend.app.models.schemas import (
     DebateOutcome,
@@ -19,13 +23,20 @@ from .agreement_detector import AgreementDetector
 from .bear_researcher import BearResearcher
 from .bull_researcher import BullResearcher
 from .debate_llm_client import DebateLLMClient
+from .prompts import CONTEXT_BLOCK_TEMPLATE, REBUTTAL_PROMPT
 
 logger = logging.getLogger("debate_engine")
 
 MAX_REBUTTAL_ROUNDS = 2
 
+# Shared by every engine: runs the bull call of each sync round while the
+# caller thread runs the bear call. Sized to the default number of debates in
+# flight (max_concurrent_debates / pipeline max_parallel); beyond that, bull
+# calls queue briefly, which cannot deadlock since they wait on nothing.
+_BULL_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="debate-bull")
 
-@dataclass
+
+@dataclass(slots=True)
 class DebateContext:
     """All data needed to run a bull/bear debate on a ticker."""
 
@@ -37,6 +48,52 @@ class DebateContext:
     wasden_reasoning: str
     fundamentals: dict | None = field(default=None)
 
+    # Prompt sections shared by the bull, bear and jury prompts, formatted once
+    # at construction so prompt assembly is a pure template fill and the
+    # context can be read concurrently without lazy initialization.
+    quant_scores_section: str = field(init=False, repr=False)
+    fundamentals_section: str = field(init=False, repr=False)
+    # Quant/Wasden/fundamentals block of the initial prompts, identical for both sides
+    static_user_block: str = field(init=False, repr=False)
+    # Template variables for the initial-argument prompts, for str.format_map
+    prompt_vars: dict = field(init=False, repr=False)
+    # Last rendered rebuttal prompt as (previous round, prompt); both sides of a
+    # round get byte-identical rebuttal prompts, so the second one reuses it
+    _last_rebuttal: tuple[DebateRound, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.quant_scores_section = _format_quant_scores(self.quant_scores)
+        self.fundamentals_section = _format_fundamentals(self.fundamentals)
+        self.prompt_vars = {
+            "ticker": self.ticker,
+            "price": self.price,
+            "quant_composite": self.quant_scores.get("composite", 0.0),
+            "wasden_verdict": self.wasden_verdict,
+            "wasden_confidence": self.wasden_confidence,
+            "wasden_reasoning": self.wasden_reasoning,
+            "quant_scores_section": self.quant_scores_section,
+            "fundamentals_section": self.fundamentals_section,
+        }
+        self.static_user_block = CONTEXT_BLOCK_TEMPLATE.format_map(self.prompt_vars)
+        self.prompt_vars["static_user_block"] = self.static_user_block
+
+    def rebuttal_prompt(self, prev_round: DebateRound) -> str:
+        """Render the rebuttal user prompt answering ``prev_round``, shared by both sides."""
+        last = self._last_rebuttal
+        # Identity check: the cached tuple holds a reference, so the id cannot be reused.
+        # Concurrent sides may both render on a miss, which is harmless.
+        if last is not None and last[0] is prev_round:
+            return last[1]
+        prompt = REBUTTAL_PROMPT.format(
+            current_round=prev_round.round_number + 1,
+            prev_bull_argument=prev_round.bull_argument,
+            prev_bear_argument=prev_round.bear_argument,
+        )
+        self._last_rebuttal = (prev_round, prompt)
+        return prompt
+
 
 class DebateEngine:
     """Orchestrates bull/bear debate rounds and agreement check.
@@ -44,6 +101,9 @@ class DebateEngine:
     Flow:
         1. Round 1: initial bull (Claude) and bear (Gemini) arguments
         2. Rounds 2-N: rebuttals (configurable, default 2 rebuttal rounds)
+
+        Within a round the bull and bear calls have no data dependency and hit
+        different providers, so they run concurrently.
         3. Agreement detection via LLM judge
         4. Returns DebateTranscript (caller handles jury if disagreement)
     """
@@ -75,38 +135,124 @@ class DebateEngine:
         Returns:
             DebateTranscript with all rounds and outcome.
         """
-        logger.info(f"[{context.ticker}] Starting debate — max {1 + self._max_rebuttal_rounds} rounds")
+        logger.info("[%s] Starting debate — max %d rounds", context.ticker, 1 + self._max_rebuttal_rounds)
         rounds: list[DebateRound] = []
 
         # Round 1: initial arguments
-        bull_arg = self._bull.generate_initial(context)
+        bull_future = _BULL_EXECUTOR.submit(self._bull.generate_initial, context)
         bear_arg = self._bear.generate_initial(context)
-        round_1 = DebateRound(
-            round_number=1,
-            bull_argument=bull_arg,
-            bear_argument=bear_arg,
+        rounds.append(self._record_round(context, 1, bull_future.result(), bear_arg))
+
+        # Rebuttal rounds
+        for i in range(self._max_rebuttal_rounds):
+            prev_round = rounds[-1]
+            bull_future = _BULL_EXECUTOR.submit(self._bull.generate_rebuttal, context, prev_round)
+            bear_rebuttal = self._bear.generate_rebuttal(context, prev_round)
+            rounds.append(self._record_round(context, i + 2, bull_future.result(), bear_rebuttal))
+
+        # Agreement detection
+        outcome, _ = self._agreement.evaluate(context.ticker, rounds)
+        return self._build_transcript(context, pipeline_run_id, rounds, outcome)
+
+    async def run_debate_async(self, context: DebateContext, pipeline_run_id: str) -> DebateTranscript:
+        """Async variant of run_debate, running each bull/bear pair in a task group.
+
+        Args:
+            context: Ticker data and scores for the debate.
+            pipeline_run_id: UUID of the current pipeline run.
+
+        Returns:
+            DebateTranscript with all rounds and outcome.
+        """
+        rounds = await self._rounds_async(context)
+
+        # Agreement detection
+        outcome, _ = await asyncio.to_thread(self._agreement.evaluate, context.ticker, rounds)
+        return self._build_transcript(context, pipeline_run_id, rounds, outcome)
+
+    async def _rounds_async(self, context: DebateContext) -> list[DebateRound]:
+        logger.info("[%s] Starting debate — max %d rounds", context.ticker, 1 + self._max_rebuttal_rounds)
+        rounds: list[DebateRound] = []
+
+        # Round 1: initial arguments
+        bull_arg, bear_arg = await _run_pair(
+            self._bull.generate_initial_async(context),
+            self._bear.generate_initial_async(context),
         )
-        rounds.append(round_1)
-        logger.info(f"[{context.ticker}] Round 1 complete")
+        rounds.append(self._record_round(context, 1, bull_arg, bear_arg))
 
         # Rebuttal rounds
         for i in range(self._max_rebuttal_rounds):
-            round_num = i + 2
             prev_round = rounds[-1]
+            bull_rebuttal, bear_rebuttal = await _run_pair(
+                self._bull.generate_rebuttal_async(context, prev_round),
+                self._bear.generate_rebuttal_async(context, prev_round),
+            )
+            rounds.append(self._record_round(context, i + 2, bull_rebuttal, bear_rebuttal))
+        return rounds
 
-            bull_rebuttal = self._bull.generate_rebuttal(context, prev_round)
-            bear_rebuttal = self._bear.generate_rebuttal(context, prev_round)
+    async def run_debates(
+        self, contexts: Sequence[DebateContext], pipeline_run_id: str
+    ) -> list[DebateTranscript | BaseException]:
+        """Debate several tickers concurrently, bounded by ``max_concurrent_debates``.
+
+        Rounds run per ticker; agreement detection for every completed debate
+        then goes to the judge as a single batched request.
+
+        Args:
+            contexts: One debate context per ticker.
+            pipeline_run_id: UUID of the current pipeline run.
+
+        Returns:
+            One entry per context, in order: its DebateTranscript, or the
+            exception that debate raised (one failure does not cancel the rest).
+        """
+        semaphore = asyncio.Semaphore(max(1, self._settings.max_concurrent_debates))
+
+        async def _bounded(context: DebateContext) -> list[DebateRound]:
+            async with semaphore:
+                return await self._rounds_async(context)
+
+        results: list = await asyncio.gather(*(_bounded(c) for c in contexts), return_exceptions=True)
+        done = [i for i, result in enumerate(results) if not isinstance(result, BaseException)]
+        if not done:
+            return results
 
-            rebuttal_round = DebateRound(
-                round_number=round_num,
-                bull_argument=bull_rebuttal,
-                bear_argument=bear_rebuttal,
+        try:
+            outcomes = await asyncio.to_thread(
+                self._agreement.evaluate_many, [(contexts[i].ticker, results[i]) for i in done]
             )
-            rounds.append(rebuttal_round)
-            logger.info(f"[{context.ticker}] Round {round_num} complete")
+        except Exception as e:
+            # Judge unavailable for the whole cohort
+            for i in done:
+                results[i] = e
+            return results
 
-        # Agreement detection
-        outcome, agreed_action = self._agreement.evaluate(context.ticker, rounds)
+        for i, (outcome, _) in zip(done, outcomes):
+            results[i] = self._build_transcript(contexts[i], pipeline_run_id, results[i], outcome)
+        return results
+
+    @staticmethod
+    def _record_round(
+        context: DebateContext, round_number: int, bull_argument: str, bear_argument: str
+    ) -> DebateRound:
+        """Build a DebateRound from one bull/bear pair and log its completion."""
+        debate_round = DebateRound(
+            round_number=round_number,
+            bull_argument=bull_argument,
+            bear_argument=bear_argument,
+        )
+        logger.info("[%s] Round %d complete", context.ticker, round_number)
+        return debate_round
+
+    def _build_transcript(
+        self,
+        context: DebateContext,
+        pipeline_run_id: str,
+        rounds: list[DebateRound],
+        outcome: DebateOutcome,
+    ) -> DebateTranscript:
+        """Assemble the final transcript once agreement detection has run."""
         jury_triggered = outcome == DebateOutcome.DISAGREEMENT
 
         transcript = DebateTranscript(
@@ -115,26 +261,82 @@ class DebateEngine:
             timestamp=datetime.now(timezone.utc).isoformat(),
             rounds=rounds,
             outcome=outcome,
-            bull_model=self._settings.claude_model,
+            bull_model=self._client.claude_model,
             bear_model=self._settings.gemini_model,
             jury_triggered=jury_triggered,
         )
 
         logger.info(
-            f"[{context.ticker}] Debate complete — outcome={outcome.value}, "
-            f"jury_triggered={jury_triggered}"
+            "[%s] Debate complete — outcome=%s, jury_triggered=%s",
+            context.ticker,
+            outcome.value,
+            jury_triggered,
         )
         return transcript
 
     @staticmethod
     def make_no_jury_result(agreed_action: str | None) -> JuryResult:
-        """Create a JuryResult for when the debate reached agreement (no jury needed)."""
-        action = TradeAction(agreed_action) if agreed_action else TradeAction.HOLD
-        return JuryResult(
-            spawned=False,
-            reason="Debate reached agreement — jury not required",
-            votes=[],
-            final_count=None,
-            decision=action,
-            escalated_to_human=False,
-        )
+        """Return the JuryResult for when the debate reached agreement (no jury needed)."""
+        return _NO_JURY_RESULTS[TradeAction(agreed_action) if agreed_action else TradeAction.HOLD]
+
+
+# JuryResult is frozen, so one shared instance per action serves every agreed debate
+_NO_JURY_RESULTS = {
+    action: JuryResult(
+        spawned=False,
+        reason="Debate reached agreement — jury not required",
+        votes=[],
+        final_count=None,
+        decision=action,
+        escalated_to_human=False,
+    )
+    for action in TradeAction
+}
+
+
+async def _run_pair(bull: Coroutine[Any, Any, str], bear: Coroutine[Any, Any, str]) -> tuple[str, str]:
+    """Run one round's bull and bear calls concurrently.
+
+    A failure on either side is re-raised unwrapped as soon as it occurs, so
+    callers see the same exception types as the sync path. Both calls run in
+    threads via ``to_thread``, which cannot be interrupted: the other side's
+    LLM call runs to completion and its result is discarded.
+    """
+    try:
+        async with asyncio.TaskGroup() as tg:
+            bull_task = tg.create_task(bull)
+            bear_task = tg.create_task(bear)
+    except* Exception as group:
+        raise group.exceptions[0]
+    return bull_task.result(), bear_task.result()
+
+
+def _format_quant_scores(scores: dict) -> str:
+    """Format quant scores dict into readable bullet points."""
+    if not scores:
+        return "- No quant scores available"
+    lines = []
+    for key, value in scores.items():
+        if key == "composite":
+            continue  # Already shown in header
+        if isinstance(value, bool):
+            lines.append(f"- {key}: {'Yes' if value else 'No'}")
+        elif isinstance(value, float):
+            lines.append(f"- {key}: {value:.3f}")
+        else:
+            lines.append(f"- {key}: {value}")
+    return "\n".join(lines) if lines else "- No additional scores"
+
+
+def _format_fundamentals(fundamentals: dict | None) -> str:
+    """Format optional fundamentals dict into a section."""
+    if not fundamentals:
+        return ""
+    lines = ["## Fundamentals"]
+    for key, value in fundamentals.items():
+        if isinstance(value, float):
+            lines.append(f"- {key}: {value:.2f}")
+        else:
+            lines.append(f"- {key}: {value}")
+    lines.append("")
+    return "\n".join(lines)
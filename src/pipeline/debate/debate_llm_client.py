@@ -1,15 +1,46 @@
 """Dual-LLM client for the debate engine — Claude=bull, Gemini=bear, no cross-fallback."""
 
+import asyncio
+import hashlib
 import itertools
 import json
 import logging
-import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import closing
+from typing import TYPE_CHECKING, Any
 
 from src.intelligence.wasden_watch.config import WasdenWatchSettings
 from src.intelligence.wasden_watch.exceptions import LLMError
+from src.intelligence.wasden_watch.llm_client import _find_json_span
+
+from .prompts import JUDGE_BATCH_CASE, JUDGE_BATCH_SYSTEM_SUFFIX, JUDGE_MAX_TOKENS
+
+# ---------------------------------------------------------------------------
+# Optional Gemini SDK import — resolved once at import, not on every bear call
+# ---------------------------------------------------------------------------
+try:
+    import google.generativeai as genai
+    from google.api_core import retry as api_retry
+
+    _GEMINI_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    genai = None  # type: ignore[assignment]
+    api_retry = None  # type: ignore[assignment]
+    _GEMINI_AVAILABLE = False
+
+if TYPE_CHECKING:
+    import anthropic
 
 logger = logging.getLogger("debate_engine")
 
+# Parsed judge responses keyed by model names and prompt digest. Process-wide
+# because the pipeline builds a new engine (and client) per run, so reruns and
+# backtests over an identical transcript skip the LLM round trip.
+_judge_cache: OrderedDict[bytes, dict] = OrderedDict()
+_judge_cache_lock = threading.Lock()
+
 
 class DebateLLMClient:
     """Routes bull calls to Claude only, bear calls to Gemini only.
@@ -20,52 +51,186 @@ class DebateLLMClient:
 
     def __init__(self, settings: WasdenWatchSettings):
         self._settings = settings
-        self._claude_key_cycle = (
-            itertools.cycle(settings.claude_api_keys) if settings.claude_api_keys else None
-        )
-        self._gemini_key_cycle = (
-            itertools.cycle(settings.gemini_api_keys) if settings.gemini_api_keys else None
+        # Round-robin via a shared counter: next() on itertools.count is atomic
+        # under the GIL, so concurrent rounds and debates never draw the same slot.
+        self._bedrock = settings.claude_provider == "bedrock"
+        # Bedrock takes its own model ID; claude_model stays the native API name used by Wasden Watch
+        self.claude_model = settings.bedrock_model if self._bedrock else settings.claude_model
+        # Bedrock authenticates with AWS credentials, so it gets a single client slot
+        self._claude_keys = ("bedrock",) if self._bedrock else tuple(settings.claude_api_keys)
+        self._gemini_keys = tuple(settings.gemini_api_keys)
+        self._claude_counter = itertools.count()
+        self._gemini_counter = itertools.count()
+        # Anthropic clients hold an httpx connection pool; build one per key and reuse it
+        self._claude_clients: dict[str, "anthropic.Anthropic | anthropic.AnthropicBedrock"] = {}
+        self._claude_extra_headers = (
+            {"X-Amzn-Bedrock-PerformanceConfig-Latency": "optimized"}
+            if self._bedrock and settings.bedrock_latency_optimized
+            else None
         )
+        # Judge cache entries are only shared between clients on the same models
+        self._judge_models = f"{self.claude_model}\0{settings.gemini_model}"
+        # Gemini request options are fixed per client; build the SDK objects once.
+        # Generation configs differ only by output cap, memoized per cap.
+        self._gemini_request_options: dict | None = None
+        self._gemini_configs: dict[int, "genai.GenerationConfig"] = {}
+        if _GEMINI_AVAILABLE:
+            timeout = settings.debate_llm_timeout_seconds
+            # Per-attempt timeout; transient errors (429/500/503) retried with backoff
+            self._gemini_request_options = {
+                "timeout": timeout,
+                "retry": api_retry.Retry(initial=1.0, maximum=8.0, timeout=2 * timeout),
+            }
 
-    def call_bull(self, system_prompt: str, user_prompt: str) -> str:
-        """Call Claude for bull case. No fallback — raises LLMError on failure."""
-        if self._claude_key_cycle is None:
+    def call_bull(self, system_prompt: str, user_prompt: str, max_tokens: int | None = None) -> str:
+        """Call Claude for bull case. No fallback — raises LLMError on failure.
+
+        ``max_tokens`` caps this response below ``settings.max_tokens``.
+        """
+        if not self._claude_keys:
             raise LLMError("No Claude API keys configured for bull researcher")
         try:
-            response = self._call_claude(system_prompt, user_prompt)
+            response = self._call_claude(system_prompt, user_prompt, self._token_limit(max_tokens))
             logger.info("Bull argument generated via Claude")
             return response
         except Exception as e:
             raise LLMError(f"Claude bull call failed: {e}") from e
 
-    def call_bear(self, system_prompt: str, user_prompt: str) -> str:
-        """Call Gemini for bear case. No fallback — raises LLMError on failure."""
-        if self._gemini_key_cycle is None:
+    def call_bear(self, system_prompt: str, user_prompt: str, max_tokens: int | None = None) -> str:
+        """Call Gemini for bear case. No fallback — raises LLMError on failure.
+
+        ``max_tokens`` caps this response below ``settings.max_tokens``.
+        """
+        if not self._gemini_keys:
             raise LLMError("No Gemini API keys configured for bear researcher")
         try:
-            response = self._call_gemini(system_prompt, user_prompt)
+            response = self._call_gemini(system_prompt, user_prompt, self._token_limit(max_tokens))
             logger.info("Bear argument generated via Gemini")
             return response
         except Exception as e:
             raise LLMError(f"Gemini bear call failed: {e}") from e
 
+    async def call_bull_async(
+        self, system_prompt: str, user_prompt: str, max_tokens: int | None = None
+    ) -> str:
+        """Run call_bull on a worker thread so it can overlap with the bear call."""
+        return await asyncio.to_thread(self.call_bull, system_prompt, user_prompt, max_tokens)
+
+    async def call_bear_async(
+        self, system_prompt: str, user_prompt: str, max_tokens: int | None = None
+    ) -> str:
+        """Run call_bear on a worker thread so it can overlap with the bull call."""
+        return await asyncio.to_thread(self.call_bear, system_prompt, user_prompt, max_tokens)
+
     def call_judge(self, system_prompt: str, user_prompt: str) -> dict:
-        """Call Claude (Gemini fallback) for neutral evaluation. Returns parsed JSON."""
+        """Call Claude (Gemini fallback) for neutral evaluation. Returns parsed JSON.
+
+        Successful responses are cached by exact prompt; identical calls
+        return a copy of the cached result without contacting either provider.
+        """
+        cache_key = _judge_cache_key(self._judge_models, system_prompt, user_prompt)
+        cached = self._judge_cache_get(cache_key)
+        if cached is not None:
+            logger.info("Judge evaluation served from cache")
+            return cached
+
+        parsed = self._evaluate_judge(
+            system_prompt, user_prompt, self._token_limit(JUDGE_MAX_TOKENS), self._parse_stream
+        )
+        self._judge_cache_put(cache_key, parsed)
+        return parsed
+
+    def call_judge_batch(self, system_prompt: str, user_prompts: Sequence[str]) -> list[dict]:
+        """Evaluate independent judge prompts, sending the uncached ones as one request.
+
+        Uncached prompts are sent in slices small enough that a full slice of
+        verdicts fits under the configured ``max_tokens``. Each verdict must
+        echo its case number; if a slice fails or its case numbers are not
+        exactly 1..n, each of its prompts falls back to its own call_judge.
+
+        Args:
+            system_prompt: Judge system prompt shared by every case.
+            user_prompts: One user prompt per case.
+
+        Returns:
+            Parsed verdicts in the same order as ``user_prompts``.
+        """
+        keys = [_judge_cache_key(self._judge_models, system_prompt, p) for p in user_prompts]
+        results = [self._judge_cache_get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+
+        slice_size = max(1, self._settings.max_tokens // JUDGE_MAX_TOKENS)
+        for start in range(0, len(missing), slice_size):
+            batch = missing[start:start + slice_size]
+            if len(batch) < 2:
+                continue
+            n = len(batch)
+            batch_system = system_prompt + JUDGE_BATCH_SYSTEM_SUFFIX.format(n=n)
+            batch_user = "\n\n".join(
+                JUDGE_BATCH_CASE.format(case=case, prompt=user_prompts[i])
+                for case, i in enumerate(batch, start=1)
+            )
+            try:
+                verdicts = self._evaluate_judge(
+                    batch_system,
+                    batch_user,
+                    JUDGE_MAX_TOKENS * n,
+                    lambda chunks, n=n: self._parse_batch("".join(chunks), n),
+                )
+            except LLMError as e:
+                logger.warning("Batched judge call failed: %s, evaluating cases individually", e)
+                continue
+            for i, verdict in zip(batch, verdicts):
+                self._judge_cache_put(keys[i], verdict)
+                results[i] = verdict
+
+        return [
+            result if result is not None else self.call_judge(system_prompt, prompt)
+            for result, prompt in zip(results, user_prompts)
+        ]
+
+    def _judge_cache_get(self, cache_key: bytes) -> dict | None:
+        """Return a copy of a cached judge response, or None on a miss."""
+        if self._settings.judge_cache_size <= 0:
+            return None
+        with _judge_cache_lock:
+            cached = _judge_cache.get(cache_key)
+            if cached is None:
+                return None
+            _judge_cache.move_to_end(cache_key)
+            return dict(cached)
+
+    def _judge_cache_put(self, cache_key: bytes, parsed: dict) -> None:
+        """Store a copy of a judge response, evicting the least recently used entry."""
+        max_size = self._settings.judge_cache_size
+        if max_size > 0:
+            with _judge_cache_lock:
+                _judge_cache[cache_key] = dict(parsed)
+                _judge_cache.move_to_end(cache_key)
+                while len(_judge_cache) > max_size:
+                    _judge_cache.popitem(last=False)
+
+    def _evaluate_judge(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        parse: Callable[[Iterator[str]], Any],
+    ) -> Any:
+        """Run the judge prompt on Claude, falling back to Gemini; ``parse`` reads the stream."""
         # Try Claude first
-        if self._claude_key_cycle is not None:
+        if self._claude_keys:
             try:
-                raw = self._call_claude(system_prompt, user_prompt)
-                parsed = self._parse_response(raw)
+                parsed = parse(self._stream_claude(system_prompt, user_prompt, max_tokens))
                 logger.info("Judge evaluation via Claude")
                 return parsed
             except Exception as e:
-                logger.warning(f"Claude judge call failed: {e}, falling back to Gemini")
+                logger.warning("Claude judge call failed: %s, falling back to Gemini", e)
 
         # Fallback to Gemini
-        if self._gemini_key_cycle is not None:
+        if self._gemini_keys:
             try:
-                raw = self._call_gemini(system_prompt, user_prompt)
-                parsed = self._parse_response(raw)
+                parsed = parse(self._stream_gemini(system_prompt, user_prompt, max_tokens))
                 logger.info("Judge evaluation via Gemini fallback")
                 return parsed
             except Exception as e:
@@ -73,37 +238,143 @@ class DebateLLMClient:
 
         raise LLMError("No API keys configured for judge evaluation")
 
-    def _call_claude(self, system_prompt: str, user_prompt: str) -> str:
-        import anthropic
-
-        key = next(self._claude_key_cycle)
-        client = anthropic.Anthropic(api_key=key)
-        message = client.messages.create(
-            model=self._settings.claude_model,
-            max_tokens=self._settings.max_tokens,
-            temperature=self._settings.temperature,
-            system=system_prompt,
-            messages=[{"role": "user", "content": user_prompt}],
-        )
+    def _token_limit(self, max_tokens: int | None) -> int:
+        """Per-call output cap, never above the configured ``max_tokens``."""
+        if max_tokens is None:
+            return self._settings.max_tokens
+        return min(max_tokens, self._settings.max_tokens)
+
+    def _call_claude(self, system_prompt: str, user_prompt: str, max_tokens: int) -> str:
+        key = self._claude_keys[next(self._claude_counter) % len(self._claude_keys)]
+        client = self._get_claude_client(key)
+        message = client.messages.create(**self._claude_request(system_prompt, user_prompt, max_tokens))
         return message.content[0].text
 
-    def _call_gemini(self, system_prompt: str, user_prompt: str) -> str:
-        import google.generativeai as genai
+    def _stream_claude(self, system_prompt: str, user_prompt: str, max_tokens: int) -> Iterator[str]:
+        """Yield Claude response text as it arrives; closing the generator ends the stream."""
+        key = self._claude_keys[next(self._claude_counter) % len(self._claude_keys)]
+        client = self._get_claude_client(key)
+        with client.messages.stream(**self._claude_request(system_prompt, user_prompt, max_tokens)) as stream:
+            yield from stream.text_stream
+
+    def _claude_request(self, system_prompt: str, user_prompt: str, max_tokens: int) -> dict:
+        """Keyword arguments for a Claude messages request."""
+        return {
+            "model": self.claude_model,
+            "max_tokens": max_tokens,
+            "temperature": self._settings.temperature,
+            "system": system_prompt,
+            "messages": [{"role": "user", "content": user_prompt}],
+            "extra_headers": self._claude_extra_headers,
+        }
+
+    def _get_claude_client(self, key: str) -> "anthropic.Anthropic | anthropic.AnthropicBedrock":
+        """Return the cached Anthropic client for an API key, creating it on first use."""
+        client = self._claude_clients.get(key)
+        if client is None:
+            import anthropic
+
+            # SDK retries 429/5xx with backoff; the timeout bounds each attempt
+            timeout = self._settings.debate_llm_timeout_seconds
+            if self._bedrock:
+                new_client = anthropic.AnthropicBedrock(
+                    aws_region=self._settings.bedrock_aws_region or None, timeout=timeout
+                )
+            else:
+                new_client = anthropic.Anthropic(api_key=key, timeout=timeout)
+            client = self._claude_clients.setdefault(key, new_client)
+        return client
 
-        key = next(self._gemini_key_cycle)
+    def _call_gemini(self, system_prompt: str, user_prompt: str, max_tokens: int) -> str:
+        return self._generate_gemini(system_prompt, user_prompt, max_tokens, stream=False).text
+
+    def _stream_gemini(self, system_prompt: str, user_prompt: str, max_tokens: int) -> Iterator[str]:
+        """Yield Gemini response text chunk by chunk."""
+        for chunk in self._generate_gemini(system_prompt, user_prompt, max_tokens, stream=True):
+            yield chunk.text
+
+    def _generate_gemini(self, system_prompt: str, user_prompt: str, max_tokens: int, stream: bool):
+        if self._gemini_request_options is None:
+            raise LLMError("google-generativeai is not installed")
+
+        key = self._gemini_keys[next(self._gemini_counter) % len(self._gemini_keys)]
         genai.configure(api_key=key)
         model = genai.GenerativeModel(
             model_name=self._settings.gemini_model,
             system_instruction=system_prompt,
         )
-        response = model.generate_content(
+        config = self._gemini_configs.get(max_tokens)
+        if config is None:
+            config = self._gemini_configs.setdefault(
+                max_tokens,
+                genai.GenerationConfig(
+                    temperature=self._settings.temperature, max_output_tokens=max_tokens
+                ),
+            )
+        return model.generate_content(
             user_prompt,
-            generation_config=genai.GenerationConfig(
-                temperature=self._settings.temperature,
-                max_output_tokens=self._settings.max_tokens,
-            ),
+            stream=stream,
+            generation_config=config,
+            request_options=self._gemini_request_options,
         )
-        return response.text
+
+    def _parse_stream(self, chunks: Iterator[str]) -> dict:
+        """Parse a streamed judge response, stopping once a complete JSON object arrives.
+
+        The judge prompts ask for a single JSON object, so anything after its
+        closing brace is not needed; returning early closes the stream.
+        """
+        parts: list[str] = []
+        with closing(chunks):
+            for chunk in chunks:
+                parts.append(chunk)
+                if "}" not in chunk:
+                    continue
+                text = "".join(parts)
+                span = _find_json_span(text)
+                while span is not None:
+                    try:
+                        return json.loads(text[span[0]:span[1]])
+                    except json.JSONDecodeError:
+                        span = _find_json_span(text, span[0] + 1)
+        return self._parse_response("".join(parts))
+
+    def _parse_batch(self, raw: str, n: int) -> list[dict]:
+        """Parse a batched judge response into ``n`` verdicts ordered by case number.
+
+        Accepts a bare JSON array, or otherwise collects the top-level objects
+        with the brace scanner (covers fenced arrays and prose). Each object's
+        ``case`` field is removed and used to place it.
+
+        Raises:
+            LLMError: If the case numbers are not exactly 1..n.
+        """
+        text = raw.strip()
+        try:
+            verdicts = json.loads(text)
+        except json.JSONDecodeError:
+            verdicts = None
+
+        if not isinstance(verdicts, list):
+            verdicts = []
+            span = _find_json_span(text)
+            while span is not None:
+                try:
+                    verdicts.append(json.loads(text[span[0]:span[1]]))
+                    span = _find_json_span(text, span[1])
+                except json.JSONDecodeError:
+                    span = _find_json_span(text, span[0] + 1)
+
+        by_case = {}
+        for verdict in verdicts:
+            case = verdict.pop("case", None) if isinstance(verdict, dict) else None
+            if type(case) is not int or case in by_case:
+                break
+            by_case[case] = verdict
+        else:
+            if by_case.keys() == set(range(1, n + 1)):
+                return [by_case[case] for case in range(1, n + 1)]
+        raise LLMError(f"Judge verdicts do not cover cases 1..{n} exactly. Raw: {text[:500]}")
 
     def _parse_response(self, raw: str) -> dict:
         """Parse LLM response as JSON — same strategy as wasden_watch llm_client."""
@@ -116,19 +387,26 @@ class DebateLLMClient:
             pass
 
         # Markdown code block
-        json_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?```", text, re.DOTALL)
-        if json_match:
+        _, fence, rest = text.partition("```")
+        if fence:
+            block = rest.partition("```")[0]
+            if block.startswith("json"):
+                block = block[4:]
             try:
-                return json.loads(json_match.group(1).strip())
+                return json.loads(block.strip())
             except json.JSONDecodeError:
                 pass
 
-        # Bare JSON object
-        brace_match = re.search(r"\{.*\}", text, re.DOTALL)
-        if brace_match:
+        # First balanced JSON object, found by a single brace-depth scan
+        span = _find_json_span(text)
+        while span is not None:
             try:
-                return json.loads(brace_match.group(0))
+                return json.loads(text[span[0]:span[1]])
             except json.JSONDecodeError:
-                pass
+                span = _find_json_span(text, span[0] + 1)
 
         raise LLMError(f"Could not parse judge response as JSON. Raw: {text[:500]}")
+
+
+def _judge_cache_key(models: str, system_prompt: str, user_prompt: str) -> bytes:
+    return hashlib.sha256(f"{models}\0{system_prompt}\0{user_prompt}".encode()).digest()
@@ -30,13 +30,16 @@ You have seen the bull analyst's counterargument. Rebut their key points while s
 Address their strongest objections directly. Do not simply repeat your prior argument — advance it.
 Keep your rebuttal to 2-4 concise paragraphs."""
 
+# Output caps sized to the lengths the prompts ask for (clamped to settings.max_tokens)
+REBUTTAL_MAX_TOKENS = 768      # 2-4 paragraphs
+JUDGE_MAX_TOKENS = 512         # one JSON verdict with brief reasoning
+
 # ---------------------------------------------------------------------------
 # Initial argument prompts — with data slots
 # ---------------------------------------------------------------------------
 
-BULL_INITIAL_PROMPT = """\
-Analyze {ticker} (current price: ${price:.2f}) and argue the BULL case.
-
+# Ticker data shared by both sides; rendered once per DebateContext
+CONTEXT_BLOCK_TEMPLATE = """\
 ## Quantitative Signal
 - Composite Score: {quant_composite:.3f}
 {quant_scores_section}
@@ -46,23 +49,23 @@ Analyze {ticker} (current price: ${price:.2f}) and argue the BULL case.
 - Confidence: {wasden_confidence:.1%}
 - Reasoning: {wasden_reasoning}
 
-{fundamentals_section}\
-Present your bull thesis now."""
+{fundamentals_section}"""
 
-BEAR_INITIAL_PROMPT = """\
-Analyze {ticker} (current price: ${price:.2f}) and argue the BEAR case.
+# One template for both sides; {side}/{side_lower} are substituted at import
+# time so each per-call render is a single format_map over the context vars
+INITIAL_PROMPT_TEMPLATE = """\
+Analyze {ticker} (current price: ${price:.2f}) and argue the {side} case.
 
-## Quantitative Signal
-- Composite Score: {quant_composite:.3f}
-{quant_scores_section}
+{static_user_block}\
+Present your {side_lower} thesis now."""
 
-## Wasden Watch Verdict
-- Verdict: {wasden_verdict}
-- Confidence: {wasden_confidence:.1%}
-- Reasoning: {wasden_reasoning}
 
-{fundamentals_section}\
-Present your bear thesis now."""
+def _initial_prompt_for(side: str) -> str:
+    return INITIAL_PROMPT_TEMPLATE.replace("{side}", side).replace("{side_lower}", side.lower())
+
+
+BULL_INITIAL_PROMPT = _initial_prompt_for("BULL")
+BEAR_INITIAL_PROMPT = _initial_prompt_for("BEAR")
 
 # ---------------------------------------------------------------------------
 # Rebuttal prompt — shared by both sides
@@ -104,3 +107,18 @@ Evaluate whether the following bull/bear debate on {ticker} has reached agreemen
 {final_bear_argument}
 
 Respond with JSON only."""
+
+# ---------------------------------------------------------------------------
+# Batched judge prompts — several independent cases in one request
+# ---------------------------------------------------------------------------
+
+JUDGE_BATCH_SYSTEM_SUFFIX = """
+
+You will receive {n} independent cases, labelled "### Case 1" to "### Case {n}".
+Evaluate each case on its own. Respond with a JSON array of exactly {n} objects, \
+one per case, each in the format described above plus a "case" field holding the \
+case number it answers (1 to {n}). No other text."""
+
+JUDGE_BATCH_CASE = """\
+### Case {case}
+{prompt}"""
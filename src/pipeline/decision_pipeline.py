@@ -9,14 +9,25 @@ Wires together existing components:
 - DecisionArbiter (Week 7)
 """
 
+import asyncio
 import logging
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
 from src.pipeline.state import TradingState
 
+if TYPE_CHECKING:
+    from src.pipeline.debate import DebateContext
+
 logger = logging.getLogger("wasden_watch.pipeline")
 
+# Shared by every pipeline: runs the live bull research call while the caller
+# thread runs the bear call. Sized to the default max_parallel; beyond that,
+# bull calls queue briefly, which cannot deadlock since they wait on nothing.
+_RESEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pipeline-bull")
+
 
 class DecisionPipeline:
     """Full 10-node decision pipeline orchestrator.
@@ -25,7 +36,7 @@ class DecisionPipeline:
         1. quant_scoring — QuantModelOrchestrator
         2. wasden_watch — VerdictGenerator
         3. bull_researcher — BullResearcher.generate_initial()
-        4. bear_researcher — BearResearcher.generate_initial()
+        4. bear_researcher — BearResearcher.generate_initial() (concurrent with 3)
         5. debate — DebateEngine.run_debate()
         6. jury_spawn — JurySpawner.spawn_jury() (if disagreement)
         7. jury_aggregate — JuryAggregator.aggregate() (if jury spawned)
@@ -39,9 +50,10 @@ class DecisionPipeline:
         - debate: if disagreement → jury_spawn
     """
 
-    def __init__(self, use_mock: bool = True, random_seed: int = 42):
+    def __init__(self, use_mock: bool = True, random_seed: int = 42, max_parallel: int = 4):
         self._use_mock = use_mock
         self._random_seed = random_seed
+        self._max_parallel = max(1, max_parallel)
 
     def run(
         self,
@@ -80,9 +92,8 @@ class DecisionPipeline:
             state = self._node_decision(state)
             return self._state_to_journal_entry(state)
 
-        # Node 3-4: Bull and bear research
-        state = self._node_bull_researcher(state)
-        state = self._node_bear_researcher(state)
+        # Node 3-4: Bull and bear research (independent — run concurrently)
+        state = self._node_research(state)
 
         # Node 5: Debate
         state = self._node_debate(state)
@@ -110,24 +121,53 @@ class DecisionPipeline:
         )
         return self._state_to_journal_entry(state)
 
+    async def run_async(
+        self,
+        ticker: str,
+        price: float,
+        fundamentals: dict | None = None,
+    ) -> dict:
+        """Async variant of run() that keeps the event loop free.
+
+        The nodes are blocking LLM/model calls, so the run executes on a
+        worker thread (same pattern as JurySpawner.spawn_jury_async).
+        """
+        return await asyncio.to_thread(self.run, ticker, price, fundamentals)
+
+    async def run_batch_async(self, tickers_data: list[dict]) -> list[dict]:
+        """Run pipeline for multiple tickers, at most ``max_parallel`` at a time.
+
+        Args:
+            tickers_data: List of dicts with 'ticker', 'price', and optional 'fundamentals'.
+
+        Returns:
+            List of DecisionJournalEntry-compatible dicts, in input order.
+        """
+        semaphore = asyncio.Semaphore(self._max_parallel)
+
+        async def _run_one(data: dict) -> dict:
+            async with semaphore:
+                return await self.run_async(data["ticker"], data["price"], data.get("fundamentals"))
+
+        return list(await asyncio.gather(*(_run_one(data) for data in tickers_data)))
+
     def run_batch(self, tickers_data: list[dict]) -> list[dict]:
-        """Run pipeline for multiple tickers.
+        """Run pipeline for multiple tickers, at most ``max_parallel`` at a time.
+
+        Uses a thread pool rather than asyncio.run() so it is safe to call
+        from code already running inside an event loop.
 
         Args:
             tickers_data: List of dicts with 'ticker', 'price', and optional 'fundamentals'.
 
         Returns:
-            List of DecisionJournalEntry-compatible dicts.
+            List of DecisionJournalEntry-compatible dicts, in input order.
         """
-        results = []
-        for data in tickers_data:
-            result = self.run(
-                ticker=data["ticker"],
-                price=data["price"],
-                fundamentals=data.get("fundamentals"),
-            )
-            results.append(result)
-        return results
+        if len(tickers_data) <= 1 or self._max_parallel == 1:
+            return [self.run(d["ticker"], d["price"], d.get("fundamentals")) for d in tickers_data]
+
+        with ThreadPoolExecutor(max_workers=self._max_parallel, thread_name_prefix="pipeline-batch") as pool:
+            return list(pool.map(lambda d: self.run(d["ticker"], d["price"], d.get("fundamentals")), tickers_data))
 
     # --- Node implementations ---
 
@@ -193,66 +233,63 @@ class DecisionPipeline:
     def _node_bull_researcher(self, state: TradingState) -> TradingState:
         """Node 3: Generate bull case."""
         _log_node_start(state, "bull_researcher")
-
-        if self._use_mock:
-            state.bull_case = (
-                f"Bull case for {state.ticker}: Strong quant composite ({state.quant_composite:.3f}), "
-                f"favorable Wasden sentiment, and positive market momentum suggest upside potential."
-            )
-        else:
-            from src.pipeline.debate import DebateContext
-            from src.pipeline.debate.bull_researcher import BullResearcher
-            from src.pipeline.debate.debate_llm_client import DebateLLMClient
-            from src.intelligence.wasden_watch.config import WasdenWatchSettings
-
-            settings = WasdenWatchSettings()
-            client = DebateLLMClient(settings)
-            researcher = BullResearcher(client)
-            context = DebateContext(
-                ticker=state.ticker,
-                price=state.price,
-                quant_scores=state.quant_scores,
-                wasden_verdict=state.wasden_verdict,
-                wasden_confidence=state.wasden_confidence,
-                wasden_reasoning=state.wasden_reasoning,
-                fundamentals=state.fundamentals,
-            )
-            state.bull_case = researcher.generate_initial(context)
-
+        state.bull_case = self._research_cases(state, bull=True, bear=False)[0]
         _log_node_end(state, "bull_researcher", f"{len(state.bull_case)} chars")
         return state
 
     def _node_bear_researcher(self, state: TradingState) -> TradingState:
         """Node 4: Generate bear case."""
         _log_node_start(state, "bear_researcher")
+        state.bear_case = self._research_cases(state, bull=False, bear=True)[1]
+        _log_node_end(state, "bear_researcher", f"{len(state.bear_case)} chars")
+        return state
+
+    def _node_research(self, state: TradingState) -> TradingState:
+        """Nodes 3-4: Generate bull and bear cases concurrently.
 
+        Both sides only read upstream fields; their results are merged into
+        state after the pair completes, so the two calls never race on it.
+        """
+        _log_node_start(state, "bull_researcher")
+        _log_node_start(state, "bear_researcher")
+        state.bull_case, state.bear_case = self._research_cases(state, bull=True, bear=True)
+        _log_node_end(state, "bull_researcher", f"{len(state.bull_case)} chars")
+        _log_node_end(state, "bear_researcher", f"{len(state.bear_case)} chars")
+        return state
+
+    def _research_cases(self, state: TradingState, bull: bool, bear: bool) -> tuple[str, str]:
+        """Return (bull_case, bear_case) for the requested sides ("" for the other).
+
+        In live mode both sides share one LLM client, and when both are
+        requested the bull call (Claude) runs on a worker thread while the
+        bear call (Gemini) runs on this one.
+        """
         if self._use_mock:
-            state.bear_case = (
+            bull_case = (
+                f"Bull case for {state.ticker}: Strong quant composite ({state.quant_composite:.3f}), "
+                f"favorable Wasden sentiment, and positive market momentum suggest upside potential."
+            ) if bull else ""
+            bear_case = (
                 f"Bear case for {state.ticker}: Elevated volatility (std_dev={state.quant_std_dev:.3f}), "
                 f"potential macro headwinds, and valuation concerns warrant caution."
-            )
-        else:
-            from src.pipeline.debate import DebateContext
-            from src.pipeline.debate.bear_researcher import BearResearcher
-            from src.pipeline.debate.debate_llm_client import DebateLLMClient
-            from src.intelligence.wasden_watch.config import WasdenWatchSettings
-
-            settings = WasdenWatchSettings()
-            client = DebateLLMClient(settings)
-            researcher = BearResearcher(client)
-            context = DebateContext(
-                ticker=state.ticker,
-                price=state.price,
-                quant_scores=state.quant_scores,
-                wasden_verdict=state.wasden_verdict,
-                wasden_confidence=state.wasden_confidence,
-                wasden_reasoning=state.wasden_reasoning,
-                fundamentals=state.fundamentals,
-            )
-            state.bear_case = researcher.generate_initial(context)
+            ) if bear else ""
+            return bull_case, bear_case
 
-        _log_node_end(state, "bear_researcher", f"{len(state.bear_case)} chars")
-        return state
+        from src.pipeline.debate.bear_researcher import BearResearcher
+        from src.pipeline.debate.bull_researcher import BullResearcher
+        from src.pipeline.debate.debate_llm_client import DebateLLMClient
+        from src.intelligence.wasden_watch.config import WasdenWatchSettings
+
+        client = DebateLLMClient(WasdenWatchSettings())
+        context = _debate_context(state)
+        if not bear:
+            return BullResearcher(client).generate_initial(context), ""
+        if not bull:
+            return "", BearResearcher(client).generate_initial(context)
+
+        bull_future = _RESEARCH_EXECUTOR.submit(BullResearcher(client).generate_initial, context)
+        bear_case = BearResearcher(client).generate_initial(context)
+        return bull_future.result(), bear_case
 
     def _node_debate(self, state: TradingState) -> TradingState:
         """Node 5: Run debate and detect agreement."""
@@ -272,19 +309,10 @@ class DecisionPipeline:
                 "outcome": state.debate_outcome,
             }
         else:
-            from src.pipeline.debate import DebateEngine, DebateContext
+            from src.pipeline.debate import DebateEngine
 
             engine = DebateEngine()
-            context = DebateContext(
-                ticker=state.ticker,
-                price=state.price,
-                quant_scores=state.quant_scores,
-                wasden_verdict=state.wasden_verdict,
-                wasden_confidence=state.wasden_confidence,
-                wasden_reasoning=state.wasden_reasoning,
-                fundamentals=state.fundamentals,
-            )
-            transcript = engine.run_debate(context, state.pipeline_run_id)
+            transcript = engine.run_debate(_debate_context(state), state.pipeline_run_id)
             state.debate_outcome = transcript.outcome.value
             state.debate_rounds = len(transcript.rounds)
             state.debate_agreed = transcript.outcome.value == "agreement"
@@ -473,6 +501,21 @@ class DecisionPipeline:
 
 # --- Helper functions ---
 
+def _debate_context(state: TradingState) -> "DebateContext":
+    """Build the debate context shared by the researcher and debate nodes."""
+    from src.pipeline.debate import DebateContext
+
+    return DebateContext(
+        ticker=state.ticker,
+        price=state.price,
+        quant_scores=state.quant_scores,
+        wasden_verdict=state.wasden_verdict,
+        wasden_confidence=state.wasden_confidence,
+        wasden_reasoning=state.wasden_reasoning,
+        fundamentals=state.fundamentals,
+    )
+
+
 def _log_node_start(state: TradingState, node_name: str) -> None:
     """Log node start and append to journal."""
     logger.info(f"[{state.ticker}] Node: {node_name} — START")
@@ -35,7 +35,7 @@ class JuryAggregator:
             JuryResult with vote counts and decision.
         """
         if len(votes) != 10:
-            logger.warning(f"Expected 10 jury votes, got {len(votes)}")
+            logger.warning("Expected 10 jury votes, got %d", len(votes))
 
         # Count votes
         counts = Counter(v.vote for v in votes)
@@ -87,7 +87,7 @@ class JuryAggregator:
             )
 
         # No clear majority — default to HOLD
-        logger.info(f"Jury split with no majority: {dict(counts)} — defaulting to HOLD")
+        logger.info("Jury split with no majority: %s — defaulting to HOLD", dict(counts))
         return JuryResult(
             spawned=True,
             reason=f"No decisive majority (buy={buy_count}, sell={sell_count}, hold={hold_count}) — defaulting to HOLD",
@@ -34,17 +34,11 @@ class JurySpawner:
         Failed agents get one retry, then cast a HOLD vote with error reasoning.
         """
         transcript_text = _format_transcript(transcript)
-        user_prompt = JURY_USER_PROMPT.format(
-            ticker=context.ticker,
-            price=context.price,
-            transcript_text=transcript_text,
-            quant_composite=context.quant_scores.get("composite", 0.0),
-            quant_scores_section=_format_quant_scores(context.quant_scores),
-            wasden_verdict=context.wasden_verdict,
-            wasden_confidence=context.wasden_confidence,
-            fundamentals_section=_format_fundamentals(context.fundamentals),
-            vote_format=JURY_VOTE_FORMAT,
-        )
+        user_prompt = JURY_USER_PROMPT.format_map({
+            **context.prompt_vars,
+            "transcript_text": transcript_text,
+            "vote_format": JURY_VOTE_FORMAT,
+        })
 
         tasks = [
             self._run_agent(agent, user_prompt)
@@ -52,7 +46,7 @@ class JurySpawner:
         ]
 
         votes = await asyncio.gather(*tasks)
-        logger.info(f"[{ticker}] Jury complete — {len(votes)} votes collected")
+        logger.info("[%s] Jury complete — %d votes collected", ticker, len(votes))
         return list(votes)
 
     async def _run_agent(self, agent: dict, user_prompt: str) -> JuryVote:
@@ -84,9 +78,9 @@ class JurySpawner:
                 )
             except Exception as e:
                 if attempt == 0:
-                    logger.warning(f"Jury agent {agent_id} failed (attempt 1): {e}, retrying")
+                    logger.warning("Jury agent %s failed (attempt 1): %s, retrying", agent_id, e)
                     continue
-                logger.error(f"Jury agent {agent_id} failed (attempt 2): {e}, defaulting to HOLD")
+                logger.error("Jury agent %s failed (attempt 2): %s, defaulting to HOLD", agent_id, e)
                 return JuryVote(
                     agent_id=agent_id,
                     vote=JuryVoteChoice.HOLD,
@@ -113,33 +107,3 @@ def _format_transcript(transcript: DebateTranscript) -> str:
         lines.append("")
     return "\n".join(lines)
 
-
-def _format_quant_scores(scores: dict) -> str:
-    """Format quant scores dict into bullet points."""
-    if not scores:
-        return "- No quant scores available"
-    lines = []
-    for key, value in scores.items():
-        if key == "composite":
-            continue
-        if isinstance(value, bool):
-            lines.append(f"- {key}: {'Yes' if value else 'No'}")
-        elif isinstance(value, float):
-            lines.append(f"- {key}: {value:.3f}")
-        else:
-            lines.append(f"- {key}: {value}")
-    return "\n".join(lines) if lines else "- No additional scores"
-
-
-def _format_fundamentals(fundamentals: dict | None) -> str:
-    """Format optional fundamentals dict."""
-    if not fundamentals:
-        return ""
-    lines = ["## Fundamentals"]
-    for key, value in fundamentals.items():
-        if isinstance(value, float):
-            lines.append(f"- {key}: {value:.2f}")
-        else:
-            lines.append(f"- {key}: {value}")
-    lines.append("")
-    return "\n".join(lines)